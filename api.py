@@ -1,9 +1,13 @@
 # api.py – VERSION MIT /api/results-db + TFNL Ranking Endpoints
 import os
 import asyncio
+import gzip
+import hashlib
 from aiohttp import web
 import json
 
+from api_delta import DATASET_PATHS, DATASETS_BY_PATH, DeltaConflict, apply_delta, dataset_hash
+
 # =========================================================
 # GLOBAL CACHE
 # =========================================================
@@ -17,11 +21,30 @@ CACHE = {
 
 CACHE_FILE = "cache.json"
 
-API_PERFORMANCE_VERSION = "api-performance-v5-10-seasons-ready"
+# Ein File pro Datensatz, kompaktes JSON, atomar geschrieben.
+CACHE_DIR = os.getenv("API_CACHE_DIR", "api_cache").strip() or "api_cache"
+# Mehrere Updates kurz hintereinander werden zu einem Schreibvorgang zusammengefasst.
+SAVE_DEBOUNCE_SECONDS = float(os.getenv("API_SAVE_DEBOUNCE_SECONDS", "2"))
+# Max. Request-Body für Update-POSTs. Der Ergebnis-Datensatz ist seit dem
+# Results-Log ungekappt (ganze Seasons); aiohttps Default von 1 MiB würde
+# volle Pushes nach einem Neustart mit 413 ablehnen.
+CLIENT_MAX_SIZE_BYTES = int(os.getenv("API_CLIENT_MAX_SIZE_MB", "64")) * 1024 * 1024
+
+API_PERFORMANCE_VERSION = "api-performance-v6-dataset-files"
 print(f"[API] geladen: {API_PERFORMANCE_VERSION}")
 
+# Datensatz -> Content-Hash (Delta-Sync, siehe api_delta.py)
+CACHE_HASHES: dict[str, str] = {}
+# Datensatz -> Versionszähler, steigt bei jedem Update
+CACHE_VERSIONS: dict[str, int] = {}
+
 RESULTS_DB_CACHE: dict[str, list[dict]] = {}
-_RESULTS_CACHE_SIGNATURE: tuple[int, int] | None = None
+_RESULTS_CACHE_VERSION: int | None = None
+
+# Updates laufen nacheinander, damit Hash und Daten zusammenpassen.
+_UPDATE_LOCK = asyncio.Lock()
+_DIRTY_DATASETS: set[str] = set()
+_SAVE_TASK: asyncio.Task | None = None
 
 
 def ensure_cache_keys():
@@ -35,27 +58,45 @@ def ensure_cache_keys():
     CACHE.setdefault("tfnl_results", [])
 
 
-def invalidate_results_db_cache():
-    global RESULTS_DB_CACHE, _RESULTS_CACHE_SIGNATURE
-    RESULTS_DB_CACHE = {}
-    _RESULTS_CACHE_SIGNATURE = None
+def refresh_cache_hashes():
+    for dataset in DATASET_PATHS:
+        CACHE_HASHES[dataset] = dataset_hash(CACHE.get(dataset, []) or [])
+        CACHE_VERSIONS[dataset] = CACHE_VERSIONS.get(dataset, 0) + 1
 
 
-def get_results_signature(results_raw: list[dict]) -> tuple[int, int]:
-    if not results_raw:
-        return (0, 0)
-    return (len(results_raw), hash(json.dumps(results_raw, ensure_ascii=False, sort_keys=True)))
+async def store_dataset(dataset: str, items: list[dict]):
+    """
+    Übernimmt einen neuen Stand. Hashing läuft im Thread, die Zuweisung danach
+    in einem Schritt, damit GETs nie Daten und Hash verschiedener Stände sehen.
+    Gespeichert wird verzögert im Hintergrund.
+    """
+    content_hash = await asyncio.to_thread(dataset_hash, items)
+
+    CACHE[dataset] = items
+    CACHE_HASHES[dataset] = content_hash
+    CACHE_VERSIONS[dataset] = CACHE_VERSIONS.get(dataset, 0) + 1
+
+    if dataset == "results":
+        invalidate_results_db_cache()
+
+    schedule_save(dataset)
+
+
+def invalidate_results_db_cache():
+    global RESULTS_DB_CACHE, _RESULTS_CACHE_VERSION
+    RESULTS_DB_CACHE = {}
+    _RESULTS_CACHE_VERSION = None
 
 
 def get_results_db_items_for_division(division: str) -> list[dict]:
-    global _RESULTS_CACHE_SIGNATURE
+    global _RESULTS_CACHE_VERSION
 
     results_raw = CACHE.get("results", []) or []
-    signature = get_results_signature(results_raw)
+    version = CACHE_VERSIONS.get("results", 0)
 
-    if signature != _RESULTS_CACHE_SIGNATURE:
+    if version != _RESULTS_CACHE_VERSION:
         RESULTS_DB_CACHE.clear()
-        _RESULTS_CACHE_SIGNATURE = signature
+        _RESULTS_CACHE_VERSION = version
 
     if division in RESULTS_DB_CACHE:
         return RESULTS_DB_CACHE[division]
@@ -73,41 +114,117 @@ def get_results_db_items_for_division(division: str) -> list[dict]:
 # =========================================================
 # LOAD + SAVE CACHE
 # =========================================================
+def _dataset_file(dataset: str) -> str:
+    return os.path.join(CACHE_DIR, f"{dataset}.json")
+
+
 def load_cache():
-    global CACHE
-    if os.path.exists(CACHE_FILE):
+    """
+    Lädt alle Datensatz-Dateien. Fehlen sie, wird einmalig die alte cache.json
+    übernommen und im neuen Format gespeichert.
+    """
+    loaded_any = False
+
+    for dataset in DATASET_PATHS:
+        path = _dataset_file(dataset)
+
+        if not os.path.exists(path):
+            continue
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+
+            if isinstance(items, list):
+                CACHE[dataset] = items
+                loaded_any = True
+        except Exception as e:
+            print(f"[API] Fehler beim Laden von {path}: {e}")
+
+    if not loaded_any and os.path.exists(CACHE_FILE):
         try:
             with open(CACHE_FILE, "r", encoding="utf-8") as f:
                 loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    CACHE.update(loaded)
-
-                ensure_cache_keys()
-                invalidate_results_db_cache()
-
-                print(
-                    f"[API] Cache geladen "
-                    f"({len(CACHE.get('upcoming', []))} upcoming, "
-                    f"{len(CACHE.get('results', []))} results, "
-                    f"{len(CACHE.get('tfnl_season_ranking', []))} season-ranking, "
-                    f"{len(CACHE.get('tfnl_overall_ranking', []))} overall-ranking, "
-                    f"{len(CACHE.get('tfnl_results', []))} tfnl-results)"
-                )
+
+            if isinstance(loaded, dict):
+                CACHE.update(loaded)
+                _DIRTY_DATASETS.update(DATASET_PATHS)
+                print(f"[API] {CACHE_FILE} übernommen, wird als Datensatz-Dateien gespeichert")
         except Exception as e:
-            ensure_cache_keys()
             print(f"[API] Fehler beim Laden des Cache: {e}")
-    else:
-        ensure_cache_keys()
-
 
-def save_cache():
     ensure_cache_keys()
-    try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(CACHE, f, ensure_ascii=False, indent=2)
-        print("[API] Cache gespeichert")
-    except Exception as e:
-        print(f"[API] Fehler beim Speichern des Cache: {e}")
+    invalidate_results_db_cache()
+    refresh_cache_hashes()
+
+    if _DIRTY_DATASETS:
+        flush_cache()
+
+    print(
+        f"[API] Cache geladen "
+        f"({len(CACHE.get('upcoming', []))} upcoming, "
+        f"{len(CACHE.get('results', []))} results, "
+        f"{len(CACHE.get('tfnl_season_ranking', []))} season-ranking, "
+        f"{len(CACHE.get('tfnl_overall_ranking', []))} overall-ranking, "
+        f"{len(CACHE.get('tfnl_results', []))} tfnl-results)"
+    )
+
+
+def _write_dataset_file(dataset: str, items: list[dict]):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _dataset_file(dataset)
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False, separators=(",", ":"))
+
+    os.replace(tmp_path, path)
+
+
+def flush_cache():
+    """
+    Schreibt alle geänderten Datensätze sofort (synchron, z. B. beim Start).
+    """
+    for dataset in sorted(_DIRTY_DATASETS):
+        try:
+            _write_dataset_file(dataset, CACHE.get(dataset, []) or [])
+        except Exception as e:
+            print(f"[API] Fehler beim Speichern von {dataset}: {e}")
+
+    _DIRTY_DATASETS.clear()
+
+
+def schedule_save(dataset: str):
+    global _SAVE_TASK
+
+    _DIRTY_DATASETS.add(dataset)
+
+    if _SAVE_TASK is None or _SAVE_TASK.done():
+        _SAVE_TASK = asyncio.create_task(_save_dirty_datasets())
+
+
+async def _save_dirty_datasets():
+    await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+
+    while _DIRTY_DATASETS:
+        dataset = _DIRTY_DATASETS.pop()
+        # Datensätze werden nur ersetzt, nie verändert: die Referenz ist ein
+        # stabiler Snapshot, den der Thread serialisieren kann.
+        items = CACHE.get(dataset, []) or []
+
+        try:
+            await asyncio.to_thread(_write_dataset_file, dataset, items)
+            print(f"[API] {dataset} gespeichert ({len(items)} Items)")
+        except Exception as e:
+            print(f"[API] Fehler beim Speichern von {dataset}: {e}")
+
+
+async def read_json_body(request: web.Request):
+    """
+    Parst große Update-Bodies im Thread statt auf dem Event-Loop.
+    """
+    text = await request.text()
+    return await asyncio.to_thread(json.loads, text)
 
 
 # =========================================================
@@ -236,6 +353,90 @@ def normalize_items_payload(data: dict) -> list[dict]:
     return []
 
 
+# =========================================================
+# RESPONSE CACHE (vorserialisiert + ETag)
+# =========================================================
+# Jede GET-Antwort wird pro Datensatz-Stand genau einmal serialisiert
+# (und bei Bedarf einmal gzip-komprimiert). Schlüssel ist Route + Parameter,
+# gültig solange der Content-Hash des Datensatzes gleich bleibt.
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("API_RESPONSE_CACHE_MAX_ENTRIES", "256"))
+GZIP_MIN_BYTES = 1024
+
+# (Route, Parameter) -> {"version", "etag", "body", "gzip"}
+_RESPONSE_CACHE: dict[tuple, dict] = {}
+
+
+def _get_cached_body(path: str, dataset: str, params: tuple, build) -> dict:
+    key = (path, params)
+    version = CACHE_HASHES.get(dataset, "")
+    entry = _RESPONSE_CACHE.get(key)
+
+    if entry is not None and entry["version"] == version:
+        return entry
+
+    body = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    entry = {
+        "version": version,
+        "etag": '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+        "body": body,
+        "gzip": None,
+    }
+
+    _RESPONSE_CACHE.pop(key, None)
+    _RESPONSE_CACHE[key] = entry
+
+    # Älteste Einträge verwerfen (z. B. viele verschiedene limit-Werte).
+    while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+        _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+
+    return entry
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match", "")
+
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
+
+
+def cached_json_response(request: web.Request, dataset: str, params: tuple, build) -> web.Response:
+    """
+    JSON-Antwort aus dem Response-Cache. `build` liefert das Antwort-Dict und
+    wird nur nach einer Änderung des Datensatzes aufgerufen.
+    """
+    entry = _get_cached_body(request.path, dataset, params, build)
+    use_gzip = len(entry["body"]) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("Accept-Encoding", "")
+    # Die gzip-Variante hat andere Bytes und braucht daher einen eigenen starken ETag.
+    etag = entry["etag"][:-1] + '-gz"' if use_gzip else entry["etag"]
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if _etag_matches(request, etag):
+        return web.Response(status=304, headers=headers)
+
+    body = entry["body"]
+
+    if use_gzip:
+        if entry["gzip"] is None:
+            entry["gzip"] = gzip.compress(body, compresslevel=6)
+
+        body = entry["gzip"]
+        headers["Content-Encoding"] = "gzip"
+
+    return web.Response(body=body, content_type="application/json", charset="utf-8", headers=headers)
+
+
 # =========================================================
 # GET ENDPOINTS (Frontend / Matchcenter)
 # =========================================================
@@ -257,7 +458,7 @@ async def health(request):
 async def get_upcoming(request):
     ensure_cache_keys()
     limit = parse_limit(request, default=20, maximum=200)
-    return web.json_response({
+    return cached_json_response(request, "upcoming", (limit,), lambda: {
         "items": CACHE.get("upcoming", [])[:limit]
     })
 
@@ -265,7 +466,7 @@ async def get_upcoming(request):
 async def get_results(request):
     ensure_cache_keys()
     limit = parse_limit(request, default=20, maximum=200)
-    return web.json_response({
+    return cached_json_response(request, "results", (limit,), lambda: {
         "items": CACHE.get("results", [])[:limit]
     })
 
@@ -286,12 +487,13 @@ async def get_results_db(request: web.Request):
 
     limit = parse_limit(request, default=50, maximum=336)
 
-    # Neueste zuerst: nach Eintrags-Reihenfolge rückwärts,
-    # da CACHE["results"] vom Bot chronologisch gefüllt wird.
-    items = get_results_db_items_for_division(division)
-    items = items[-limit:][::-1]
+    def build():
+        # CACHE["results"] ist wie channel.history() bereits neueste zuerst
+        # (Results-Log des Bots), also einfach vorne abschneiden.
+        items = get_results_db_items_for_division(division)
+        return {"items": items[:limit]}
 
-    return web.json_response({"items": items})
+    return cached_json_response(request, "results", (division, limit), build)
 
 
 async def get_tfnl_season_ranking(request: web.Request):
@@ -301,12 +503,15 @@ async def get_tfnl_season_ranking(request: web.Request):
     """
     ensure_cache_keys()
     limit = parse_limit(request, default=5000, maximum=20000)
-    items = CACHE.get("tfnl_season_ranking", []) or []
 
-    return web.json_response({
-        "items": items[:limit],
-        "count": len(items)
-    })
+    def build():
+        items = CACHE.get("tfnl_season_ranking", []) or []
+        return {
+            "items": items[:limit],
+            "count": len(items)
+        }
+
+    return cached_json_response(request, "tfnl_season_ranking", (limit,), build)
 
 
 async def get_tfnl_overall_ranking(request: web.Request):
@@ -316,22 +521,26 @@ async def get_tfnl_overall_ranking(request: web.Request):
     """
     ensure_cache_keys()
     limit = parse_limit(request, default=5000, maximum=20000)
-    items = CACHE.get("tfnl_overall_ranking", []) or []
 
-    alltime_match_count = 0
-    for item in items:
-        try:
-            alltime_match_count = max(alltime_match_count, int(item.get("match_count_total") or 0))
-        except Exception:
-            pass
-
-    return web.json_response({
-        "items": items[:limit],
-        "count": len(items),
-        "meta": {
-            "alltime_match_count": alltime_match_count
+    def build():
+        items = CACHE.get("tfnl_overall_ranking", []) or []
+
+        alltime_match_count = 0
+        for item in items:
+            try:
+                alltime_match_count = max(alltime_match_count, int(item.get("match_count_total") or 0))
+            except Exception:
+                pass
+
+        return {
+            "items": items[:limit],
+            "count": len(items),
+            "meta": {
+                "alltime_match_count": alltime_match_count
+            }
         }
-    })
+
+    return cached_json_response(request, "tfnl_overall_ranking", (limit,), build)
 
 
 
@@ -347,18 +556,21 @@ async def get_tfnl_results(request: web.Request):
     season = str(request.query.get("season", "") or "").strip()
     mode = str(request.query.get("mode", "") or "").strip()
 
-    items = CACHE.get("tfnl_results", []) or []
+    def build():
+        items = CACHE.get("tfnl_results", []) or []
 
-    if season:
-        items = [item for item in items if str(item.get("season", "")).strip() == season]
+        if season:
+            items = [item for item in items if str(item.get("season", "")).strip() == season]
 
-    if mode and mode.upper() != "ALL":
-        items = [item for item in items if str(item.get("mode", "")).strip() == mode]
+        if mode and mode.upper() != "ALL":
+            items = [item for item in items if str(item.get("mode", "")).strip() == mode]
 
-    return web.json_response({
-        "items": items[:limit],
-        "count": len(items)
-    })
+        return {
+            "items": items[:limit],
+            "count": len(items)
+        }
+
+    return cached_json_response(request, "tfnl_results", (limit, season, mode), build)
 
 
 # =========================================================
@@ -367,12 +579,12 @@ async def get_tfnl_results(request: web.Request):
 async def update_upcoming(request):
     ensure_cache_keys()
     try:
-        data = await request.json()
+        data = await read_json_body(request)
         items = normalize_items_payload(data)
-        CACHE["upcoming"] = items
-        save_cache()
+        async with _UPDATE_LOCK:
+            await store_dataset("upcoming", items)
         print(f"[API] UPDATED upcoming: {len(items)} Items")
-        return web.json_response({"status": "ok", "count": len(items)})
+        return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES["upcoming"]})
     except Exception as e:
         print(f"[API] Fehler beim Update upcoming: {e}")
         return web.json_response({"error": str(e)}, status=500)
@@ -381,13 +593,12 @@ async def update_upcoming(request):
 async def update_results(request):
     ensure_cache_keys()
     try:
-        data = await request.json()
+        data = await read_json_body(request)
         items = normalize_items_payload(data)
-        CACHE["results"] = items
-        invalidate_results_db_cache()
-        save_cache()
+        async with _UPDATE_LOCK:
+            await store_dataset("results", items)
         print(f"[API] UPDATED results: {len(items)} Items")
-        return web.json_response({"status": "ok", "count": len(items)})
+        return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES["results"]})
     except Exception as e:
         print(f"[API] Fehler beim Update results: {e}")
         return web.json_response({"error": str(e)}, status=500)
@@ -396,17 +607,17 @@ async def update_results(request):
 async def update_tfnl_season_ranking(request):
     ensure_cache_keys()
     try:
-        data = await request.json()
+        data = await read_json_body(request)
 
         if isinstance(data, list):
             items = data
         else:
             items = normalize_items_payload(data)
 
-        CACHE["tfnl_season_ranking"] = items
-        save_cache()
+        async with _UPDATE_LOCK:
+            await store_dataset("tfnl_season_ranking", items)
         print(f"[API] UPDATED tfnl_season_ranking: {len(items)} Items")
-        return web.json_response({"status": "ok", "count": len(items)})
+        return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES["tfnl_season_ranking"]})
     except Exception as e:
         print(f"[API] Fehler beim Update tfnl_season_ranking: {e}")
         return web.json_response({"error": str(e)}, status=500)
@@ -415,17 +626,17 @@ async def update_tfnl_season_ranking(request):
 async def update_tfnl_overall_ranking(request):
     ensure_cache_keys()
     try:
-        data = await request.json()
+        data = await read_json_body(request)
 
         if isinstance(data, list):
             items = data
         else:
             items = normalize_items_payload(data)
 
-        CACHE["tfnl_overall_ranking"] = items
-        save_cache()
+        async with _UPDATE_LOCK:
+            await store_dataset("tfnl_overall_ranking", items)
         print(f"[API] UPDATED tfnl_overall_ranking: {len(items)} Items")
-        return web.json_response({"status": "ok", "count": len(items)})
+        return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES["tfnl_overall_ranking"]})
     except Exception as e:
         print(f"[API] Fehler beim Update tfnl_overall_ranking: {e}")
         return web.json_response({"error": str(e)}, status=500)
@@ -435,22 +646,73 @@ async def update_tfnl_overall_ranking(request):
 async def update_tfnl_results(request):
     ensure_cache_keys()
     try:
-        data = await request.json()
+        data = await read_json_body(request)
 
         if isinstance(data, list):
             items = data
         else:
             items = normalize_items_payload(data)
 
-        CACHE["tfnl_results"] = items
-        save_cache()
+        async with _UPDATE_LOCK:
+            await store_dataset("tfnl_results", items)
         print(f"[API] UPDATED tfnl_results: {len(items)} Items")
-        return web.json_response({"status": "ok", "count": len(items)})
+        return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES["tfnl_results"]})
     except Exception as e:
         print(f"[API] Fehler beim Update tfnl_results: {e}")
         return web.json_response({"error": str(e)}, status=500)
 
 
+async def get_update_hashes(request):
+    """
+    Route für den Bot:
+    /api/update/hashes
+
+    Content-Hashes aller Datensätze. Der Bot überspringt damit unveränderte
+    Pushes und entscheidet zwischen Delta und vollem Update.
+    """
+    ensure_cache_keys()
+    return web.json_response({"hashes": CACHE_HASHES})
+
+
+async def update_dataset_delta(request: web.Request):
+    """
+    Route:
+    POST /api/update/<datensatz>/delta
+
+    Body: {"base_hash", "hash", "upserts", "removed", "order"}
+    409, wenn der Basis-Hash nicht zum aktuellen Stand passt.
+    """
+    ensure_cache_keys()
+    dataset = DATASETS_BY_PATH.get(request.match_info.get("dataset", ""))
+
+    if dataset is None:
+        return web.json_response({"error": "unknown dataset"}, status=404)
+
+    try:
+        delta = await read_json_body(request)
+
+        if not isinstance(delta, dict):
+            return web.json_response({"error": "invalid delta"}, status=400)
+
+        async with _UPDATE_LOCK:
+            items = await asyncio.to_thread(apply_delta, dataset, CACHE.get(dataset, []) or [], delta)
+            await store_dataset(dataset, items)
+    except DeltaConflict as e:
+        return web.json_response(
+            {"error": str(e), "hash": CACHE_HASHES.get(dataset, "")},
+            status=409,
+        )
+    except Exception as e:
+        print(f"[API] Fehler beim Delta-Update {dataset}: {e}")
+        return web.json_response({"error": str(e)}, status=500)
+
+    print(
+        f"[API] DELTA {dataset}: +/~{len(delta.get('upserts') or [])} "
+        f"-{len(delta.get('removed') or [])} -> {len(items)} Items"
+    )
+    return web.json_response({"status": "ok", "count": len(items), "hash": CACHE_HASHES[dataset]})
+
+
 # =========================================================
 # START SERVER
 # =========================================================
@@ -467,10 +729,11 @@ async def start():
 
         response.headers["Access-Control-Allow-Origin"] = "*"
         response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type"
+        response.headers["Access-Control-Allow-Headers"] = "Content-Type, If-None-Match"
+        response.headers["Access-Control-Expose-Headers"] = "ETag"
         return response
 
-    app = web.Application(middlewares=[cors_middleware])
+    app = web.Application(middlewares=[cors_middleware], client_max_size=CLIENT_MAX_SIZE_BYTES)
 
     # Public GET Routes
     app.router.add_get("/health", health)
@@ -492,6 +755,10 @@ async def start():
     app.router.add_post("/api/update/tfnl-overall-ranking", update_tfnl_overall_ranking)
     app.router.add_post("/api/update/tfnl-results", update_tfnl_results)
 
+    # Delta-Sync (api_delta.py)
+    app.router.add_get("/api/update/hashes", get_update_hashes)
+    app.router.add_post("/api/update/{dataset}/delta", update_dataset_delta)
+
     port = int(os.getenv("PORT", "10000"))
     print(f"[API] STARTING on port {port}")
 
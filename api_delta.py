@@ -0,0 +1,207 @@
+# api_delta.py
+"""
+Delta-Sync zwischen Bot und Website-API.
+
+Jeder Datensatz (upcoming, results, TFNL-Rankings, TFNL-Results) hat einen
+Content-Hash. Der Bot fragt die Hashes der API ab und
+- überspringt den Push, wenn sich nichts geändert hat,
+- sendet nur hinzugefügte/geänderte/entfernte Einträge, wenn die API den
+  zuletzt gesendeten Stand hat,
+- fällt sonst auf den vollen POST zurück (z. B. nach API-Neustart).
+
+Dieses Modul wird von api.py (Server) und vom Bot (Client) genutzt und enthält
+bewusst nur Standardbibliothek.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+
+# Der volle POST trägt den kompletten Datensatz (z. B. alle Results) und
+# braucht deutlich länger als ein Delta.
+FULL_PUSH_TIMEOUT_SECONDS = int(os.getenv("API_FULL_PUSH_TIMEOUT_SECONDS", "120"))
+
+
+# Datensatz -> Felder, die einen Eintrag eindeutig identifizieren
+DATASET_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "upcoming": ("id",),
+    "results": ("id",),
+    "tfnl_results": ("id",),
+    "tfnl_season_ranking": ("player_id", "season", "mode", "scope"),
+    "tfnl_overall_ranking": ("player_id", "season", "mode", "scope"),
+}
+
+# Datensatz -> Pfad-Segment der Update-Routen (/api/update/<pfad>)
+DATASET_PATHS: dict[str, str] = {
+    "upcoming": "upcoming",
+    "results": "results",
+    "tfnl_season_ranking": "tfnl-season-ranking",
+    "tfnl_overall_ranking": "tfnl-overall-ranking",
+    "tfnl_results": "tfnl-results",
+}
+
+DATASETS_BY_PATH = {path: dataset for dataset, path in DATASET_PATHS.items()}
+
+
+class DeltaConflict(Exception):
+    """Delta passt nicht zum Stand der API. Client sendet dann voll."""
+
+
+def _canonical_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def dataset_hash(items: list[dict]) -> str:
+    return hashlib.sha256(_canonical_json(items).encode("utf-8")).hexdigest()
+
+
+def item_key(dataset: str, item: dict) -> str:
+    return "|".join(str(item.get(field, "")) for field in DATASET_KEY_FIELDS[dataset])
+
+
+def build_delta(dataset: str, old_items: list[dict], new_items: list[dict]) -> dict[str, Any]:
+    """
+    upserts: neue oder geänderte Einträge
+    removed: Keys entfernter Einträge
+    order:   Key-Reihenfolge, nur wenn sie sich geändert hat
+    """
+    old_by_key = {item_key(dataset, item): item for item in old_items}
+    new_keys = [item_key(dataset, item) for item in new_items]
+    new_key_set = set(new_keys)
+
+    upserts = [
+        item
+        for key, item in zip(new_keys, new_items)
+        if _canonical_json(old_by_key.get(key)) != _canonical_json(item)
+    ]
+    removed = [key for key in old_by_key if key not in new_key_set]
+
+    old_keys = [item_key(dataset, item) for item in old_items]
+
+    return {
+        "base_hash": dataset_hash(old_items),
+        "hash": dataset_hash(new_items),
+        "upserts": upserts,
+        "removed": removed,
+        "order": new_keys if new_keys != old_keys else None,
+    }
+
+
+def apply_delta(dataset: str, items: list[dict], delta: dict[str, Any]) -> list[dict]:
+    """
+    Wendet ein Delta auf den aktuellen Stand an. Wirft DeltaConflict, wenn der
+    Basis-Hash nicht passt oder das Ergebnis nicht dem Ziel-Hash entspricht.
+    """
+    if delta.get("base_hash") != dataset_hash(items):
+        raise DeltaConflict("Basis-Hash passt nicht.")
+
+    by_key = {item_key(dataset, item): item for item in items}
+
+    for key in delta.get("removed") or []:
+        by_key.pop(str(key), None)
+
+    for item in delta.get("upserts") or []:
+        if isinstance(item, dict):
+            by_key[item_key(dataset, item)] = item
+
+    order = delta.get("order")
+
+    if order is None:
+        order = [item_key(dataset, item) for item in items]
+
+    try:
+        result = [by_key[str(key)] for key in order]
+    except KeyError as exc:
+        raise DeltaConflict(f"Unbekannter Key in order: {exc}")
+
+    if dataset_hash(result) != delta.get("hash"):
+        raise DeltaConflict("Ziel-Hash passt nicht.")
+
+    return result
+
+
+# =========================================================
+# CLIENT (BOT -> API)
+# =========================================================
+
+# Datensatz -> zuletzt erfolgreich gesendeter Stand (Hash, Items)
+_LAST_PUSHED: dict[str, tuple[str, list[dict]]] = {}
+
+
+async def fetch_remote_hashes(session, api_base: str, timeout_seconds: int = 5) -> dict[str, str]:
+    """
+    Hashes der API. Leeres Dict bei Fehlern (ältere API-Version): dann wird voll gesendet.
+    """
+    try:
+        async with session.get(f"{api_base}/api/update/hashes", timeout=timeout_seconds) as response:
+            if response.status != 200:
+                return {}
+
+            data = await response.json(content_type=None)
+    except Exception as exc:
+        print(f"[SYNC] Hashes der API nicht abrufbar: {exc}")
+        return {}
+
+    hashes = data.get("hashes") if isinstance(data, dict) else None
+    return hashes if isinstance(hashes, dict) else {}
+
+
+async def push_dataset(
+    session,
+    api_base: str,
+    dataset: str,
+    items: list[dict],
+    remote_hashes: dict[str, str],
+    timeout_seconds: int = 15,
+    full_timeout_seconds: int | None = None,
+) -> tuple[str, int, str]:
+    """
+    Sendet einen Datensatz so sparsam wie möglich.
+
+    timeout_seconds gilt für den Delta-POST, full_timeout_seconds für den
+    vollen POST (Standard: FULL_PUSH_TIMEOUT_SECONDS, mindestens timeout_seconds).
+
+    Rückgabe: (Art, HTTP-Status, Antworttext)
+    Art ist "unchanged" (kein Request, Status 304), "delta" oder "full".
+    """
+    if full_timeout_seconds is None:
+        full_timeout_seconds = max(timeout_seconds, FULL_PUSH_TIMEOUT_SECONDS)
+
+    new_hash = dataset_hash(items)
+    remote_hash = remote_hashes.get(dataset)
+    base_url = f"{api_base}/api/update/{DATASET_PATHS[dataset]}"
+
+    if remote_hash == new_hash:
+        _LAST_PUSHED[dataset] = (new_hash, items)
+        return "unchanged", 304, ""
+
+    last = _LAST_PUSHED.get(dataset)
+
+    if last is not None and remote_hash and last[0] == remote_hash:
+        delta = build_delta(dataset, last[1], items)
+
+        async with session.post(f"{base_url}/delta", json=delta, timeout=timeout_seconds) as response:
+            text = await response.text()
+
+            if 200 <= response.status < 300:
+                _LAST_PUSHED[dataset] = (new_hash, items)
+                return "delta", response.status, text[:500]
+
+        # 409 o. Ä.: Stand der API unbekannt -> voll senden.
+        print(f"[SYNC] Delta {dataset} abgelehnt ({response.status}), sende voll.")
+
+    async with session.post(base_url, json={"items": items}, timeout=full_timeout_seconds) as response:
+        text = await response.text()
+
+        if 200 <= response.status < 300:
+            _LAST_PUSHED[dataset] = (new_hash, items)
+
+        return "full", response.status, text[:500]
+
+
+def is_push_ok(status: int | None) -> bool:
+    return status is not None and (200 <= status < 300 or status == 304)
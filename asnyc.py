@@ -4,17 +4,19 @@ import re
 from datetime import datetime as dt
 
 import discord
-import gspread
 from discord import app_commands
 from discord.ext import commands
-from oauth2client.service_account import ServiceAccountCredentials
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     acell_cached,
     get_all_values_cached,
+    row_cells,
     row_values_cached,
     sheet_write_call,
+    worksheet_cache_name,
 )
+from sheets_client import get_spreadsheet, get_worksheet
 
 from matchcenter import (
     write_league_result,
@@ -79,12 +81,6 @@ ASNYC_SHEET_CACHE_TTL_SECONDS = int(os.getenv("ASNYC_SHEET_CACHE_TTL_SECONDS", "
 ASNYC_SEED_CACHE_TTL_SECONDS = int(os.getenv("ASNYC_SEED_CACHE_TTL_SECONDS", "30"))
 ASNYC_SIGNUP_CACHE_TTL_SECONDS = int(os.getenv("ASNYC_SIGNUP_CACHE_TTL_SECONDS", "120"))
 
-_GSPREAD_CLIENT_CACHE = None
-_SPREADSHEET_CACHE: dict[str, gspread.Spreadsheet] = {}
-_WORKSHEET_CACHE_BY_KEY: dict[tuple[str, str], gspread.Worksheet] = {}
-_WORKSHEET_CACHE_BY_GID: dict[tuple[str, int], gspread.Worksheet] = {}
-
-
 # =========================================================
 # HILFSFUNKTIONEN
 # =========================================================
@@ -176,63 +172,22 @@ async def try_send_dm(member: discord.Member | discord.User | None, text: str):
 # =========================================================
 
 
-def get_gspread_client():
-    global _GSPREAD_CLIENT_CACHE
-
-    if _GSPREAD_CLIENT_CACHE is not None:
-        return _GSPREAD_CLIENT_CACHE
-
-    scope = [
-        "https://spreadsheets.google.com/feeds",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, scope)
-    _GSPREAD_CLIENT_CACHE = gspread.authorize(creds)
-    return _GSPREAD_CLIENT_CACHE
-
-
-def get_spreadsheet(spreadsheet_id: str):
-    if spreadsheet_id in _SPREADSHEET_CACHE:
-        return _SPREADSHEET_CACHE[spreadsheet_id]
-
-    client = get_gspread_client()
-    spreadsheet = client.open_by_key(spreadsheet_id)
-    _SPREADSHEET_CACHE[spreadsheet_id] = spreadsheet
-    return spreadsheet
-
-
 def get_cached_worksheet_by_name(spreadsheet_id: str, worksheet_name: str):
-    cache_key = (spreadsheet_id, worksheet_name)
-
-    if cache_key in _WORKSHEET_CACHE_BY_KEY:
-        return _WORKSHEET_CACHE_BY_KEY[cache_key]
-
-    spreadsheet = get_spreadsheet(spreadsheet_id)
-    ws = spreadsheet.worksheet(worksheet_name)
-    _WORKSHEET_CACHE_BY_KEY[cache_key] = ws
-    return ws
+    spreadsheet = get_spreadsheet(spreadsheet_id, CREDS_FILE)
+    return get_worksheet(spreadsheet, worksheet_name)
 
 
 def get_cached_worksheet_by_gid(spreadsheet_id: str, worksheet_gid: int):
-    cache_key = (spreadsheet_id, int(worksheet_gid))
-
-    if cache_key in _WORKSHEET_CACHE_BY_GID:
-        return _WORKSHEET_CACHE_BY_GID[cache_key]
+    spreadsheet = get_spreadsheet(spreadsheet_id, CREDS_FILE)
 
-    spreadsheet = get_spreadsheet(spreadsheet_id)
-
-    for ws in spreadsheet.worksheets():
-        _WORKSHEET_CACHE_BY_GID[(spreadsheet_id, int(ws.id))] = ws
-        _WORKSHEET_CACHE_BY_KEY[(spreadsheet_id, ws.title)] = ws
-
-    if cache_key in _WORKSHEET_CACHE_BY_GID:
-        return _WORKSHEET_CACHE_BY_GID[cache_key]
-
-    raise RuntimeError(f"Worksheet mit gid/id {worksheet_gid} nicht gefunden.")
+    try:
+        return get_worksheet(spreadsheet, gid=int(worksheet_gid))
+    except WorksheetNotFound:
+        raise RuntimeError(f"Worksheet mit gid/id {worksheet_gid} nicht gefunden.")
 
 
 def get_sheet_cache_name(ws, fallback: str) -> str:
-    return getattr(ws, "title", fallback)
+    return worksheet_cache_name(ws, fallback)
 
 
 def invalidate_prefixes_for_ws(ws, fallback: str) -> list[str]:
@@ -350,6 +305,8 @@ def get_or_create_runner_row(ws, runner_name: str):
     sheet_write_call(
         lambda: ws.update(f"B{free_row}", [[runner_name]]),
         invalidate_prefixes=invalidate_prefixes_for_ws(ws, QUALI_SHEET_NAME),
+        patch_sheet=get_sheet_cache_name(ws, QUALI_SHEET_NAME),
+        patch_rows={free_row: row_cells(2, [runner_name])},
     )
     return free_row
 
@@ -396,11 +353,15 @@ def write_quali_result(ws, runner_name: str, quali_number: int, async_value: str
         sheet_write_call(
             lambda: ws.update(f"D{row_idx}:E{row_idx}", [[async_value, race_time]]),
             invalidate_prefixes=invalidate_prefixes_for_ws(ws, QUALI_SHEET_NAME),
+            patch_sheet=get_sheet_cache_name(ws, QUALI_SHEET_NAME),
+            patch_rows={row_idx: row_cells(4, [async_value, race_time])},
         )
     elif quali_number == 2:
         sheet_write_call(
             lambda: ws.update(f"F{row_idx}:G{row_idx}", [[async_value, race_time]]),
             invalidate_prefixes=invalidate_prefixes_for_ws(ws, QUALI_SHEET_NAME),
+            patch_sheet=get_sheet_cache_name(ws, QUALI_SHEET_NAME),
+            patch_rows={row_idx: row_cells(6, [async_value, race_time])},
         )
     else:
         raise ValueError("Ungültige Quali-Nummer.")
@@ -532,11 +493,15 @@ def write_async_runner_result(ws, sheet_row: int, side: int, vod_link: str, fina
         sheet_write_call(
             lambda: ws.update(f"D{sheet_row}:E{sheet_row}", [[vod_link, final_time]]),
             invalidate_prefixes=invalidate_prefixes_for_ws(ws, "Async"),
+            patch_sheet=get_sheet_cache_name(ws, "Async"),
+            patch_rows={sheet_row: row_cells(4, [vod_link, final_time])},
         )
     elif side == 2:
         sheet_write_call(
             lambda: ws.update(f"G{sheet_row}:H{sheet_row}", [[vod_link, final_time]]),
             invalidate_prefixes=invalidate_prefixes_for_ws(ws, "Async"),
+            patch_sheet=get_sheet_cache_name(ws, "Async"),
+            patch_rows={sheet_row: row_cells(7, [vod_link, final_time])},
         )
     else:
         raise ValueError("Ungültige Seite.")
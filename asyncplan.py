@@ -3,17 +3,17 @@ import asyncio
 from datetime import datetime
 
 import discord
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     col_values_cached,
-    get_all_values_cached,
     sheet_write_call,
+    worksheet_cache_name,
 )
+from sheets_client import get_spreadsheet, get_worksheet
+from division_data import get_division_snapshot
 
 from matchcenter import (
-    get_div_ws_from_label,
     _cell,
     DIV_COL_LEFT,
     DIV_COL_MARKER,
@@ -29,18 +29,11 @@ ASYNC_SPREADSHEET_ID = "1TnKRQM8x2mLHfiaNC_dtlnjazJ5Ph5hz2edixM0Jhw8"
 ASYNC_WORKSHEET_GID = 539808866
 
 CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
 
 ASYNCPLAN_PERFORMANCE_VERSION = "asyncplan-admin-request-v2"
 print(f"[ASYNCPLAN] geladen: {ASYNCPLAN_PERFORMANCE_VERSION}")
-ASYNCPLAN_SHEET_CACHE_TTL_SECONDS = int(os.getenv("ASYNCPLAN_SHEET_CACHE_TTL_SECONDS", "90"))
 ASYNCPLAN_ASYNC_COL_CACHE_TTL_SECONDS = int(os.getenv("ASYNCPLAN_ASYNC_COL_CACHE_TTL_SECONDS", "30"))
 
-_GSPREAD_CLIENT_CACHE = None
-_SPREADSHEET_CACHE = None
 _ASYNC_WORKSHEET_CACHE = None
 
 
@@ -56,26 +49,8 @@ def menu_embed(title: str, description: str) -> discord.Embed:
 # GOOGLE SHEETS
 # =========================================================
 
-def get_gspread_client() -> gspread.Client:
-    global _GSPREAD_CLIENT_CACHE
-
-    if _GSPREAD_CLIENT_CACHE is not None:
-        return _GSPREAD_CLIENT_CACHE
-
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    _GSPREAD_CLIENT_CACHE = gspread.authorize(creds)
-    return _GSPREAD_CLIENT_CACHE
-
-
 def get_async_spreadsheet():
-    global _SPREADSHEET_CACHE
-
-    if _SPREADSHEET_CACHE is not None:
-        return _SPREADSHEET_CACHE
-
-    client = get_gspread_client()
-    _SPREADSHEET_CACHE = client.open_by_key(ASYNC_SPREADSHEET_ID)
-    return _SPREADSHEET_CACHE
+    return get_spreadsheet(ASYNC_SPREADSHEET_ID, CREDS_FILE)
 
 
 def get_async_worksheet():
@@ -84,17 +59,16 @@ def get_async_worksheet():
     if _ASYNC_WORKSHEET_CACHE is not None:
         return _ASYNC_WORKSHEET_CACHE
 
-    spreadsheet = get_async_spreadsheet()
-    for ws in spreadsheet.worksheets():
-        if int(ws.id) == int(ASYNC_WORKSHEET_GID):
-            _ASYNC_WORKSHEET_CACHE = ws
-            return _ASYNC_WORKSHEET_CACHE
+    try:
+        _ASYNC_WORKSHEET_CACHE = get_worksheet(get_async_spreadsheet(), gid=ASYNC_WORKSHEET_GID)
+    except WorksheetNotFound:
+        raise RuntimeError(f"Worksheet mit gid/id {ASYNC_WORKSHEET_GID} nicht gefunden.")
 
-    raise RuntimeError(f"Worksheet mit gid/id {ASYNC_WORKSHEET_GID} nicht gefunden.")
+    return _ASYNC_WORKSHEET_CACHE
 
 
 def sheet_cache_name(ws, fallback: str = "AsyncPlan") -> str:
-    return getattr(ws, "title", fallback)
+    return worksheet_cache_name(ws, fallback)
 
 
 def invalidate_prefixes_for_ws(ws, fallback: str = "AsyncPlan") -> list[str]:
@@ -108,14 +82,6 @@ def invalidate_prefixes_for_ws(ws, fallback: str = "AsyncPlan") -> list[str]:
     ]
 
 
-def get_cached_sheet_values(ws, fallback: str = "AsyncPlan", ttl_seconds: int = ASYNCPLAN_SHEET_CACHE_TTL_SECONDS):
-    return get_all_values_cached(
-        lambda: ws,
-        sheet_name=sheet_cache_name(ws, fallback),
-        ttl_seconds=ttl_seconds,
-    )
-
-
 def append_async_row(
     home_player: str,
     guest_player: str,
@@ -208,10 +174,11 @@ def collect_requestable_matches(name_candidates: list[str] | None = None) -> lis
 
     out: list[dict] = []
 
-    # League
+    # League: alle DIV-Tabs aus einem gemeinsamen Batch-Read.
+    division_snapshot = get_division_snapshot()
+
     for division_label in [f"Div {i}" for i in range(1, 7)]:
-        ws = get_div_ws_from_label(division_label)
-        rows = get_cached_sheet_values(ws, division_label)
+        rows = division_snapshot.rows(division_label.split()[-1])
 
         for idx, row in enumerate(rows, start=1):
             if idx == 1:
@@ -0,0 +1,118 @@
+# bench_elo_replay.py
+"""
+Benchmark: ELO-Replay Match für Match vs. Batch-Replay.
+
+Erzeugt synthetische Matches über mehrere Seasons (1on1 und 3way), rechnet
+beide Varianten, prüft Ergebnisgleichheit (Ratings + History-Zeilen) und
+gibt die Laufzeiten aus. Kein Google-Sheets-Zugriff.
+
+Aufruf:
+    python bench_elo_replay.py [matches] [spieler] [seasons]
+"""
+
+import random
+import sys
+import time
+
+from ladder_elo_sheets import (
+    build_rating_sheet_rows,
+    placement_from_result,
+    replay_match_elo,
+    replay_matches_batch,
+    score_from_result,
+)
+
+
+MODES = ["Open", "Casual Boots", "Keysanity", "Inverted"]
+RESULT_SETS_1ON1 = [("Sieg", "Niederlage"), ("Niederlage", "Sieg"), ("Remis", "Remis")]
+RESULT_SET_3WAY = ("Sieg", "Remis", "Niederlage")
+
+
+def build_synthetic_matches(match_count: int, player_count: int, season_count: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    player_ids = [str(100000000000000000 + index) for index in range(player_count)]
+    matches = []
+
+    for index in range(match_count):
+        season = f"TFNL-S{1 + index * season_count // match_count}"
+        is_3way = rng.random() < 0.2
+        ids = rng.sample(player_ids, 3 if is_3way else 2)
+        results = list(RESULT_SET_3WAY) if is_3way else list(rng.choice(RESULT_SETS_1ON1))
+
+        if is_3way:
+            rng.shuffle(results)
+
+        matches.append(
+            {
+                "match_id": f"{season}-M{index}",
+                "slot_id": f"{season}-SLOT-{index // 8}",
+                "race_type": "3way" if is_3way else "1on1",
+                "season": season,
+                "mode": rng.choice(MODES),
+                "date_text": "01.01.2025",
+                "players": [
+                    {
+                        "no": no,
+                        "player_id": player_id,
+                        "name": f"Spieler {player_id[-4:]}",
+                        "result_type": result_type,
+                        "score": score_from_result(result_type),
+                        "placement": placement_from_result(result_type),
+                    }
+                    for no, (player_id, result_type) in enumerate(zip(ids, results), start=1)
+                ],
+            }
+        )
+
+    return matches
+
+
+def run_sequential(matches: list[dict], created_at: str):
+    ratings: dict = {}
+    history_rows: list[list] = []
+
+    for match in matches:
+        history_rows.extend(replay_match_elo(ratings, match, created_at))
+
+    return ratings, history_rows
+
+
+def main():
+    match_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    player_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    season_count = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    created_at = "01.01.2025 00:00:00"
+
+    matches = build_synthetic_matches(match_count, player_count, season_count)
+
+    started = time.perf_counter()
+    sequential_ratings, sequential_history = run_sequential(matches, created_at)
+    sequential_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch_ratings, batch_history, _ = replay_matches_batch(matches, created_at)
+    batch_seconds = time.perf_counter() - started
+
+    same_history = sequential_history == batch_history
+    same_ratings = (
+        build_rating_sheet_rows(sequential_ratings, created_at)
+        == build_rating_sheet_rows(batch_ratings, created_at)
+    )
+    same_elo = all(
+        sequential_ratings[key]["elo"] == batch_ratings[key]["elo"]
+        for key in sequential_ratings
+    ) and sequential_ratings.keys() == batch_ratings.keys()
+
+    print(f"Matches: {match_count} | Spieler: {player_count} | Seasons: {season_count}")
+    print(f"History-Zeilen: {len(batch_history)} | Rating-Keys: {len(batch_ratings)}")
+    print(f"Match für Match: {sequential_seconds:.3f}s")
+    print(f"Batch:           {batch_seconds:.3f}s")
+    print(f"Speedup:         {sequential_seconds / batch_seconds:.2f}x")
+    print(f"Identisch:       History={same_history} Ratings={same_ratings} Elo(exakt)={same_elo}")
+
+    if not (same_history and same_ratings and same_elo):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
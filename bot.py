@@ -7,7 +7,6 @@ import sys
 import traceback
 from datetime import datetime as dt, timedelta
 
-import aiohttp
 import discord
 import gspread
 import pytz
@@ -15,13 +14,18 @@ from aiohttp import web
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
-from oauth2client.service_account import ServiceAccountCredentials
 
 from sheet_guard import (
     col_values_cached,
+    flush_pending_writes_async,
     get_all_values_cached,
     sheet_write_call,
+    shutdown_sheet_executor,
 )
+from sheets_client import get_gspread_client, get_spreadsheet_by_title, get_worksheet
+from api_delta import FULL_PUSH_TIMEOUT_SECONDS, fetch_remote_hashes, push_dataset
+from http_client import close_http_session, get_http_session
+from results_log import RESULTS_LOG
 from tfnl_ranking_api_sync import publish_tfnl_rankings_to_api
 
 print("🔍 DEBUG: bot.py wurde geladen")
@@ -56,7 +60,6 @@ API_BASE = os.getenv("TFL_API_BASE", "https://tfl-discord-api.onrender.com")
 print("DEBUG CREDS_FILE =", CREDS_FILE)
 
 BERLIN_TZ = pytz.timezone("Europe/Berlin")
-SCOPE = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
 
 BOT_SHEET_CACHE_TTL_SECONDS = int(os.getenv("BOT_SHEET_CACHE_TTL_SECONDS", "90"))
 BOT_PLAYER_CACHE_TTL_SECONDS = int(os.getenv("BOT_PLAYER_CACHE_TTL_SECONDS", "120"))
@@ -141,6 +144,22 @@ class TFLBot(commands.Bot):
         for cmd in synced:
             print(f" - /{cmd.name}")
 
+    async def close(self):
+        # super().close() entlädt Extensions und Cogs (cog_unload) zuerst.
+        await super().close()
+
+        try:
+            await flush_pending_writes_async()
+        except Exception as e:
+            print(f"[BOT] Ausstehende Sheet-Writes beim Beenden nicht geschrieben: {repr(e)}")
+
+        try:
+            await close_http_session()
+        except Exception as e:
+            print(f"[BOT] HTTP-Session konnte nicht geschlossen werden: {repr(e)}")
+
+        shutdown_sheet_executor(wait=False)
+
 
 client = TFLBot(command_prefix="!", intents=intents)
 tree = client.tree
@@ -155,9 +174,8 @@ WB = None
 _WORKSHEET_CACHE_BY_NAME: dict[str, gspread.Worksheet] = {}
 
 try:
-    CREDS = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    GC = gspread.authorize(CREDS)
-    WB = GC.open(SPREADSHEET_TITLE)
+    GC = get_gspread_client(CREDS_FILE)
+    WB = get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
     print("✅ Google Sheets verbunden (ohne Master-Tab)")
 except Exception as e:
     SHEETS_ENABLED = False
@@ -177,7 +195,7 @@ def get_div_ws(div_number: str):
     if sheet_name in _WORKSHEET_CACHE_BY_NAME:
         return _WORKSHEET_CACHE_BY_NAME[sheet_name]
 
-    ws = WB.worksheet(sheet_name)
+    ws = get_worksheet(WB, sheet_name)
     _WORKSHEET_CACHE_BY_NAME[sheet_name] = ws
     return ws
 
@@ -315,7 +333,8 @@ _webapp_runner: web.AppRunner | None = None
 
 _API_CACHE = {
     "upcoming": {"ts": None, "data": []},
-    "results": {"ts": None, "data": []},
+    # Ergebnisse kommen aus dem persistierten Results-Log (results_log.py).
+    "results": {"ts": None, "data": RESULTS_LOG.items()},
 }
 
 _RESULTS_DB_CACHE: dict[str, list[dict]] = {}
@@ -909,23 +928,20 @@ async def refresh_api_cache(_client):
             ch = _client.get_channel(RESULTS_CHANNEL_ID)
 
             if isinstance(ch, (discord.TextChannel, discord.Thread, discord.VoiceChannel)):
+                # Nur Nachrichten nach dem Cursor lesen. Ohne Cursor (erster
+                # Start) wird der komplette Channel einmal nachgeladen.
+                after = discord.Object(id=RESULTS_LOG.cursor) if RESULTS_LOG.cursor else None
                 new_results = []
 
-                async for m in ch.history(limit=400):
-                    new_results.append({
-                        "id": m.id,
-                        "author": str(m.author),
-                        "time": m.created_at.astimezone(BERLIN_TZ).isoformat(),
-                        "content": m.content,
-                        "jump_url": m.jump_url,
-                    })
+                async for m in ch.history(limit=None, after=after, oldest_first=True):
+                    new_results.append(_result_message_item(m))
 
-                if new_results:
-                    _API_CACHE["results"]["ts"] = now
-                    _API_CACHE["results"]["data"] = new_results
-                    print(f"[CACHE] Results aktualisiert ({len(new_results)} Einträge)")
-                else:
-                    print("[CACHE] Results NICHT aktualisiert (0 Einträge)")
+                changed = RESULTS_LOG.upsert_many(new_results)
+                _API_CACHE["results"]["ts"] = now
+                _API_CACHE["results"]["data"] = RESULTS_LOG.items()
+
+                if changed:
+                    print(f"[CACHE] Results aktualisiert (+{changed}, {len(RESULTS_LOG.items())} Einträge)")
             else:
                 print("[CACHE] Ergebnischannel nicht gefunden oder falscher Typ")
 
@@ -941,34 +957,80 @@ async def refresh_api_cache(_client):
         await asyncio.sleep(300)
 
 
-async def push_updates_to_api():
-    async with aiohttp.ClientSession() as session:
-        try:
-            payload_upcoming = {"items": _API_CACHE["upcoming"]["data"]}
-            async with session.post(
-                f"{API_BASE}/api/update/upcoming",
-                json=payload_upcoming,
-                timeout=5,
-            ) as r:
-                print("[PUSH] upcoming ->", r.status)
+def _result_message_item(m: discord.Message) -> dict:
+    return {
+        "id": m.id,
+        "author": str(m.author),
+        "time": m.created_at.astimezone(BERLIN_TZ).isoformat(),
+        "content": m.content,
+        "jump_url": m.jump_url,
+    }
+
+
+@client.event
+async def on_raw_message_edit(payload: discord.RawMessageUpdateEvent):
+    if payload.channel_id != RESULTS_CHANNEL_ID:
+        return
+
+    content = payload.data.get("content")
+
+    # Embed-only Updates enthalten keinen Content.
+    if content is None:
+        return
+
+    if RESULTS_LOG.update_content(payload.message_id, content):
+        _API_CACHE["results"]["data"] = RESULTS_LOG.items()
+        print(f"[CACHE] Result {payload.message_id} bearbeitet")
+
+
+@client.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    if payload.channel_id != RESULTS_CHANNEL_ID:
+        return
+
+    if RESULTS_LOG.delete_many([payload.message_id]):
+        _API_CACHE["results"]["data"] = RESULTS_LOG.items()
+        print(f"[CACHE] Result {payload.message_id} gelöscht")
+
+
+@client.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent):
+    if payload.channel_id != RESULTS_CHANNEL_ID:
+        return
+
+    deleted = RESULTS_LOG.delete_many(payload.message_ids)
+
+    if deleted:
+        _API_CACHE["results"]["data"] = RESULTS_LOG.items()
+        print(f"[CACHE] {deleted} Results gelöscht (Bulk)")
 
-        except Exception as e:
-            print("[PUSH] Fehler upcoming:", e)
 
+async def push_updates_to_api():
+    session = get_http_session()
+    # Unveränderte Datensätze werden übersprungen, sonst nur Deltas gesendet.
+    remote_hashes = await fetch_remote_hashes(session, API_BASE)
+
+    for dataset in ("upcoming", "results"):
         try:
-            payload_results = {"items": _API_CACHE["results"]["data"]}
-            async with session.post(
-                f"{API_BASE}/api/update/results",
-                json=payload_results,
-                timeout=5,
-            ) as r:
-                print("[PUSH] results ->", r.status)
+            kind, status, _ = await push_dataset(
+                session,
+                API_BASE,
+                dataset,
+                _API_CACHE[dataset]["data"],
+                remote_hashes,
+                timeout_seconds=5,
+                full_timeout_seconds=FULL_PUSH_TIMEOUT_SECONDS,
+            )
+            print(f"[PUSH] {dataset} -> {status} ({kind})")
 
         except Exception as e:
-            print("[PUSH] Fehler results:", e)
+            print(f"[PUSH] Fehler {dataset}:", e)
 
     try:
-        ranking_result = await publish_tfnl_rankings_to_api(api_base=API_BASE)
+        ranking_result = await publish_tfnl_rankings_to_api(
+            api_base=API_BASE,
+            remote_hashes=remote_hashes,
+        )
 
         print(
             "[PUSH] tfnl frontend -> "
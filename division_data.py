@@ -0,0 +1,128 @@
+# division_data.py
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable
+
+from gspread.exceptions import WorksheetNotFound
+
+from sheet_guard import get_all_values_batch_cached
+from sheets_client import get_spreadsheet_by_title, get_worksheet
+
+
+# =========================================================
+# DIVISION DATA
+# =========================================================
+# Gemeinsamer Lesezugriff auf die Tabs 1.DIV bis 6.DIV.
+# Statt pro Division einzeln get_all_values/col_values zu holen, werden alle
+# fehlenden Tabs mit einem einzigen values_batch_get gelesen. Die Werte liegen
+# unter denselben sheet_guard-Keys (values:<n>.DIV) wie die Einzel-Reads in
+# restinfo/streichinfo, Invalidierungen nach Writes greifen also weiter.
+# Solange sich keiner der sechs Snapshots ändert, bleibt auch der
+# DivisionSnapshot dasselbe Objekt; abgeleitete Indizes werden pro Version
+# genau einmal gebaut und von restinfo, streichinfo und player geteilt.
+
+DIVISION_DATA_VERSION = "division-data-batch-v1"
+print(f"[DIVISION_DATA] geladen: {DIVISION_DATA_VERSION}")
+
+CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
+SPREADSHEET_TITLE = os.getenv("SPREADSHEET_TITLE", "Season #4 - Spielbetrieb")
+
+DIVISION_DATA_CACHE_TTL_SECONDS = int(os.getenv("DIVISION_DATA_CACHE_TTL_SECONDS", "120"))
+
+DIVISION_NUMBERS = ("1", "2", "3", "4", "5", "6")
+
+_LOCK = threading.Lock()
+_SNAPSHOT: DivisionSnapshot | None = None
+
+
+def division_sheet_name(div_number) -> str:
+    return f"{int(div_number)}.DIV"
+
+
+def get_division_workbook():
+    return get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
+
+
+class DivisionSnapshot:
+    def __init__(self, version: int, values_by_div: dict[str, Any]):
+        self.version = version
+        # Division ("1".."6") -> Werte wie get_all_values; fehlende Tabs fehlen.
+        self.values_by_div = values_by_div
+        self._indexes: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def divisions(self) -> list[str]:
+        return [div_number for div_number in DIVISION_NUMBERS if div_number in self.values_by_div]
+
+    def rows(self, div_number) -> list[list[str]]:
+        return self.values_by_div.get(str(int(div_number)), [])
+
+    def index(self, name: str, builder: Callable[[DivisionSnapshot], Any]):
+        """
+        Abgeleiteter Index, einmal pro Snapshot-Version gebaut.
+        Die Rückgabe ist geteilt und darf nicht verändert werden.
+        """
+        with self._lock:
+            if name in self._indexes:
+                return self._indexes[name]
+
+        # Bauen außerhalb des Locks. Parallel gebaute Indizes sind identisch.
+        value = builder(self)
+
+        with self._lock:
+            return self._indexes.setdefault(name, value)
+
+
+def _existing_division_sheet_names(workbook) -> list[str]:
+    # Ein fehlendes Tab würde den ganzen Batch-Read scheitern lassen.
+    sheet_names = []
+
+    for div_number in DIVISION_NUMBERS:
+        sheet_name = division_sheet_name(div_number)
+
+        try:
+            get_worksheet(workbook, sheet_name)
+        except WorksheetNotFound:
+            continue
+
+        sheet_names.append(sheet_name)
+
+    return sheet_names
+
+
+def get_division_snapshot(force_refresh: bool = False) -> DivisionSnapshot:
+    """
+    Aktueller Stand aller Division-Tabs, höchstens ein Sheets-Request.
+    """
+    global _SNAPSHOT
+
+    workbook = get_division_workbook()
+    sheet_names = _existing_division_sheet_names(workbook)
+    values_by_sheet = get_all_values_batch_cached(
+        lambda: workbook,
+        sheet_names=sheet_names,
+        ttl_seconds=DIVISION_DATA_CACHE_TTL_SECONDS,
+        force_refresh=force_refresh,
+    )
+    values_by_div = {
+        sheet_name.split(".", 1)[0]: values
+        for sheet_name, values in values_by_sheet.items()
+    }
+
+    with _LOCK:
+        current = _SNAPSHOT
+
+        if (
+            current is not None
+            and current.values_by_div.keys() == values_by_div.keys()
+            and all(current.values_by_div[div] is values for div, values in values_by_div.items())
+        ):
+            return current
+
+        _SNAPSHOT = DivisionSnapshot(
+            version=(current.version + 1) if current is not None else 1,
+            values_by_div=values_by_div,
+        )
+        return _SNAPSHOT
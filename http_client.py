@@ -0,0 +1,217 @@
+# http_client.py
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable
+
+import aiohttp
+
+
+# =========================================================
+# GEMEINSAME AIOHTTP-SESSION + PRESET-CACHE
+# =========================================================
+# Eine Session pro Event-Loop für die gesamte Bot-Laufzeit: Keep-Alive,
+# Connection-Pool und DNS-Cache statt neuem Handshake pro Request.
+# Dazu ein Cache für Dateien wie SahasrahBot-Presets: im Speicher (geparst)
+# und auf Disk (Rohtext + ETag/Last-Modified). Nach Ablauf der TTL wird per
+# Conditional GET geprüft, 304 kostet keinen erneuten Download.
+
+HTTP_CLIENT_VERSION = "http-client-shared-v1"
+print(f"[HTTP_CLIENT] geladen: {HTTP_CLIENT_VERSION}")
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default)).strip()))
+    except ValueError:
+        return default
+
+
+HTTP_POOL_LIMIT = _env_int("HTTP_CLIENT_POOL_LIMIT", 20, minimum=1)
+HTTP_DNS_CACHE_SECONDS = _env_int("HTTP_CLIENT_DNS_CACHE_SECONDS", 300)
+HTTP_KEEPALIVE_SECONDS = _env_int("HTTP_CLIENT_KEEPALIVE_SECONDS", 60, minimum=1)
+
+# Innerhalb der TTL wird ein gecachtes Preset ohne Request verwendet.
+FILE_CACHE_TTL_SECONDS = _env_int("HTTP_FILE_CACHE_TTL_SECONDS", 3600)
+# Leer = nur im Speicher.
+FILE_CACHE_PATH = os.getenv("HTTP_FILE_CACHE_PATH", "http_file_cache.json").strip()
+
+_SESSIONS: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+_FILE_CACHE_LOCK = threading.Lock()
+# Key -> {"url", "text", "etag", "last_modified", "fetched_at"}
+_FILE_CACHE: dict[str, dict[str, Any]] = {}
+# Key -> (Rohtext, geparster Wert); Parsing nur einmal pro Textstand.
+_PARSED_CACHE: dict[str, tuple[str, Any]] = {}
+_FILE_CACHE_LOADED = False
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Gemeinsame Session des laufenden Event-Loops. Nicht mit `async with`
+    schließen, sondern nur `async with session.get(...)` verwenden.
+    """
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+
+    if session is not None and not session.closed:
+        return session
+
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+    )
+    session = aiohttp.ClientSession(connector=connector)
+    _SESSIONS[loop] = session
+    return session
+
+
+async def close_http_session():
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.pop(loop, None)
+
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# =========================================================
+# FILE CACHE (CONDITIONAL GET)
+# =========================================================
+
+def _load_file_cache():
+    global _FILE_CACHE_LOADED
+
+    if _FILE_CACHE_LOADED:
+        return
+
+    _FILE_CACHE_LOADED = True
+
+    if not FILE_CACHE_PATH or not os.path.exists(FILE_CACHE_PATH):
+        return
+
+    try:
+        with open(FILE_CACHE_PATH, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except Exception as exc:
+        print(f"[HTTP_CLIENT] Datei-Cache konnte nicht gelesen werden: {repr(exc)}")
+        return
+
+    if isinstance(data, dict):
+        _FILE_CACHE.update({key: value for key, value in data.items() if isinstance(value, dict)})
+
+
+def _save_file_cache():
+    if not FILE_CACHE_PATH:
+        return
+
+    directory = os.path.dirname(os.path.abspath(FILE_CACHE_PATH))
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".http_file_cache_", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(_FILE_CACHE, handle, ensure_ascii=False)
+        os.replace(tmp_path, FILE_CACHE_PATH)
+    except Exception as exc:
+        print(f"[HTTP_CLIENT] Datei-Cache konnte nicht geschrieben werden: {repr(exc)}")
+
+
+def _parsed(key: str, text: str, parse: Callable[[str], Any]):
+    cached = _PARSED_CACHE.get(key)
+
+    if cached is not None and cached[0] is text:
+        return cached[1]
+
+    value = parse(text)
+    _PARSED_CACHE[key] = (text, value)
+    return value
+
+
+async def fetch_cached(
+    url: str,
+    parse: Callable[[str], Any] = lambda text: text,
+    *,
+    key: str | None = None,
+    ttl_seconds: int = FILE_CACHE_TTL_SECONDS,
+    timeout: int = 30,
+):
+    """
+    Lädt eine Datei über die gemeinsame Session und cached sie unter `key`
+    (Standard: URL). Rückgabe ist der geparste Wert.
+
+    - innerhalb der TTL: kein Request
+    - danach: Conditional GET mit If-None-Match / If-Modified-Since
+    - Netzwerkfehler mit vorhandenem Cache: veralteter Stand wird genutzt
+
+    Der Parser läuft nur bei neuem Inhalt. Wirft er, wird nichts gecacht.
+    """
+    cache_key = key or url
+
+    with _FILE_CACHE_LOCK:
+        _load_file_cache()
+        entry = _FILE_CACHE.get(cache_key)
+
+    if entry is not None and entry.get("url") != url:
+        entry = None
+
+    if entry is not None and time.time() - float(entry.get("fetched_at") or 0) < ttl_seconds:
+        return _parsed(cache_key, entry["text"], parse)
+
+    headers = {}
+
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        async with get_http_session().get(url, headers=headers, timeout=timeout) as response:
+            if response.status == 304 and entry is not None:
+                entry = dict(entry, fetched_at=time.time())
+
+            elif response.status != 200:
+                raise RuntimeError(f"Download fehlgeschlagen: HTTP {response.status} | {url}")
+
+            else:
+                text = await response.text()
+                # Erst parsen, dann cachen: ungültige Dateien landen nicht im Cache.
+                value = parse(text)
+                _PARSED_CACHE[cache_key] = (text, value)
+                entry = {
+                    "url": url,
+                    "text": text,
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                    "fetched_at": time.time(),
+                }
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        if entry is None:
+            raise
+
+        print(f"[HTTP_CLIENT] {url} nicht erreichbar, nutze Cache: {repr(exc)}")
+        return _parsed(cache_key, entry["text"], parse)
+
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[cache_key] = entry
+        _save_file_cache()
+
+    return _parsed(cache_key, entry["text"], parse)
+
+
+def forget_cached(key: str | None = None):
+    with _FILE_CACHE_LOCK:
+        if key is None:
+            _FILE_CACHE.clear()
+            _PARSED_CACHE.clear()
+        else:
+            _FILE_CACHE.pop(key, None)
+            _PARSED_CACHE.pop(key, None)
+
+        _save_file_cache()
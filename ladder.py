@@ -1,5 +1,8 @@
 import os
 import re
+import heapq
+import hashlib
+import json
 import random
 import asyncio
 import time
@@ -8,25 +11,40 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from urllib.parse import quote
 
-import aiohttp
 import discord
 import gspread
 import pyz3r
 import yaml
 from discord import app_commands
 from discord.ext import commands, tasks
-from oauth2client.service_account import ServiceAccountCredentials
 
 from sheet_guard import (
+    flush_pending_writes_async,
     get_all_records_cached,
+    get_all_records_cached_async,
     get_all_values_cached,
+    has_warm_persisted_cache,
+    queue_cell_updates,
+    row_cells,
     row_values_cached,
+    run_in_sheet_executor,
+    set_sheet_ttl_policy,
+    set_write_failure_handler,
     sheet_write_call,
+    thaw_snapshot,
     invalidate_cache as invalidate_global_sheet_cache,
     should_log_quota_warning,
     seconds_until_quota_retry,
+    sheet_priority,
+    PRIORITY_ADMIN,
+    PRIORITY_BACKGROUND,
+    PRIORITY_RACE,
 )
 from ladder_elo import create_elo_pairings
+from ladder_store import LADDER_STORE
+from ladder_seed_pool import SEED_POOL
+from http_client import fetch_cached, get_http_session
+from sheets_client import get_spreadsheet, get_worksheet, register_worksheet
 from ladder_elo_sheets import (
     SCOPE_SEASON_OVERALL,
     SCOPE_SEASON_MODE,
@@ -36,6 +54,7 @@ from ladder_elo_sheets import (
     build_pairing_players,
     process_match_elo,
     rebuild_elo_from_matches,
+    update_elo_incremental,
     build_standings_rows as build_elo_standings_rows,
     get_match_elo_changes,
     get_slot_elo_changes,
@@ -90,6 +109,17 @@ TFNL_RESULTS_CHANNEL_CLEANUP_HOUR = int(
     os.getenv("TFNL_RESULTS_CHANNEL_CLEANUP_HOUR", "3").strip()
 )
 
+# Einzel-Löschungen (Nachrichten älter als 14 Tage, kein Bulk möglich) werden
+# mit dieser Pause getaktet, damit das globale Rate-Limit nicht leerläuft.
+TFNL_RESULTS_PURGE_SINGLE_DELETE_DELAY_SECONDS = float(
+    os.getenv("TFNL_RESULTS_PURGE_SINGLE_DELETE_DELAY_SECONDS", "0.5").strip()
+)
+
+# Discord erlaubt Bulk-Delete nur für Nachrichten jünger als 14 Tage.
+# Etwas Puffer, damit Nachrichten an der Grenze nicht den ganzen Batch scheitern lassen.
+DISCORD_BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=10)
+DISCORD_BULK_DELETE_BATCH_SIZE = 100
+
 TFNL_RESULTS_CHANNEL_INFO_MESSAGE = os.getenv(
     "TFNL_RESULTS_CHANNEL_INFO_MESSAGE",
     (
@@ -109,6 +139,14 @@ TFNL_LOOP_INTERVAL_SECONDS = int(
     os.getenv("TFNL_LOOP_INTERVAL_SECONDS", "10").strip()
 )
 
+# Der Slot-Prozess schläft bis zum nächsten fälligen Übergang. Spätestens nach
+# diesem Intervall wird der Schedule erneut gelesen (Cache) und bei Änderungen
+# neu geplant. Laufende Slots werden in diesem Takt auf Abschluss geprüft.
+TFNL_SLOT_REPLAN_SECONDS = max(
+    5,
+    int(os.getenv("TFNL_SLOT_REPLAN_SECONDS", "60").strip()),
+)
+
 TFNL_STARTUP_STAGGER_SECONDS = int(
     os.getenv("TFNL_STARTUP_STAGGER_SECONDS", "45").strip()
 )
@@ -134,6 +172,23 @@ TFNL_FF_PENALTY_POINTS = int(
     os.getenv("TFNL_FF_PENALTY_POINTS", "2").strip()
 )
 
+# Seed-Pool: Seeds für Slots der nächsten N Stunden werden vorab erzeugt.
+# 0 = Pool aus, Seeds werden wie bisher erst zum Seed-Zeitpunkt erzeugt.
+TFNL_SEED_POOL_HORIZON_HOURS = int(
+    os.getenv("TFNL_SEED_POOL_HORIZON_HOURS", "6").strip()
+)
+
+TFNL_SEED_POOL_INTERVAL_MINUTES = max(
+    1,
+    int(os.getenv("TFNL_SEED_POOL_INTERVAL_MINUTES", "10").strip()),
+)
+
+# Offline-/Testbetrieb: Seeds lokal simulieren statt ALTTPR/AvianART aufzurufen.
+TFNL_SEED_STUB_GENERATOR = (
+    os.getenv("TFNL_SEED_STUB_GENERATOR", "0").strip().lower()
+    in ("1", "true", "yes", "ja", "on")
+)
+
 SCHEDULE_SHEET_NAME = "Schedule"
 SIGNUP_SHEET_NAME = "Signup"
 MATCHES_SHEET_NAME = "Matches"
@@ -225,11 +280,6 @@ SETTINGS_HEADERS = [
     "Value",
 ]
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 HEADER_CACHE = {}
 WORKSHEET_CACHE = {}
 SPREADSHEET_CACHE = None
@@ -242,6 +292,13 @@ SHEET_READ_CACHE_TTL_SECONDS = int(
     os.getenv("TFNL_SHEET_CACHE_TTL_SECONDS", "300").strip()
 )
 
+# Stale-While-Revalidate: Nach Ablauf des Read-TTL werden diese Sheets noch
+# bis zum Stale-TTL sofort aus dem Cache bedient und im Hintergrund neu geladen.
+# Matches bewusst nicht: Finish/Forfeit-Prüfungen brauchen harte Frische.
+SHEET_STALE_CACHE_TTL_SECONDS = int(
+    os.getenv("TFNL_SHEET_STALE_TTL_SECONDS", "1800").strip()
+)
+
 TFNL_TRANSIENT_ERROR_BACKOFF_SECONDS = int(
     os.getenv("TFNL_TRANSIENT_ERROR_BACKOFF_SECONDS", "30").strip()
 )
@@ -412,6 +469,19 @@ TFNL_MODE_ALIASES = {
 }
 
 
+for _stale_sheet_name in (
+    SCHEDULE_SHEET_NAME,
+    SIGNUP_SHEET_NAME,
+    PLAYERS_SHEET_NAME,
+    SETTINGS_SHEET_NAME,
+    ARCHIVE_SCHEDULE_SHEET_NAME,
+    ARCHIVE_SIGNUP_SHEET_NAME,
+    ARCHIVE_MATCHES_SHEET_NAME,
+    ARCHIVE_PLAYERS_SHEET_NAME,
+):
+    set_sheet_ttl_policy(_stale_sheet_name, hard_ttl_seconds=SHEET_STALE_CACHE_TTL_SECONDS)
+
+
 print("DEBUG TFNL_SPREADSHEET_ID =", repr(TFNL_SPREADSHEET_ID))
 print("DEBUG TFNL CREDS_FILE =", repr(CREDS_FILE))
 print("DEBUG TFNL_SCHEDULE_CHANNEL_ID =", TFNL_SCHEDULE_CHANNEL_ID)
@@ -436,9 +506,7 @@ def get_tfnl_spreadsheet():
     if SPREADSHEET_CACHE is not None:
         return SPREADSHEET_CACHE
 
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    client = gspread.authorize(creds)
-    SPREADSHEET_CACHE = client.open_by_key(TFNL_SPREADSHEET_ID)
+    SPREADSHEET_CACHE = get_spreadsheet(TFNL_SPREADSHEET_ID, CREDS_FILE)
     return SPREADSHEET_CACHE
 
 
@@ -466,6 +534,7 @@ def ensure_header_column(sheet, sheet_name: str, column_name: str):
             ],
         )
 
+        headers = thaw_snapshot(headers)
         headers.append(column_name)
         HEADER_CACHE[sheet_name] = headers
 
@@ -482,9 +551,10 @@ def get_or_create_worksheet(
         return cached_sheet
 
     try:
-        sheet = spreadsheet.worksheet(title)
+        sheet = get_worksheet(spreadsheet, title)
     except gspread.WorksheetNotFound:
         sheet = spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+        register_worksheet(sheet)
 
     existing_headers = row_values_cached(
         lambda: sheet,
@@ -583,7 +653,7 @@ def get_schedule_sheet():
         return cached_sheet
 
     spreadsheet = get_tfnl_spreadsheet()
-    sheet = spreadsheet.worksheet(SCHEDULE_SHEET_NAME)
+    sheet = get_worksheet(spreadsheet, SCHEDULE_SHEET_NAME)
 
     ensure_header_column(sheet, SCHEDULE_SHEET_NAME, SCHEDULE_ANNOUNCEMENT_COL)
     ensure_header_column(sheet, SCHEDULE_SHEET_NAME, SCHEDULE_COMPLETED_AT_COL)
@@ -738,7 +808,7 @@ def load_archive_rows_for_source(source_sheet_name: str, force_refresh: bool = F
     if archive_sheet is None:
         try:
             spreadsheet = get_tfnl_spreadsheet()
-            archive_sheet = spreadsheet.worksheet(archive_name)
+            archive_sheet = get_worksheet(spreadsheet, archive_name)
             WORKSHEET_CACHE[archive_name] = archive_sheet
         except gspread.WorksheetNotFound:
             return []
@@ -859,93 +929,137 @@ def append_matches(match_rows: list[list]):
     )
 
 def find_schedule_row(slot_id: str, force_refresh: bool = False):
-    for row_index, row in load_schedule_rows_with_index(force_refresh=force_refresh):
-        if normalize_text(row.get("Slot ID")) == slot_id:
-            return row_index, row
-
-    return None, None
+    rows = load_schedule_rows_all(force_refresh=force_refresh)
+    index = LADDER_STORE.schedule_by_slot(rows, get_active_season())
+    return index.get(slot_id, (None, None))
 
 
 def find_match_row(match_id: str):
-    for row_index, row in load_matches_rows_with_index():
-        if normalize_text(row.get("Match ID")) == match_id:
-            return row_index, row
+    index = LADDER_STORE.matches_by_id(load_matches_rows_all(), get_active_season())
+    return index.get(match_id, (None, None))
 
-    return None, None
 
+# =========================================================
+# ASYNC SHEET HELPERS
+# =========================================================
+# Für Coroutinen im LadderCog. Reads laufen über die async-API von sheet_guard,
+# alle übrigen synchronen Sheet-Helper (Writes, Scans) werden per run_sheet_io()
+# im begrenzten Sheet-Executor ausgeführt, damit Quota-Backoff und
+# Google-Roundtrips den Event-Loop nicht blockieren.
 
-def update_schedule_cell(slot_id: str, column_name: str, value: str):
-    sheet = get_schedule_sheet()
-    row_index, _ = find_schedule_row(slot_id)
+def startup_stagger_seconds(offset_seconds: int) -> int:
+    """
+    Startverzögerung der Task-Loops. Mit warm geladenem Persistenz-Cache
+    (sheet_guard) entfällt sie, die Loops lesen dann aus dem Cache.
+    """
+    if has_warm_persisted_cache():
+        return 0
 
-    if not row_index:
-        return
+    return TFNL_STARTUP_STAGGER_SECONDS + offset_seconds
 
-    col_index = get_header_index(sheet, SCHEDULE_SHEET_NAME, column_name)
 
-    if not col_index:
-        return
+async def run_sheet_io(func, *args, **kwargs):
+    return await run_in_sheet_executor(func, *args, **kwargs)
 
-    sheet_write_call(
-        lambda: sheet.update_cell(row_index, col_index, value),
-        invalidate_prefixes=[
-            f"records:{SCHEDULE_SHEET_NAME}",
-            f"values:{SCHEDULE_SHEET_NAME}",
-            f"row:{SCHEDULE_SHEET_NAME}:",
-            f"cell:{SCHEDULE_SHEET_NAME}:",
-        ],
+
+async def get_active_season_async() -> str:
+    return await run_sheet_io(get_active_season)
+
+
+async def load_schedule_rows_all_async(force_refresh: bool = False):
+    return await get_all_records_cached_async(
+        get_schedule_sheet,
+        sheet_name=SCHEDULE_SHEET_NAME,
+        ttl_seconds=SHEET_READ_CACHE_TTL_SECONDS,
+        force_refresh=force_refresh,
+    )
+
+
+async def load_matches_rows_all_async(force_refresh: bool = False):
+    return await get_all_records_cached_async(
+        get_matches_sheet,
+        sheet_name=MATCHES_SHEET_NAME,
+        ttl_seconds=SHEET_READ_CACHE_TTL_SECONDS,
+        force_refresh=force_refresh,
     )
 
+
+async def load_schedule_rows_with_index_async(force_refresh: bool = False):
+    selected_season = await get_active_season_async()
+    rows = await load_schedule_rows_all_async(force_refresh=force_refresh)
+    return [
+        (index, row)
+        for index, row in enumerate(rows, start=2)
+        if row_matches_season(row, selected_season)
+    ]
+
+
+async def load_matches_rows_with_index_async(force_refresh: bool = False):
+    selected_season = await get_active_season_async()
+    rows = await load_matches_rows_all_async(force_refresh=force_refresh)
+    return [
+        (index, row)
+        for index, row in enumerate(rows, start=2)
+        if row_matches_season(row, selected_season)
+    ]
+
+
+async def load_matches_rows_async(force_refresh: bool = False):
+    return [row for _, row in await load_matches_rows_with_index_async(force_refresh=force_refresh)]
+
+
+async def find_schedule_row_async(slot_id: str, force_refresh: bool = False):
+    selected_season = await get_active_season_async()
+    rows = await load_schedule_rows_all_async(force_refresh=force_refresh)
+    index = LADDER_STORE.schedule_by_slot(rows, selected_season)
+    return index.get(slot_id, (None, None))
+
+
+async def find_match_row_async(match_id: str):
+    selected_season = await get_active_season_async()
+    rows = await load_matches_rows_all_async()
+    index = LADDER_STORE.matches_by_id(rows, selected_season)
+    return index.get(match_id, (None, None))
+
+
+def update_schedule_cell(slot_id: str, column_name: str, value: str):
+    update_schedule_cells(slot_id, {column_name: value})
+
 def update_schedule_cells(slot_id: str, values: dict[str, str]):
-    sheet = get_schedule_sheet()
     row_index, _ = find_schedule_row(slot_id)
 
     if not row_index:
         return
 
-    requests = []
+    queue_row_cells(get_schedule_sheet, SCHEDULE_SHEET_NAME, row_index, values)
+
+def update_schedule_cell_by_row(row_index: int, column_name: str, value: str):
+    queue_row_cells(get_schedule_sheet, SCHEDULE_SHEET_NAME, row_index, {column_name: value})
+
+def queue_row_cells(sheet_getter, sheet_name: str, row_index: int, values: dict[str, str]):
+    """
+    Reiht Zellupdates für eine Zeile im Write-Behind-Puffer von sheet_guard ein.
+    Der Cache ist sofort aktuell, das Sheet wird gebündelt per batch_update geschrieben.
+    """
+    sheet = sheet_getter()
+    cells = []
 
     for column_name, value in values.items():
-        col_index = get_header_index(sheet, SCHEDULE_SHEET_NAME, column_name)
+        col_index = get_header_index(sheet, sheet_name, column_name)
 
         if not col_index:
             continue
 
-        requests.append(
-            {
-                "range": gspread.utils.rowcol_to_a1(row_index, col_index),
-                "values": [[value]],
-            }
-        )
+        cells.append((col_index, column_name, value))
 
-    if requests:
-        sheet_write_call(
-            lambda: sheet.batch_update(requests, value_input_option="USER_ENTERED"),
-            invalidate_prefixes=[
-                f"records:{SCHEDULE_SHEET_NAME}",
-                f"values:{SCHEDULE_SHEET_NAME}",
-                f"row:{SCHEDULE_SHEET_NAME}:",
-                f"cell:{SCHEDULE_SHEET_NAME}:",
-            ],
+    if cells:
+        queue_cell_updates(
+            sheet_getter,
+            sheet_name=sheet_name,
+            row_index=row_index,
+            cells=cells,
         )
 
-def update_schedule_cell_by_row(row_index: int, column_name: str, value: str):
-    sheet = get_schedule_sheet()
-    col_index = get_header_index(sheet, SCHEDULE_SHEET_NAME, column_name)
-
-    if not col_index:
-        return
-
-    sheet_write_call(
-        lambda: sheet.update_cell(row_index, col_index, value),
-        invalidate_prefixes=[
-            f"records:{SCHEDULE_SHEET_NAME}",
-            f"values:{SCHEDULE_SHEET_NAME}",
-            f"row:{SCHEDULE_SHEET_NAME}:",
-            f"cell:{SCHEDULE_SHEET_NAME}:",
-        ],
-    )
-
 def normalize_slot_id_part(value: str) -> str:
     value = normalize_text(value).upper()
     value = re.sub(r"[^A-Z0-9]+", "-", value)
@@ -1014,37 +1128,12 @@ def update_match_cell(match_id: str, column_name: str, value: str):
 
 
 def update_match_cells(match_id: str, values: dict[str, str]):
-    sheet = get_matches_sheet()
     row_index, _ = find_match_row(match_id)
 
     if not row_index:
         return
 
-    requests = []
-
-    for column_name, value in values.items():
-        col_index = get_header_index(sheet, MATCHES_SHEET_NAME, column_name)
-
-        if not col_index:
-            continue
-
-        requests.append(
-            {
-                "range": gspread.utils.rowcol_to_a1(row_index, col_index),
-                "values": [[value]],
-            }
-        )
-
-    if requests:
-        sheet_write_call(
-            lambda: sheet.batch_update(requests, value_input_option="USER_ENTERED"),
-            invalidate_prefixes=[
-                f"records:{MATCHES_SHEET_NAME}",
-                f"values:{MATCHES_SHEET_NAME}",
-                f"row:{MATCHES_SHEET_NAME}:",
-                f"cell:{MATCHES_SHEET_NAME}:",
-            ],
-        )
+    queue_row_cells(get_matches_sheet, MATCHES_SHEET_NAME, row_index, values)
 
 def update_schedule_status(slot_id: str, status: str):
     update_schedule_cell(slot_id, "Status", status)
@@ -1254,6 +1343,126 @@ def is_cancelled_channel_delete_due(row: dict) -> bool:
     return datetime.now(BERLIN_TZ) >= cancelled_at + timedelta(minutes=15)
 
 
+REGISTRATION_OPEN_SKIP_STATUSES = (
+    "registration_open",
+    "paired",
+    "seed_sent",
+    "countdown_sent",
+    "running",
+    "completed",
+)
+
+
+def get_next_slot_transition_dt(row: dict, now: datetime | None = None):
+    """
+    Nächster Zeitpunkt, ab dem für diese Zeile ein Schritt in
+    process_schedule_states fällig wird (gleiche Regeln wie die is_*_due-Checks).
+    None = kein zeitgesteuerter Übergang mehr.
+    """
+    now = now or datetime.now(BERLIN_TZ)
+    status = normalize_text(row.get("Status")).lower()
+
+    if status == "archived":
+        return None
+
+    if status in ("completed", "cancelled"):
+        finished_at = parse_completed_at(row.get(SCHEDULE_COMPLETED_AT_COL))
+        if not finished_at:
+            return None
+        return finished_at + timedelta(minutes=15 if status == "cancelled" else 60)
+
+    start = get_slot_start_dt(row)
+
+    if status == "paired":
+        return start - timedelta(minutes=5) if start else None
+
+    if status == "seed_sent":
+        return start - timedelta(seconds=90) if start else None
+
+    if status == "countdown_sent":
+        return start
+
+    if status == "running":
+        # Abschluss kommt normalerweise über Finish-Klicks. Der Takt ist nur Fallback.
+        fallback = now + timedelta(seconds=TFNL_SLOT_REPLAN_SECONDS)
+        end = get_slot_end_dt(row)
+        return min(end, fallback) if end else fallback
+
+    candidates = []
+    registration_start = build_datetime(row.get("Datum"), row.get("Anmeldebeginn"))
+    registration_end = build_datetime(row.get("Datum"), row.get("Anmeldeschluss"))
+
+    # Nur solange die Anmeldung noch geöffnet werden muss. Ein bereits
+    # erreichter Beginn bleibt drin, dann ist die Zeile sofort fällig.
+    if (
+        status not in REGISTRATION_OPEN_SKIP_STATUSES
+        and registration_start
+        and registration_end
+        and now < registration_end
+    ):
+        candidates.append(registration_start)
+
+    if status in ("planned", "registration_open", "") and registration_end:
+        candidates.append(registration_end)
+
+    return min(candidates) if candidates else None
+
+
+class SlotTransitionPlan:
+    """
+    Timer-Heap über die Schedule-Zeilen der aktiven Season.
+
+    Pro Zeile wird der nächste fällige Übergang eingeplant. Neu geplant wird
+    nur, wenn sich der Schedule-Snapshot ändert (sheet_guard liefert dann neue
+    Zeilenobjekte), ansonsten werden nur die fälligen Zeilen geprüft.
+    """
+
+    def __init__(self):
+        self.rows: list[dict] = []
+        self.heap: list[tuple[float, int]] = []
+
+    def is_current(self, rows: list[dict]) -> bool:
+        return len(rows) == len(self.rows) and all(
+            row is planned for row, planned in zip(rows, self.rows)
+        )
+
+    def rebuild(self, rows: list[dict], now: datetime):
+        self.rows = list(rows)
+        self.heap = []
+
+        for position, row in enumerate(self.rows):
+            self.schedule(position, now)
+
+    def schedule(self, position: int, now: datetime, not_before: float | None = None):
+        due = get_next_slot_transition_dt(self.rows[position], now)
+
+        if due is None:
+            return
+
+        due_ts = due.timestamp()
+
+        if not_before is not None:
+            due_ts = max(due_ts, not_before)
+
+        heapq.heappush(self.heap, (due_ts, position))
+
+    def pop_due(self, now: datetime) -> list[int]:
+        now_ts = now.timestamp()
+        positions = []
+
+        while self.heap and self.heap[0][0] <= now_ts:
+            _, position = heapq.heappop(self.heap)
+            if position not in positions:
+                positions.append(position)
+
+        return sorted(positions)
+
+    def seconds_until_next(self, now: datetime) -> float | None:
+        if not self.heap:
+            return None
+        return max(0.0, self.heap[0][0] - now.timestamp())
+
+
 def seconds_to_timecode(seconds: int) -> str:
     seconds = max(0, int(seconds))
     hours = seconds // 3600
@@ -1351,21 +1560,27 @@ def build_avianart_perm_url(permalink_hash: str) -> str:
     return f"{AVIANART_PERM_BASE_URL}/{permalink_hash}"
 
 
-async def fetch_yaml_url(url: str) -> dict:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=30) as response:
-            if response.status != 200:
-                raise RuntimeError(
-                    f"Preset konnte nicht geladen werden: HTTP {response.status} | {url}"
-                )
+def parse_preset_yaml(text: str) -> dict:
+    data = yaml.safe_load(text)
+
+    if not isinstance(data, dict):
+        raise RuntimeError("Preset YAML ist ungültig.")
+
+    return data
 
-            text = await response.text()
-            data = yaml.safe_load(text)
 
-            if not isinstance(data, dict):
-                raise RuntimeError(f"Preset YAML ist ungültig: {url}")
+async def fetch_yaml_url(url: str, cache_key: str | None = None) -> dict:
+    """
+    Lädt ein Preset-YAML über die gemeinsame HTTP-Session. Geparste Presets
+    werden pro Preset-Key gecacht und per ETag/Last-Modified revalidiert.
+    Rückgabe ist eine Kopie, Aufrufer dürfen sie verändern.
+    """
+    try:
+        data = await fetch_cached(url, parse_preset_yaml, key=cache_key, timeout=30)
+    except RuntimeError as e:
+        raise RuntimeError(f"Preset konnte nicht geladen werden: {e} | {url}") from e
 
-            return data
+    return deepcopy(data)
 
 
 def ensure_list_value(values, required_value: str) -> list:
@@ -1657,26 +1872,25 @@ async def generate_avianart_seed_for_mode(mode_name: str, preset_key: str) -> tu
     generate_url = build_avianart_generate_url(avianart_preset)
     payload = [{"args": {"race": True}}]
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            generate_url,
-            json=payload,
-            timeout=90,
-            headers={"Content-Type": "application/json"},
-        ) as response:
-            response_text = await response.text()
-
-            if response.status != 200:
-                raise RuntimeError(
-                    f"AvianART Seed-Erzeugung fehlgeschlagen: HTTP {response.status} | {response_text[:800]}"
-                )
+    async with get_http_session().post(
+        generate_url,
+        json=payload,
+        timeout=90,
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        response_text = await response.text()
 
-            try:
-                data = await response.json(content_type=None)
-            except Exception as e:
-                raise RuntimeError(
-                    f"AvianART lieferte keine gültige JSON-Antwort: {repr(e)} | {response_text[:800]}"
-                )
+        if response.status != 200:
+            raise RuntimeError(
+                f"AvianART Seed-Erzeugung fehlgeschlagen: HTTP {response.status} | {response_text[:800]}"
+            )
+
+        try:
+            data = await response.json(content_type=None)
+        except Exception as e:
+            raise RuntimeError(
+                f"AvianART lieferte keine gültige JSON-Antwort: {repr(e)} | {response_text[:800]}"
+            )
 
     response_data = unwrap_avianart_response(data)
 
@@ -1728,7 +1942,7 @@ async def generate_alttpr_seed_for_mode(mode_name: str) -> tuple[str, dict]:
         return await generate_avianart_seed_for_mode(mode_name, preset_key)
 
     preset_url = build_sahasrahbot_preset_url(preset_key)
-    preset_data = await fetch_yaml_url(preset_url)
+    preset_data = await fetch_yaml_url(preset_url, cache_key=f"preset:{preset_key}")
 
     raw_settings = preset_data.get("settings")
     customizer_enabled = bool(preset_data.get("customizer", False))
@@ -1792,6 +2006,96 @@ async def generate_alttpr_seed_for_mode(mode_name: str) -> tuple[str, dict]:
     return seed_url, diagnostics
 
 
+STUB_SEED_HASH_ITEMS = (
+    "Bow", "Boomerang", "Hookshot", "Bombs", "Mushroom", "Powder", "Ice Rod",
+    "Pendant", "Bombos", "Ether", "Quake", "Lamp", "Hammer", "Shovel",
+    "Flute", "Bugnet", "Book", "Empty Bottle", "Green Potion", "Somaria",
+    "Cape", "Mirror", "Boots", "Gloves", "Flippers", "Moon Pearl", "Shield",
+    "Tunic", "Heart", "Map", "Compass", "Big Key",
+)
+
+
+async def generate_stub_seed_for_mode(mode_name: str) -> tuple[str, dict]:
+    """
+    Lokaler Seed-Generator ohne Netzwerk (TFNL_SEED_STUB_GENERATOR=1).
+    Durchläuft dieselben Modus-Settings und Validierungen wie die echte
+    Erzeugung, liefert aber eine erkennbar ungültige Seed URL.
+    """
+    canonical_mode = get_canonical_mode_name(mode_name)
+    preset_key = get_preset_key_for_mode(canonical_mode)
+
+    if not preset_key:
+        raise RuntimeError(f"Kein Seed-Mapping für Modus `{mode_name}` gefunden.")
+
+    customizer_enabled = canonical_mode == "casual boots"
+    raw_settings = force_tfnl_mode_settings(
+        canonical_mode=canonical_mode,
+        raw_settings={},
+        customizer_enabled=customizer_enabled,
+    )
+
+    if not is_avianart_preset_key(preset_key):
+        validate_tfnl_seed_settings(
+            canonical_mode=canonical_mode,
+            preset_key=preset_key,
+            customizer_enabled=customizer_enabled,
+            raw_settings=raw_settings,
+        )
+
+    diagnostics = build_seed_diagnostics(
+        mode_name=mode_name,
+        preset_key=preset_key,
+        preset_url=f"stub:{preset_key}",
+        customizer_enabled=customizer_enabled,
+        raw_settings=raw_settings,
+    )
+    diagnostics["pyz3r_api"] = "stub"
+    diagnostics["seed_hash"] = " / ".join(random.sample(STUB_SEED_HASH_ITEMS, 5))
+
+    token = "".join(random.choices("ABCDEFGHJKLMNPQRSTUVWXYZ23456789", k=10))
+    return f"https://example.invalid/tfnl-stub/{token}", diagnostics
+
+
+async def generate_tfnl_seed_for_mode(mode_name: str) -> tuple[str, dict]:
+    if TFNL_SEED_STUB_GENERATOR:
+        return await generate_stub_seed_for_mode(mode_name)
+
+    return await generate_alttpr_seed_for_mode(mode_name)
+
+
+def build_seed_pool_demand(rows: list[dict], now: datetime | None = None) -> dict[str, int]:
+    """
+    Anzahl benötigter Seeds pro Modus für Slots, die innerhalb des
+    Pool-Horizonts starten und noch keine Seed URL haben.
+    """
+    now = now or datetime.now(BERLIN_TZ)
+    horizon = now + timedelta(hours=TFNL_SEED_POOL_HORIZON_HOURS)
+    demand: dict[str, int] = {}
+
+    for row in rows:
+        status = normalize_text(row.get("Status")).lower()
+
+        if status not in ("", "planned", "registration_open", "paired"):
+            continue
+
+        if get_seed_url(row):
+            continue
+
+        start = get_slot_start_dt(row)
+
+        if not start or not now <= start <= horizon:
+            continue
+
+        canonical_mode = get_canonical_mode_name(row.get("Modus"))
+
+        if not get_preset_key_for_mode(canonical_mode):
+            continue
+
+        demand[canonical_mode] = demand.get(canonical_mode, 0) + 1
+
+    return demand
+
+
 async def generate_alttpr_seed_from_preset(preset_key: str) -> str:
     """
     Kompatibilitätsfunktion für alte Aufrufe.
@@ -1799,7 +2103,7 @@ async def generate_alttpr_seed_from_preset(preset_key: str) -> str:
     damit modus-spezifische Validierungen greifen.
     """
     preset_url = build_sahasrahbot_preset_url(preset_key)
-    preset_data = await fetch_yaml_url(preset_url)
+    preset_data = await fetch_yaml_url(preset_url, cache_key=f"preset:{preset_key}")
 
     settings = preset_data.get("settings")
     customizer_enabled = bool(preset_data.get("customizer", False))
@@ -2293,6 +2597,108 @@ async def send_discord_message_chunks(send_callable, message: str):
         await send_callable(chunk)
 
 
+def render_fingerprint(*embeds, view=None) -> str:
+    """
+    Hash über den sichtbaren Inhalt von Embeds und View-Komponenten.
+    Footer werden ignoriert: Sie enthalten nur den Zeitstempel "Aktualisiert",
+    der sonst jede Ausgabe als geändert markieren würde.
+    """
+    payload = []
+
+    for embed in embeds:
+        data = embed.to_dict() if embed is not None else None
+
+        if data is not None:
+            data.pop("footer", None)
+            data.pop("timestamp", None)
+
+        payload.append(data)
+
+    payload.append(view.to_components() if view is not None else None)
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def message_content_hash(content: str) -> str:
+    return hashlib.sha1(normalize_text(content).encode("utf-8")).hexdigest()
+
+
+class ChannelMessageReconciler:
+    """
+    Hält eine Folge von Bot-Nachrichten in einem Channel aktuell, statt alles
+    zu löschen und neu zu posten.
+
+    Gemerkt werden pro Chunk Message-ID und Content-Hash (älteste zuerst).
+    Geänderte Chunks werden editiert, überzählige gelöscht, fehlende angehängt.
+    Nach einem Neustart (oder invalidate()) wird der Stand einmal aus der
+    Channel-History gelesen.
+    """
+
+    def __init__(self, history_limit: int = 100):
+        self.history_limit = history_limit
+        self.entries: list[tuple[int, str]] | None = None
+
+    def invalidate(self):
+        self.entries = None
+
+    async def load_from_history(self, channel, bot_user_id: int):
+        messages = [
+            message
+            async for message in channel.history(limit=self.history_limit)
+            if message.author.id == bot_user_id
+        ]
+        messages.reverse()
+        self.entries = [(message.id, message_content_hash(message.content)) for message in messages]
+
+    async def reconcile(self, channel, bot_user_id: int, chunks: list[str]) -> dict[str, int]:
+        if self.entries is None:
+            await self.load_from_history(channel, bot_user_id)
+
+        chunks = [chunk for chunk in chunks if normalize_text(chunk)]
+        old_entries = self.entries or []
+        new_entries: list[tuple[int, str]] = []
+        stats = {"unchanged": 0, "edited": 0, "sent": 0, "deleted": 0}
+        position = 0
+
+        # Bestehende Nachrichten der Reihe nach wiederverwenden.
+        while position < len(chunks) and position < len(old_entries):
+            message_id, old_hash = old_entries[position]
+            chunk = chunks[position]
+            content_hash = message_content_hash(chunk)
+
+            if old_hash == content_hash:
+                stats["unchanged"] += 1
+            else:
+                try:
+                    await channel.get_partial_message(message_id).edit(content=chunk)
+                except discord.NotFound:
+                    # Manuell gelöscht: Reihenfolge ab hier nicht mehr haltbar,
+                    # restliche Nachrichten werden ersetzt.
+                    break
+
+                stats["edited"] += 1
+
+            new_entries.append((message_id, content_hash))
+            position += 1
+
+        for message_id, _ in old_entries[position:]:
+            try:
+                await channel.get_partial_message(message_id).delete()
+                stats["deleted"] += 1
+            except discord.NotFound:
+                pass
+
+        # Zwischenstand merken, falls ein Send fehlschlägt.
+        self.entries = list(new_entries)
+
+        for chunk in chunks[position:]:
+            message = await channel.send(chunk)
+            self.entries.append((message.id, message_content_hash(chunk)))
+            stats["sent"] += 1
+
+        return stats
+
+
 def build_signup_line(row: dict) -> str:
     slot_id = normalize_text(row.get("Slot ID"))
     datum = normalize_text(row.get("Datum"))
@@ -2517,19 +2923,19 @@ def build_signup_status_embed(open_slots: list[dict]) -> discord.Embed:
 # SIGNUP / MATCH HELPERS
 # =========================================================
 
+def get_signup_rows_for_slot(slot_id: str, force_refresh: bool = False) -> tuple[dict, ...]:
+    rows = load_signup_rows_all(force_refresh=force_refresh)
+    return LADDER_STORE.signups_by_slot(rows, get_active_season()).get(slot_id, ())
+
+
 def get_signup_participants_for_slot(slot_id: str) -> list[dict]:
-    rows = load_signup_rows()
     participants = []
     seen = set()
 
-    for row in rows:
-        row_slot_id = normalize_text(row.get("Slot ID"))
+    for row in get_signup_rows_for_slot(slot_id):
         discord_id = normalize_text(row.get("Discord ID"))
         status = normalize_text(row.get("Status")).lower()
 
-        if row_slot_id != slot_id:
-            continue
-
         if status != "signed_up":
             continue
 
@@ -2549,13 +2955,9 @@ def get_signup_participants_for_slot(slot_id: str) -> list[dict]:
 
 
 def get_signup_count_for_slot(slot_id: str) -> int:
-    rows = load_signup_rows()
     signed_up_ids = set()
 
-    for row in rows:
-        if normalize_text(row.get("Slot ID")) != slot_id:
-            continue
-
+    for row in get_signup_rows_for_slot(slot_id):
         if normalize_text(row.get("Status")).lower() != "signed_up":
             continue
 
@@ -2567,14 +2969,22 @@ def get_signup_count_for_slot(slot_id: str) -> int:
     return len(signed_up_ids)
 
 
+def get_signup_counts_for_slots(slot_rows: list[dict]) -> dict[str, int]:
+    counts = {}
+
+    for row in slot_rows:
+        slot_id = normalize_text(row.get("Slot ID"))
+
+        if slot_id:
+            counts[slot_id] = get_signup_count_for_slot(slot_id)
+
+    return counts
+
+
 def get_signup_names_for_slot(slot_id: str) -> list[str]:
-    rows = load_signup_rows()
     names_by_id = {}
 
-    for row in rows:
-        if normalize_text(row.get("Slot ID")) != slot_id:
-            continue
-
+    for row in get_signup_rows_for_slot(slot_id):
         if normalize_text(row.get("Status")).lower() != "signed_up":
             continue
 
@@ -2597,12 +3007,9 @@ def format_signup_names_for_slot(slot_id: str) -> str:
 
 
 def user_already_signed_up(slot_id: str, user_id: int, force_refresh: bool = False) -> bool:
-    rows = load_signup_rows(force_refresh=force_refresh)
-
-    for row in rows:
+    for row in get_signup_rows_for_slot(slot_id, force_refresh=force_refresh):
         if (
-            normalize_text(row.get("Slot ID")) == slot_id
-            and normalize_text(row.get("Discord ID")) == str(user_id)
+            normalize_text(row.get("Discord ID")) == str(user_id)
             and normalize_text(row.get("Status")).lower() == "signed_up"
         ):
             return True
@@ -2627,27 +3034,20 @@ def cancel_signup(slot_id: str, user_id: int) -> bool:
         ):
             sheet_write_call(
                 lambda: sheet.update_cell(row_index, status_col, "cancelled"),
-                invalidate_prefixes=[
-                    f"records:{SIGNUP_SHEET_NAME}",
-                    f"values:{SIGNUP_SHEET_NAME}",
-                    f"row:{SIGNUP_SHEET_NAME}:",
-                    f"cell:{SIGNUP_SHEET_NAME}:",
-                ],
+                patch_sheet=SIGNUP_SHEET_NAME,
+                patch_rows={row_index: [(status_col, "Status", "cancelled")]},
             )
             return True
 
     return False
 
 def matches_already_created(slot_id: str) -> bool:
-    rows = load_matches_rows()
-    return any(normalize_text(row.get("Slot ID")) == slot_id for row in rows)
+    return bool(get_matches_for_slot(slot_id))
 
 
 def get_matches_for_slot(slot_id: str, force_refresh: bool = False) -> list[dict]:
-    return [
-        row for row in load_matches_rows(force_refresh=force_refresh)
-        if normalize_text(row.get("Slot ID")) == slot_id
-    ]
+    rows = load_matches_rows_all(force_refresh=force_refresh)
+    return list(LADDER_STORE.matches_by_slot(rows, get_active_season()).get(slot_id, ()))
 
 
 def get_matches_for_slot_combined(slot_id: str) -> list[dict]:
@@ -3480,11 +3880,8 @@ def update_players_from_match(match_row: dict):
 
             sheet_write_call(
                 lambda row_index=row_index, values=values: players_sheet.update(f"A{row_index}:K{row_index}", [values]),
-                invalidate_prefixes=[
-                    f"records:{PLAYERS_SHEET_NAME}",
-                    f"values:{PLAYERS_SHEET_NAME}",
-                    f"row:{PLAYERS_SHEET_NAME}:",
-                ],
+                patch_sheet=PLAYERS_SHEET_NAME,
+                patch_rows={row_index: row_cells(1, values, PLAYERS_HEADERS)},
             )
 
         else:
@@ -3711,8 +4108,9 @@ def rebuild_players_from_published_matches(season: str | None = None) -> dict[st
 
 def get_latest_completed_slot_id_for_scope(mode_name: str | None = None) -> str:
     requested_mode = get_canonical_mode_name(mode_name) if normalize_text(mode_name) else ""
-    schedule_modes = get_schedule_mode_map()
-    matches = load_matches_rows_combined()
+    aggregate = build_standings_aggregate()
+    schedule_modes = aggregate["schedule_modes"]
+    completed_slot_ids = aggregate["completed_slot_ids"]
     best_slot_id = ""
     best_dt = None
 
@@ -3727,12 +4125,7 @@ def get_latest_completed_slot_id_for_scope(mode_name: str | None = None) -> str:
             if get_canonical_mode_name(mode) != requested_mode:
                 continue
 
-        if not any(
-            normalize_text(match.get("Slot ID")) == slot_id
-            and normalize_text(match.get("Status")).lower() == "finished"
-            and normalize_text(match.get("Veröffentlicht")).lower() == "ja"
-            for match in matches
-        ):
+        if slot_id not in completed_slot_ids:
             continue
 
         completed_dt = parse_completed_at(row.get(SCHEDULE_COMPLETED_AT_COL))
@@ -3823,21 +4216,98 @@ def calculate_rank_deltas(
     return deltas
 
 
-def build_overall_match_stats() -> dict[str, dict]:
+# =========================================================
+# STANDINGS AGGREGATE
+# =========================================================
+# Gesamt-Statistik, Modus-Tabellen (inkl. Best/Ø) und FF-Zähler entstehen in
+# einem einzigen Durchlauf über Matches + Schedule. Das Ergebnis hängt nur an
+# den Sheet-Snapshots (Live + Archive) und der Season und wird pro
+# Snapshot-Version genau einmal gebaut. Gesamttabelle, alle Modus-Tabellen und
+# /ladder_mode_standings teilen sich damit einen Durchlauf.
+# Die gelieferten Listen/Dicts sind geteilt und dürfen nicht verändert werden.
+
+# (Snapshots, Season, Aggregat)
+_STANDINGS_AGGREGATE_CACHE: tuple | None = None
+
+
+def get_standings_source_snapshots() -> tuple:
+    return (
+        load_matches_rows_all(),
+        load_archive_rows_for_source(MATCHES_SHEET_NAME),
+        load_schedule_rows_all(),
+        load_archive_rows_for_source(SCHEDULE_SHEET_NAME),
+    )
+
+
+def build_standings_aggregate() -> dict:
     """
-    Statistikquelle für G/S/U/N/FF.
-    ELO bleibt in Ladder_Ratings, aber die Spielstatistiken werden aus Matches
-    berechnet. Dadurch können ELO und Games nicht mehr auseinanderlaufen.
+    Liefert:
+    - overall:            Player ID -> G/S/U/N/FF über alle Modi
+    - modes:              kanonischer Modus -> sortierte Modus-Tabelle
+    - mode_names:         kanonischer Modus -> Anzeigename aus dem Schedule
+    - completed_slot_ids: Slots mit mindestens einem veröffentlichten Match
+    - schedule_modes:     Slot ID -> Modus
+
+    Gezählt werden nur veröffentlichte, abgeschlossene Matches.
     """
-    stats_by_id: dict[str, dict] = {}
+    global _STANDINGS_AGGREGATE_CACHE
+
+    snapshots = get_standings_source_snapshots()
+    season = get_active_season()
+    cached = _STANDINGS_AGGREGATE_CACHE
+
+    if (
+        cached is not None
+        and cached[1] == season
+        # Fehlende Archive-Sheets liefern jedes Mal ein neues leeres [].
+        and all(old is new or (not old and not new) for old, new in zip(cached[0], snapshots))
+    ):
+        return cached[2]
+
+    live_matches, archive_matches, live_schedule, archive_schedule = snapshots
 
-    for match in load_matches_rows_combined():
+    matches = filter_rows_by_season(
+        merge_live_and_archive_rows(MATCHES_SHEET_NAME, live_rows=live_matches, archive_rows=archive_matches),
+        season,
+    )
+    schedule_rows = filter_rows_by_season(
+        merge_live_and_archive_rows(SCHEDULE_SHEET_NAME, live_rows=live_schedule, archive_rows=archive_schedule),
+        season,
+    )
+
+    schedule_modes = {
+        normalize_text(row.get("Slot ID")): normalize_text(row.get("Modus"))
+        for row in schedule_rows
+        if normalize_text(row.get("Slot ID"))
+    }
+
+    overall: dict[str, dict] = {}
+    modes: dict[str, dict[str, dict]] = {}
+    mode_names: dict[str, str] = {}
+    completed_slot_ids: set[str] = set()
+    canonical_by_mode: dict[str, str] = {}
+
+    for match in matches:
         if normalize_text(match.get("Veröffentlicht")).lower() != "ja":
             continue
 
         if normalize_text(match.get("Status")).lower() != "finished":
             continue
 
+        slot_id = normalize_text(match.get("Slot ID"))
+        match_mode = schedule_modes.get(slot_id, "")
+
+        if match_mode not in canonical_by_mode:
+            canonical_by_mode[match_mode] = get_canonical_mode_name(match_mode)
+
+        canonical = canonical_by_mode[match_mode]
+        completed_slot_ids.add(slot_id)
+
+        if match_mode and canonical not in mode_names:
+            mode_names[canonical] = match_mode
+
+        mode_standings = modes.setdefault(canonical, {})
+
         for player in get_match_players(match):
             player_id = player["discord_id"]
             player_name = player["name"]
@@ -3847,26 +4317,99 @@ def build_overall_match_stats() -> dict[str, dict]:
             if not player_id:
                 continue
 
-            if player_id not in stats_by_id:
-                stats_by_id[player_id] = {
-                    "discord_id": player_id,
-                    "name": player_name,
-                    "starts": 0,
-                    "wins": 0,
-                    "draws": 0,
-                    "losses": 0,
-                    "forfeits": 0,
-                }
+            is_win = 1 if result_text == "Sieg" else 0
+            is_draw = 1 if result_text == "Remis" else 0
+            is_loss = 1 if result_text == "Niederlage" else 0
+            is_forfeit = 1 if time_value.upper() == "FF" else 0
+
+            if player_id not in overall:
+                overall[player_id] = {
+                    "discord_id": player_id,
+                    "name": player_name,
+                    "starts": 0,
+                    "wins": 0,
+                    "draws": 0,
+                    "losses": 0,
+                    "forfeits": 0,
+                }
+
+            row = overall[player_id]
+            row["name"] = player_name
+            row["starts"] += 1
+            row["wins"] += is_win
+            row["draws"] += is_draw
+            row["losses"] += is_loss
+            row["forfeits"] += is_forfeit
+
+            if player_id not in mode_standings:
+                mode_standings[player_id] = {
+                    "discord_id": player_id,
+                    "name": player_name,
+                    "points": 0,
+                    "starts": 0,
+                    "wins": 0,
+                    "draws": 0,
+                    "losses": 0,
+                    "forfeits": 0,
+                    "finished_seconds": [],
+                }
+
+            row = mode_standings[player_id]
+            row["name"] = player_name
+            row["points"] += int_value(match.get(player["points_col"]))
+            row["starts"] += 1
+            row["wins"] += is_win
+            row["draws"] += is_draw
+            row["losses"] += is_loss
+            row["forfeits"] += is_forfeit
+
+            seconds = timecode_to_seconds(time_value)
+
+            if seconds is not None:
+                row["finished_seconds"].append(seconds)
+
+    sorted_modes: dict[str, list[dict]] = {}
+
+    for canonical, mode_standings in modes.items():
+        rows = list(mode_standings.values())
+
+        for row in rows:
+            finished = row["finished_seconds"]
+
+            row["best_seconds"] = min(finished) if finished else None
+            row["avg_seconds"] = int(sum(finished) / len(finished)) if finished else None
+
+        rows.sort(
+            key=lambda r: (
+                -r["points"],
+                -r["wins"],
+                -r["draws"],
+                r["forfeits"],
+                r["best_seconds"] if r["best_seconds"] is not None else 9999999,
+                r["name"].lower(),
+            )
+        )
+        sorted_modes[canonical] = rows
+
+    aggregate = {
+        "overall": overall,
+        "modes": sorted_modes,
+        "mode_names": mode_names,
+        "completed_slot_ids": completed_slot_ids,
+        "schedule_modes": schedule_modes,
+    }
+
+    _STANDINGS_AGGREGATE_CACHE = (snapshots, season, aggregate)
+    return aggregate
 
-            row = stats_by_id[player_id]
-            row["name"] = player_name
-            row["starts"] += 1
-            row["wins"] += 1 if result_text == "Sieg" else 0
-            row["draws"] += 1 if result_text == "Remis" else 0
-            row["losses"] += 1 if result_text == "Niederlage" else 0
-            row["forfeits"] += 1 if time_value.upper() == "FF" else 0
 
-    return stats_by_id
+def build_overall_match_stats() -> dict[str, dict]:
+    """
+    Statistikquelle für G/S/U/N/FF.
+    ELO bleibt in Ladder_Ratings, aber die Spielstatistiken werden aus Matches
+    berechnet. Dadurch können ELO und Games nicht mehr auseinanderlaufen.
+    """
+    return build_standings_aggregate()["overall"]
 
 
 def get_player_forfeits_by_id() -> dict[str, int]:
@@ -4048,81 +4591,7 @@ def get_schedule_mode_map() -> dict[str, str]:
 
 def build_mode_standings(mode_name: str) -> list[dict]:
     requested_mode = get_canonical_mode_name(mode_name)
-    schedule_modes = get_schedule_mode_map()
-    matches = load_matches_rows_combined()
-
-    standings = {}
-
-    for match in matches:
-        slot_id = normalize_text(match.get("Slot ID"))
-        match_mode = schedule_modes.get(slot_id, "")
-
-        if get_canonical_mode_name(match_mode) != requested_mode:
-            continue
-
-        if normalize_text(match.get("Veröffentlicht")).lower() != "ja":
-            continue
-
-        if normalize_text(match.get("Status")).lower() != "finished":
-            continue
-
-        for player in get_match_players(match):
-            player_id = player["discord_id"]
-            player_name = player["name"]
-            time_value = normalize_text(match.get(player["time_col"]))
-            result_text = normalize_text(match.get(player["result_col"]))
-            points = int_value(match.get(player["points_col"]))
-            seconds = timecode_to_seconds(time_value)
-
-            if not player_id:
-                continue
-
-            if player_id not in standings:
-                standings[player_id] = {
-                    "discord_id": player_id,
-                    "name": player_name,
-                    "points": 0,
-                    "starts": 0,
-                    "wins": 0,
-                    "draws": 0,
-                    "losses": 0,
-                    "forfeits": 0,
-                    "finished_seconds": [],
-                }
-
-            row = standings[player_id]
-
-            row["name"] = player_name
-            row["points"] += points
-            row["starts"] += 1
-            row["wins"] += 1 if result_text == "Sieg" else 0
-            row["draws"] += 1 if result_text == "Remis" else 0
-            row["losses"] += 1 if result_text == "Niederlage" else 0
-            row["forfeits"] += 1 if time_value.upper() == "FF" else 0
-
-            if seconds is not None:
-                row["finished_seconds"].append(seconds)
-
-    rows = list(standings.values())
-
-    for row in rows:
-        finished = row["finished_seconds"]
-
-        row["best_seconds"] = min(finished) if finished else None
-        row["avg_seconds"] = int(sum(finished) / len(finished)) if finished else None
-
-    rows.sort(
-        key=lambda r: (
-            -r["points"],
-            -r["wins"],
-            -r["draws"],
-            r["forfeits"],
-            r["best_seconds"] if r["best_seconds"] is not None else 9999999,
-            r["name"].lower(),
-        )
-    )
-
-    return rows
+    return build_standings_aggregate()["modes"].get(requested_mode, [])
 
 
 def build_mode_standings_messages(mode_name: str) -> list[str]:
@@ -4204,27 +4673,7 @@ def build_mode_standings_messages(mode_name: str) -> list[str]:
     ]
 
 def get_completed_match_modes() -> list[str]:
-    schedule_modes = get_schedule_mode_map()
-    matches = load_matches_rows_combined()
-    modes_by_canonical: dict[str, str] = {}
-
-    for match in matches:
-        if normalize_text(match.get("Status")).lower() != "finished":
-            continue
-
-        if normalize_text(match.get("Veröffentlicht")).lower() != "ja":
-            continue
-
-        slot_id = normalize_text(match.get("Slot ID"))
-        mode_name = normalize_text(schedule_modes.get(slot_id))
-
-        if not mode_name:
-            continue
-
-        canonical = get_canonical_mode_name(mode_name)
-
-        if canonical not in modes_by_canonical:
-            modes_by_canonical[canonical] = mode_name
+    modes_by_canonical = dict(build_standings_aggregate()["mode_names"])
 
     preferred_order = [
         "casual boots",
@@ -4384,6 +4833,7 @@ def get_source_sheet_and_headers(source_sheet_name: str):
     )
 
     if "Season" not in headers:
+        headers = thaw_snapshot(headers)
         headers.append("Season")
         sheet_write_call(
             lambda: sheet.update("A1", [headers]),
@@ -4402,13 +4852,14 @@ def get_or_create_archive_sheet(source_sheet_name: str, headers: list[str]):
     archive_name = get_archive_sheet_name(source_sheet_name)
 
     try:
-        sheet = spreadsheet.worksheet(archive_name)
+        sheet = get_worksheet(spreadsheet, archive_name)
     except gspread.WorksheetNotFound:
         sheet = spreadsheet.add_worksheet(
             title=archive_name,
             rows=1000,
             cols=max(len(headers), 1),
         )
+        register_worksheet(sheet)
 
     existing_headers = row_values_cached(
         lambda: sheet,
@@ -4713,7 +5164,11 @@ def build_race_control_dm_content(schedule_row: dict) -> str:
 # =========================================================
 
 class SignupView(discord.ui.View):
-    def __init__(self, open_slots: list[dict]):
+    def __init__(self, open_slots: list[dict], signup_counts: dict[str, int]):
+        """
+        signup_counts: Slot ID -> Anmeldungen, vorher im Sheet-Executor gelesen
+        (get_signup_counts_for_slots), damit der Konstruktor nichts liest.
+        """
         super().__init__(timeout=None)
 
         for row in open_slots[:12]:
@@ -4721,7 +5176,7 @@ class SignupView(discord.ui.View):
             slot = normalize_text(row.get("Slot"))
             startzeit = normalize_text(row.get("Startzeit"))
             modus = normalize_text(row.get("Modus"))
-            signup_count = get_signup_count_for_slot(slot_id) if slot_id else 0
+            signup_count = signup_counts.get(slot_id, 0)
 
             if not slot_id:
                 continue
@@ -4885,11 +5340,20 @@ def build_elo_table_message(scope: str, season: str, mode: str = "", limit: int
 class LadderCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.last_schedule_message_id = None
-        self.last_signup_message_id = None
-        self.last_signup_status_message_id = None
+        # Zuletzt gesendete Nachrichten + Render-Fingerprint. Unveränderte
+        # Ausgaben werden weder gefetcht noch editiert.
+        self.schedule_message = None
+        self.schedule_fingerprint = None
+        self.signup_message = None
+        self.signup_status_message = None
+        self.signup_fingerprint = None
         self.last_race_participants_message_id = None
         self.last_slot_id_check_at = None
+        self.slot_plan = SlotTransitionPlan()
+        # Erster Slot-Durchlauf nach dem Start liest frisch aus dem Sheet, nicht
+        # aus dem persistierten (ggf. veralteten) sheet_guard-Cache.
+        self.slot_state_fresh = False
+        self.standings_reconciler = ChannelMessageReconciler(history_limit=100)
         self.result_publish_lock = asyncio.Lock()
         self.slot_overview_publish_lock = asyncio.Lock()
         self.standings_publish_lock = asyncio.Lock()
@@ -4899,12 +5363,8 @@ class LadderCog(commands.Cog):
         self.race_control_dm_messages = {}
         self.last_results_channel_cleanup_date = None
 
-        try:
-            self.elo_sheet_setup_status = ensure_ladder_elo_sheets()
-            print(f"[TFNL ELO] Sheet-Setup OK: {self.elo_sheet_setup_status}")
-        except Exception as e:
-            self.elo_sheet_setup_status = None
-            print(f"[TFNL ELO] Sheet-Setup fehlgeschlagen: {repr(e)}")
+        # Wird in cog_load im Sheet-Executor gesetzt.
+        self.elo_sheet_setup_status = None
 
         if not self.update_schedule_channel.is_running():
             self.update_schedule_channel.start()
@@ -4921,16 +5381,58 @@ class LadderCog(commands.Cog):
         if not self.cleanup_results_channel_daily.is_running():
             self.cleanup_results_channel_daily.start()
 
-    def cog_unload(self):
+        if TFNL_SEED_POOL_HORIZON_HOURS > 0 and not self.refill_seed_pool.is_running():
+            self.refill_seed_pool.start()
+
+    async def cog_load(self):
+        self.sheet_write_failure_loop = asyncio.get_running_loop()
+        set_write_failure_handler(self.on_sheet_write_failure)
+
+        try:
+            self.elo_sheet_setup_status = await run_sheet_io(ensure_ladder_elo_sheets)
+            print(f"[TFNL ELO] Sheet-Setup OK: {self.elo_sheet_setup_status}")
+        except Exception as e:
+            self.elo_sheet_setup_status = None
+            print(f"[TFNL ELO] Sheet-Setup fehlgeschlagen: {repr(e)}")
+
+    async def cog_unload(self):
         self.update_schedule_channel.cancel()
         self.update_signup_channel.cancel()
         self.process_ladder_slots.cancel()
         self.auto_evaluate_finished_matches.cancel()
         self.cleanup_results_channel_daily.cancel()
+        self.refill_seed_pool.cancel()
 
         if self.pending_standings_publish_task and not self.pending_standings_publish_task.done():
             self.pending_standings_publish_task.cancel()
 
+        try:
+            await flush_pending_writes_async()
+        except Exception as e:
+            print(f"[TFNL] Ausstehende Sheet-Writes konnten beim Entladen nicht geschrieben werden: {repr(e)}")
+            await self.log_tfnl(
+                f"Ausstehende Sheet-Writes beim Entladen nicht geschrieben: `{repr(e)}`"
+            )
+
+        set_write_failure_handler(None)
+
+    def on_sheet_write_failure(self, sheet_name: str, cell_count: int, failures: int, exc: BaseException):
+        # Wird aus dem Write-Behind-Thread aufgerufen, daher threadsafe an den Loop übergeben.
+        loop = getattr(self, "sheet_write_failure_loop", None)
+
+        if loop is None or loop.is_closed():
+            return
+
+        message = (
+            f"Sheet-Write `{sheet_name}` seit {failures} Versuchen fehlgeschlagen "
+            f"({cell_count} Zelle(n)): `{repr(exc)}`. Es wird weiter erneut versucht."
+        )
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.log_tfnl(message), loop)
+        except RuntimeError as e:
+            print(f"[TFNL] Sheet-Write-Fehler konnte nicht geloggt werden: {repr(e)}")
+
     # =====================================================
     # PERSISTENT COMPONENT ROUTING
     # =====================================================
@@ -4959,7 +5461,8 @@ class LadderCog(commands.Cog):
                 return
 
             if action == "tfnl_finish" and len(parts) == 3:
-                await self.handle_finish(interaction, parts[1], int(parts[2]))
+                with sheet_priority(PRIORITY_RACE):
+                    await self.handle_finish(interaction, parts[1], int(parts[2]))
                 return
 
             if action == "tfnl_forfeit" and len(parts) == 3:
@@ -4972,11 +5475,13 @@ class LadderCog(commands.Cog):
                 return
 
             if action == "tfnl_confirm_ff" and len(parts) == 3:
-                await self.handle_forfeit(interaction, parts[1], int(parts[2]))
+                with sheet_priority(PRIORITY_RACE):
+                    await self.handle_forfeit(interaction, parts[1], int(parts[2]))
                 return
 
             if action == "tfnl_undo_finish" and len(parts) == 3:
-                await self.handle_undo_finish(interaction, parts[1], int(parts[2]))
+                with sheet_priority(PRIORITY_RACE):
+                    await self.handle_undo_finish(interaction, parts[1], int(parts[2]))
                 return
 
         except Exception as e:
@@ -5030,16 +5535,46 @@ class LadderCog(commands.Cog):
             )
             return
 
-        deleted_count = 0
+        started = time.monotonic()
+        bulk_cutoff = datetime.now(BERLIN_TZ) - DISCORD_BULK_DELETE_MAX_AGE
+        bulk_messages = []
+        old_messages = []
+        stats = {"bulk": 0, "single": 0, "api_calls": 0, "failed": 0}
 
         try:
             async for message in channel.history(limit=None, oldest_first=False):
+                if message.created_at > bulk_cutoff:
+                    bulk_messages.append(message)
+                else:
+                    old_messages.append(message)
+
+            # Junge Nachrichten: bis zu 100 pro API-Call.
+            for start in range(0, len(bulk_messages), DISCORD_BULK_DELETE_BATCH_SIZE):
+                batch = bulk_messages[start:start + DISCORD_BULK_DELETE_BATCH_SIZE]
+
+                try:
+                    await channel.delete_messages(batch, reason=f"TFNL Ergebnis-Channel-Bereinigung ({reason})")
+                    stats["api_calls"] += 1
+                    stats["bulk"] += len(batch)
+                except discord.Forbidden:
+                    await self.log_tfnl(
+                        "Ergebnis-Channel-Bereinigung abgebrochen: Bot hat keine Löschrechte."
+                    )
+                    return
+                except discord.HTTPException as e:
+                    # Batch abgelehnt (z. B. Grenzfall 14 Tage): einzeln nachlöschen.
+                    stats["api_calls"] += 1
+                    print(f"[TFNL] Bulk-Delete fehlgeschlagen, lösche einzeln: {repr(e)}")
+                    old_messages.extend(batch)
+
+            # Ältere Nachrichten: einzeln und getaktet.
+            for message in old_messages:
                 try:
                     await message.delete()
-                    deleted_count += 1
-                    if deleted_count % 25 == 0:
-                        await asyncio.sleep(1)
+                    stats["api_calls"] += 1
+                    stats["single"] += 1
                 except discord.NotFound:
+                    stats["api_calls"] += 1
                     continue
                 except discord.Forbidden:
                     await self.log_tfnl(
@@ -5047,14 +5582,23 @@ class LadderCog(commands.Cog):
                     )
                     return
                 except Exception as e:
+                    stats["failed"] += 1
                     await self.log_tfnl(
                         f"Einzelne Nachricht im Ergebnis-Channel konnte nicht gelöscht werden: {repr(e)}"
                     )
                     await asyncio.sleep(1)
 
+                await asyncio.sleep(TFNL_RESULTS_PURGE_SINGLE_DELETE_DELAY_SECONDS)
+
             await channel.send(TFNL_RESULTS_CHANNEL_INFO_MESSAGE)
+
+            deleted_count = stats["bulk"] + stats["single"]
+            elapsed = max(time.monotonic() - started, 0.001)
             await self.log_tfnl(
-                f"Ergebnis-Channel bereinigt (`{deleted_count}` Nachricht(en) gelöscht, Grund `{reason}`)."
+                f"Ergebnis-Channel bereinigt (`{deleted_count}` Nachricht(en) gelöscht, Grund `{reason}`). "
+                f"Bulk `{stats['bulk']}` / einzeln `{stats['single']}` / fehlgeschlagen `{stats['failed']}` | "
+                f"`{stats['api_calls']}` API-Call(s) in `{elapsed:.1f}s` "
+                f"(`{deleted_count / elapsed:.1f}` Nachrichten/s)."
             )
 
         except Exception as e:
@@ -5070,18 +5614,24 @@ class LadderCog(commands.Cog):
             return
 
         try:
-            embed = build_schedule_embed(days=5)
+            embed = await run_sheet_io(build_schedule_embed, days=5)
         except Exception as e:
             print(f"[TFNL] Konnte Schedule-Embed nicht bauen: {repr(e)}")
             return
 
-        if self.last_schedule_message_id:
+        fingerprint = render_fingerprint(embed)
+
+        if self.schedule_message is not None:
+            if fingerprint == self.schedule_fingerprint:
+                return
+
             try:
-                old_message = await channel.fetch_message(self.last_schedule_message_id)
-                await old_message.edit(embed=embed)
+                self.schedule_message = await self.schedule_message.edit(embed=embed)
+                self.schedule_fingerprint = fingerprint
                 return
             except Exception:
-                self.last_schedule_message_id = None
+                self.schedule_message = None
+                self.schedule_fingerprint = None
 
         try:
             async for message in channel.history(limit=25):
@@ -5094,8 +5644,8 @@ class LadderCog(commands.Cog):
             pass
 
         try:
-            new_message = await channel.send(embed=embed)
-            self.last_schedule_message_id = new_message.id
+            self.schedule_message = await channel.send(embed=embed)
+            self.schedule_fingerprint = fingerprint
             print("[TFNL] Spielplan im Channel aktualisiert.")
         except Exception as e:
             print(f"[TFNL] Konnte Schedule nicht senden: {repr(e)}")
@@ -5108,36 +5658,45 @@ class LadderCog(commands.Cog):
             return
 
         try:
-            open_slots = get_open_signup_slots()
-            embed = build_signup_embed(open_slots)
-            status_embed = build_public_race_participants_embed()
-            view = SignupView(open_slots) if open_slots else None
+            open_slots = await run_sheet_io(get_open_signup_slots)
+            embed = await run_sheet_io(build_signup_embed, open_slots)
+            status_embed = await run_sheet_io(build_public_race_participants_embed)
+            signup_counts = await run_sheet_io(get_signup_counts_for_slots, open_slots)
+            view = SignupView(open_slots, signup_counts) if open_slots else None
         except Exception as e:
             print(f"[TFNL] Konnte Signup-Embeds nicht bauen: {repr(e)}")
             return
 
         await self.send_signup_announcements(open_slots, channel)
 
-        if self.last_signup_message_id:
+        fingerprint = render_fingerprint(embed, status_embed, view=view)
+
+        if self.signup_message is not None:
+            if fingerprint == self.signup_fingerprint and self.signup_status_message is not None:
+                return
+
             try:
-                old_message = await channel.fetch_message(self.last_signup_message_id)
-                await old_message.edit(embed=embed, view=view)
+                self.signup_message = await self.signup_message.edit(embed=embed, view=view)
 
-                if self.last_signup_status_message_id:
+                if self.signup_status_message is not None:
                     try:
-                        old_status_message = await channel.fetch_message(self.last_signup_status_message_id)
-                        await old_status_message.edit(embed=status_embed, view=None)
+                        self.signup_status_message = await self.signup_status_message.edit(
+                            embed=status_embed,
+                            view=None,
+                        )
+                        self.signup_fingerprint = fingerprint
                         return
                     except Exception:
-                        self.last_signup_status_message_id = None
+                        self.signup_status_message = None
 
-                status_message = await channel.send(embed=status_embed)
-                self.last_signup_status_message_id = status_message.id
+                self.signup_status_message = await channel.send(embed=status_embed)
+                self.signup_fingerprint = fingerprint
                 return
 
             except Exception:
-                self.last_signup_message_id = None
-                self.last_signup_status_message_id = None
+                self.signup_message = None
+                self.signup_status_message = None
+                self.signup_fingerprint = None
 
         try:
             async for message in channel.history(limit=25):
@@ -5150,11 +5709,9 @@ class LadderCog(commands.Cog):
             pass
 
         try:
-            new_message = await channel.send(embed=embed, view=view)
-            self.last_signup_message_id = new_message.id
-
-            status_message = await channel.send(embed=status_embed)
-            self.last_signup_status_message_id = status_message.id
+            self.signup_message = await channel.send(embed=embed, view=view)
+            self.signup_status_message = await channel.send(embed=status_embed)
+            self.signup_fingerprint = fingerprint
 
             print("[TFNL] Anmeldung im Channel aktualisiert.")
         except Exception as e:
@@ -5196,6 +5753,14 @@ class LadderCog(commands.Cog):
         load_schedule_rows_all_combined(force_refresh=force_refresh)
         load_matches_rows_all_combined(force_refresh=force_refresh)
 
+    def build_standings_chunks(self) -> list[str]:
+        self.preload_standings_source_cache(force_refresh=False)
+
+        messages = build_standings_messages()
+        messages.extend(build_all_mode_standings_messages())
+
+        return [chunk for message in messages for chunk in split_discord_message(message)]
+
     async def publish_standings_to_channel(self):
         async with self.standings_publish_lock:
             try:
@@ -5204,26 +5769,21 @@ class LadderCog(commands.Cog):
                 await self.log_tfnl(f"Konnte Standings-Channel nicht laden: {repr(e)}")
                 return
 
-            try:
-                async for message in channel.history(limit=100):
-                    if self.bot.user and message.author.id == self.bot.user.id:
-                        try:
-                            await message.delete()
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+            if not self.bot.user:
+                return
 
             try:
-                self.preload_standings_source_cache(force_refresh=False)
+                # Alle Sheet-Reads (Matches, Schedule, Archive, Ratings, History)
+                # im Sheet-Executor, damit Retry/Backoff den Event-Loop nicht blockiert.
+                chunks = await run_sheet_io(self.build_standings_chunks)
 
-                messages = build_standings_messages()
-                messages.extend(build_all_mode_standings_messages())
-
-                for message in messages:
-                    await send_discord_message_chunks(channel.send, message)
+                # Nur geänderte Chunks editieren, Überschuss löschen/anhängen.
+                stats = await self.standings_reconciler.reconcile(channel, self.bot.user.id, chunks)
+                print(f"[TFNL] Standings abgeglichen: {stats}")
 
             except Exception as e:
+                # Stand unklar: beim nächsten Mal neu aus der History lesen.
+                self.standings_reconciler.invalidate()
                 await self.log_tfnl(f"Gesamttabellen konnten nicht gepostet werden: {repr(e)}")
 
     async def publish_final_season_standings_to_channel(self, clear_existing: bool = False):
@@ -5233,6 +5793,9 @@ class LadderCog(commands.Cog):
             await self.log_tfnl(f"Konnte Standings-Channel für Saison-Endwertung nicht laden: {repr(e)}")
             return
 
+        # Postet/löscht am Reconciler vorbei.
+        self.standings_reconciler.invalidate()
+
         if clear_existing:
             try:
                 async for message in channel.history(limit=100):
@@ -5245,7 +5808,7 @@ class LadderCog(commands.Cog):
                 pass
 
         try:
-            messages = build_final_season_standings_messages()
+            messages = await run_sheet_io(build_final_season_standings_messages)
 
             for message in messages:
                 await send_discord_message_chunks(channel.send, message)
@@ -5262,6 +5825,9 @@ class LadderCog(commands.Cog):
             await self.log_tfnl(f"Konnte Standings-Channel für Modus-Tabelle nicht laden: {repr(e)}")
             return
 
+        # Postet/löscht am Reconciler vorbei.
+        self.standings_reconciler.invalidate()
+
         if clear_existing:
             try:
                 async for message in channel.history(limit=50):
@@ -5274,7 +5840,7 @@ class LadderCog(commands.Cog):
                 pass
 
         try:
-            messages = build_mode_standings_messages(mode_name)
+            messages = await run_sheet_io(build_mode_standings_messages, mode_name)
 
             for message in messages:
                 await send_discord_message_chunks(channel.send, message)
@@ -5309,7 +5875,7 @@ class LadderCog(commands.Cog):
                     f"Anmeldeschluss: `{anmeldeschluss} Uhr`"
                 )
 
-                update_schedule_announcement_sent(slot_id)
+                await run_sheet_io(update_schedule_announcement_sent, slot_id)
 
                 delete_at = build_datetime(row.get("Datum"), row.get("Anmeldeschluss"))
 
@@ -5359,7 +5925,7 @@ class LadderCog(commands.Cog):
         # - Anmeldung ist geöffnet
         # - Bot-DM funktioniert
         # - User ist noch nicht angemeldet
-        _, schedule_row = find_schedule_row(slot_id)
+        _, schedule_row = await find_schedule_row_async(slot_id)
 
         if not schedule_row:
             await interaction.followup.send(
@@ -5375,7 +5941,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        if user_already_signed_up(slot_id, member.id, force_refresh=True):
+        if await run_sheet_io(user_already_signed_up, slot_id, member.id, force_refresh=True):
             await interaction.followup.send(
                 "Du bist für diesen Slot bereits angemeldet.",
                 ephemeral=True,
@@ -5401,14 +5967,14 @@ class LadderCog(commands.Cog):
 
         try:
             async with self.sheet_write_lock:
-                if user_already_signed_up(slot_id, member.id, force_refresh=True):
+                if await run_sheet_io(user_already_signed_up, slot_id, member.id, force_refresh=True):
                     await interaction.followup.send(
                         "Du bist für diesen Slot bereits angemeldet.",
                         ephemeral=True,
                     )
                     return
 
-                append_signup(slot_id, member.id, member.display_name)
+                await run_sheet_io(append_signup, slot_id, member.id, member.display_name)
         except Exception as e:
             await interaction.followup.send(
                 f"Anmeldung fehlgeschlagen: Sheet konnte nicht beschrieben werden.\n```{repr(e)}```",
@@ -5455,7 +6021,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        _, schedule_row = find_schedule_row(slot_id)
+        _, schedule_row = await find_schedule_row_async(slot_id)
 
         if not schedule_row:
             await interaction.followup.send(
@@ -5471,7 +6037,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        if not user_already_signed_up(slot_id, member.id):
+        if not await run_sheet_io(user_already_signed_up, slot_id, member.id):
             await interaction.followup.send(
                 "Du bist für diesen Slot aktuell nicht angemeldet.",
                 ephemeral=True,
@@ -5479,7 +6045,7 @@ class LadderCog(commands.Cog):
             return
 
         try:
-            cancelled = cancel_signup(slot_id, member.id)
+            cancelled = await run_sheet_io(cancel_signup, slot_id, member.id)
         except Exception as e:
             await interaction.followup.send(
                 f"Abmeldung fehlgeschlagen: Sheet konnte nicht aktualisiert werden.\n```{repr(e)}```",
@@ -5565,7 +6131,7 @@ class LadderCog(commands.Cog):
         )
 
         slot_id = normalize_text(schedule_row.get("Slot ID"))
-        update_schedule_channel_id(slot_id, channel.id)
+        await run_sheet_io(update_schedule_channel_id, slot_id, channel.id)
 
         await channel.send(
             "**TFNL Slot-Channel erstellt.**\n"
@@ -5595,40 +6161,54 @@ class LadderCog(commands.Cog):
             )
             return ""
 
-        try:
-            await self.log_tfnl(
-                f"Erzeuge TFNL-Seed für Slot `{slot_id}` / Modus `{mode_name}` / "
-                f"Preset `{preset_key}` / Quelle `{build_sahasrahbot_preset_url(preset_key)}` ..."
-            )
+        pooled_seed = SEED_POOL.take(get_canonical_mode_name(mode_name))
 
-            seed_url, diagnostics = await generate_alttpr_seed_for_mode(mode_name)
+        if pooled_seed:
+            seed_url = pooled_seed["seed_url"]
+            diagnostics = pooled_seed.get("diagnostics") or {}
+            diagnostics.setdefault("seed_hash", pooled_seed.get("seed_hash"))
 
             await self.log_tfnl(
-                f"Seed-Validierung OK für Slot `{slot_id}` / Modus `{mode_name}` / "
-                f"Preset `{diagnostics['preset_key']}` / "
-                f"API `{diagnostics.get('pyz3r_api')}` / "
-                f"Quelle `{diagnostics.get('preset_url')}`"
+                f"Seed aus Pool für Slot `{slot_id}` / Modus `{mode_name}` / "
+                f"Preset `{diagnostics.get('preset_key', preset_key)}` / "
+                f"API `{diagnostics.get('pyz3r_api')}`"
             )
 
-        except Exception as e:
-            await self.log_tfnl(
-                f"Seed-Erzeugung abgebrochen für Slot `{slot_id}` / Modus `{mode_name}` / Preset `{preset_key}` — {repr(e)}"
-            )
-            return ""
+        else:
+            try:
+                await self.log_tfnl(
+                    f"Erzeuge TFNL-Seed für Slot `{slot_id}` / Modus `{mode_name}` / "
+                    f"Preset `{preset_key}` / Quelle `{build_sahasrahbot_preset_url(preset_key)}` ..."
+                )
+
+                seed_url, diagnostics = await generate_tfnl_seed_for_mode(mode_name)
 
-        update_schedule_cell(slot_id, "Seed URL", seed_url)
+                await self.log_tfnl(
+                    f"Seed-Validierung OK für Slot `{slot_id}` / Modus `{mode_name}` / "
+                    f"Preset `{diagnostics['preset_key']}` / "
+                    f"API `{diagnostics.get('pyz3r_api')}` / "
+                    f"Quelle `{diagnostics.get('preset_url')}`"
+                )
+
+            except Exception as e:
+                await self.log_tfnl(
+                    f"Seed-Erzeugung abgebrochen für Slot `{slot_id}` / Modus `{mode_name}` / Preset `{preset_key}` — {repr(e)}"
+                )
+                return ""
+
+        await run_sheet_io(update_schedule_cell, slot_id, "Seed URL", seed_url)
 
         seed_hash = normalize_seed_hash_value(diagnostics.get("seed_hash"))
         if seed_hash:
-            update_schedule_cell(slot_id, SCHEDULE_SEED_HASH_COL, seed_hash)
+            await run_sheet_io(update_schedule_cell, slot_id, SCHEDULE_SEED_HASH_COL, seed_hash)
 
-        matches = get_matches_for_slot(slot_id)
+        matches = await run_sheet_io(get_matches_for_slot, slot_id)
 
         for match in matches:
             match_id = normalize_text(match.get("Match ID"))
 
             if match_id:
-                update_match_cell(match_id, "Seed URL", seed_url)
+                await run_sheet_io(update_match_cell, match_id, "Seed URL", seed_url)
 
         await self.log_tfnl(
             f"Seed erzeugt für Slot `{slot_id}`: {seed_url}"
@@ -5642,7 +6222,7 @@ class LadderCog(commands.Cog):
 
         # Der manuelle Seed-Step wird oft direkt nach Pairing/Seed-Eintrag ausgeführt.
         # Deshalb hier bewusst frische Sheet-Daten erzwingen und nicht den 300s-Cache nutzen.
-        _, refreshed_schedule_row = find_schedule_row(slot_id, force_refresh=True)
+        _, refreshed_schedule_row = await find_schedule_row_async(slot_id, force_refresh=True)
         if refreshed_schedule_row:
             schedule_row = refreshed_schedule_row
 
@@ -5656,13 +6236,13 @@ class LadderCog(commands.Cog):
 
         # Nach ggf. automatischer Seed-Erzeugung erneut frisch laden, damit Seed URL/Hash
         # aus dem Sheet sicher in der DM landen.
-        _, refreshed_schedule_row = find_schedule_row(slot_id, force_refresh=True)
+        _, refreshed_schedule_row = await find_schedule_row_async(slot_id, force_refresh=True)
         if refreshed_schedule_row:
             schedule_row = refreshed_schedule_row
 
         seed_hash = get_seed_hash(schedule_row)
 
-        matches = get_matches_for_slot(slot_id, force_refresh=True)
+        matches = await run_sheet_io(get_matches_for_slot, slot_id, force_refresh=True)
         sent_to = set()
 
         if not matches:
@@ -5697,7 +6277,7 @@ class LadderCog(commands.Cog):
                         f"Seed-DM konnte nicht gesendet werden: Slot `{slot_id}`, Spieler `{player['discord_id']}` — {repr(e)}"
                     )
 
-        update_schedule_status(slot_id, "seed_sent")
+        await run_sheet_io(update_schedule_status, slot_id, "seed_sent")
         await self.publish_schedule_to_channel()
 
         return True
@@ -5712,7 +6292,7 @@ class LadderCog(commands.Cog):
         slot_id = normalize_text(schedule_row.get("Slot ID"))
 
         if slot_id:
-            update_schedule_cell(slot_id, SCHEDULE_PRESTART_DM_COL, "Ja")
+            await run_sheet_io(update_schedule_cell, slot_id, SCHEDULE_PRESTART_DM_COL, "Ja")
 
         return True
 
@@ -5724,7 +6304,7 @@ class LadderCog(commands.Cog):
             await self.log_tfnl(f"Countdown nicht möglich: Startzeit fehlt für Slot `{slot_id}`.")
             return False
 
-        matches = get_matches_for_slot(slot_id)
+        matches = await run_sheet_io(get_matches_for_slot, slot_id)
         sent_to = set()
         prepared_count = 0
 
@@ -5982,25 +6562,25 @@ class LadderCog(commands.Cog):
             f"Debug-Delay `{countdown_debug_delay_seconds:.2f}s`"
         )
 
-        update_schedule_status(slot_id, "countdown_sent")
+        await run_sheet_io(update_schedule_status, slot_id, "countdown_sent")
         await self.publish_schedule_to_channel()
         return True
 
     async def send_start_dms(self, schedule_row: dict):
         slot_id = normalize_text(schedule_row.get("Slot ID"))
-        matches = get_matches_for_slot(slot_id)
+        matches = await run_sheet_io(get_matches_for_slot, slot_id)
 
         for match in matches:
             match_id = normalize_text(match.get("Match ID"))
 
-            update_match_cell(match_id, "Status", "running")
+            await run_sheet_io(update_match_cell, match_id, "Status", "running")
 
             for player in get_match_players(match):
                 try:
                     user = await self.bot.fetch_user(int(player["discord_id"]))
                     player_no = int(player["no"])
                     message = await user.send(
-                        build_race_control_dm_content(schedule_row),
+                        await run_sheet_io(build_race_control_dm_content, schedule_row),
                         view=RaceControlView(match_id, player_no),
                     )
                     self.race_control_dm_messages[(slot_id, normalize_text(player["discord_id"]))] = {
@@ -6013,7 +6593,7 @@ class LadderCog(commands.Cog):
                         f"Race-Control-DM konnte nicht gesendet werden: Match `{match_id}`, Spieler `{player['discord_id']}` — {repr(e)}"
                     )
 
-        update_schedule_status(slot_id, "running")
+        await run_sheet_io(update_schedule_status, slot_id, "running")
 
         try:
             await self.post_slot_runners_to_channel(schedule_row)
@@ -6026,7 +6606,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            _, match_row = find_match_row(match_id)
+            _, match_row = await find_match_row_async(match_id)
 
             if not match_row:
                 await interaction.followup.send("Match wurde nicht gefunden.", ephemeral=True)
@@ -6056,7 +6636,7 @@ class LadderCog(commands.Cog):
                 return
 
             slot_id = normalize_text(match_row.get("Slot ID"))
-            _, schedule_row = find_schedule_row(slot_id)
+            _, schedule_row = await find_schedule_row_async(slot_id)
 
             if not schedule_row:
                 await interaction.followup.send("Slot wurde nicht gefunden.", ephemeral=True)
@@ -6084,7 +6664,8 @@ class LadderCog(commands.Cog):
 
             time_value = seconds_to_timecode(elapsed)
 
-            update_match_cells(
+            await run_sheet_io(
+                update_match_cells,
                 match_id,
                 {
                     f"Zeit Spieler {player_no}": time_value,
@@ -6113,7 +6694,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            _, match_row = find_match_row(match_id)
+            _, match_row = await find_match_row_async(match_id)
 
             if not match_row:
                 await interaction.followup.send("Match wurde nicht gefunden.", ephemeral=True)
@@ -6142,7 +6723,8 @@ class LadderCog(commands.Cog):
                 )
                 return
 
-            update_match_cells(
+            await run_sheet_io(
+                update_match_cells,
                 match_id,
                 {
                     f"Zeit Spieler {player_no}": "",
@@ -6151,7 +6733,7 @@ class LadderCog(commands.Cog):
             )
 
             slot_id = normalize_text(match_row.get("Slot ID"))
-            _, schedule_row = find_schedule_row(slot_id)
+            _, schedule_row = await find_schedule_row_async(slot_id)
 
             await interaction.followup.send(
                 "Finish wurde zurückgenommen. Die Zeitmessung läuft weiter.\n"
@@ -6173,7 +6755,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            _, match_row = find_match_row(match_id)
+            _, match_row = await find_match_row_async(match_id)
 
             if not match_row:
                 await interaction.followup.send("Match wurde nicht gefunden.", ephemeral=True)
@@ -6200,7 +6782,7 @@ class LadderCog(commands.Cog):
                 return
 
             slot_id = normalize_text(match_row.get("Slot ID"))
-            _, schedule_row = find_schedule_row(slot_id)
+            _, schedule_row = await find_schedule_row_async(slot_id)
 
             if schedule_row:
                 start_dt = get_slot_start_dt(schedule_row)
@@ -6211,7 +6793,8 @@ class LadderCog(commands.Cog):
                     )
                     return
 
-            update_match_cells(
+            await run_sheet_io(
+                update_match_cells,
                 match_id,
                 {
                     f"Zeit Spieler {player_no}": "FF",
@@ -6261,7 +6844,7 @@ class LadderCog(commands.Cog):
                 await self.log_tfnl(f"Ergebnis-Channel konnte nicht geladen werden: {repr(e)}")
                 return
 
-            content = build_public_slot_results_message(schedule_row, completed=completed)
+            content = await run_sheet_io(build_public_slot_results_message, schedule_row, completed=completed)
             existing_message = await self.find_public_slot_results_message(channel, slot_id)
 
             try:
@@ -6291,7 +6874,7 @@ class LadderCog(commands.Cog):
     async def post_slot_runners_to_channel(self, schedule_row: dict):
         try:
             slot_channel = await self.get_or_create_slot_channel(schedule_row)
-            await slot_channel.send(build_slot_runner_message(schedule_row))
+            await slot_channel.send(await run_sheet_io(build_slot_runner_message, schedule_row))
             await self.upsert_slot_active_status_message(schedule_row)
         except Exception as e:
             slot_id = normalize_text(schedule_row.get("Slot ID"))
@@ -6330,7 +6913,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        content = build_slot_active_status_message(schedule_row)
+        content = await run_sheet_io(build_slot_active_status_message, schedule_row)
         existing_message = await self.find_slot_active_status_message(slot_channel, slot_id)
 
         try:
@@ -6357,7 +6940,7 @@ class LadderCog(commands.Cog):
         if not cached_items:
             return
 
-        content = build_race_control_dm_content(schedule_row)
+        content = await run_sheet_io(build_race_control_dm_content, schedule_row)
 
         for key, data in cached_items:
             try:
@@ -6407,7 +6990,7 @@ class LadderCog(commands.Cog):
 
     async def evaluate_match_if_complete(self, match_id: str):
         async with self.sheet_write_lock:
-            _, match_row = find_match_row(match_id)
+            _, match_row = await find_match_row_async(match_id)
 
             if not match_row:
                 return
@@ -6420,25 +7003,27 @@ class LadderCog(commands.Cog):
             if result is None:
                 return
 
-            apply_result_to_match(match_id, result)
+            await run_sheet_io(apply_result_to_match, match_id, result)
+            # Ergebnis muss im Sheet stehen, bevor ELO/Spieler darauf aufbauen.
+            await flush_pending_writes_async(MATCHES_SHEET_NAME)
 
-            _, updated_match = find_match_row(match_id)
+            _, updated_match = await find_match_row_async(match_id)
 
             if not updated_match:
                 return
 
             slot_id = normalize_text(updated_match.get("Slot ID"))
-            _, schedule_row = find_schedule_row(slot_id)
+            _, schedule_row = await find_schedule_row_async(slot_id)
 
             elo_changes = {}
 
             try:
-                elo_result = process_match_elo(updated_match, schedule_row=schedule_row)
+                elo_result = await run_sheet_io(process_match_elo, updated_match, schedule_row=schedule_row)
                 elo_changes = elo_result.get("elo_changes", {}) if isinstance(elo_result, dict) else {}
             except Exception as e:
                 await self.log_tfnl(f"ELO-Verarbeitung fehlgeschlagen für `{match_id}` — {repr(e)}")
 
-            update_players_from_match(updated_match)
+            await run_sheet_io(update_players_from_match, updated_match)
 
         if schedule_row:
             try:
@@ -6450,7 +7035,7 @@ class LadderCog(commands.Cog):
 
             try:
                 slot_channel = await self.get_or_create_slot_channel(schedule_row)
-                await slot_channel.send(build_result_message(updated_match, elo_changes=elo_changes))
+                await slot_channel.send(await run_sheet_io(build_result_message, updated_match, elo_changes=elo_changes))
             except Exception as e:
                 await self.log_tfnl(f"Ergebnispost fehlgeschlagen für `{match_id}` — {repr(e)}")
 
@@ -6459,7 +7044,7 @@ class LadderCog(commands.Cog):
             await self.complete_slot_if_ready(slot_id)
 
     async def complete_slot_if_ready(self, slot_id: str, force: bool = False, debug: bool = False) -> bool:
-        _, schedule_row = find_schedule_row(slot_id)
+        _, schedule_row = await find_schedule_row_async(slot_id)
 
         if not schedule_row:
             if debug:
@@ -6491,7 +7076,7 @@ class LadderCog(commands.Cog):
                 )
             return False
 
-        blockers = get_slot_completion_blockers(slot_id)
+        blockers = await run_sheet_io(get_slot_completion_blockers, slot_id)
 
         if blockers:
             if debug:
@@ -6505,7 +7090,7 @@ class LadderCog(commands.Cog):
                 )
             return False
 
-        _, updated_schedule_row = find_schedule_row(slot_id)
+        _, updated_schedule_row = await find_schedule_row_async(slot_id)
 
         if not updated_schedule_row:
             updated_schedule_row = schedule_row
@@ -6533,7 +7118,8 @@ class LadderCog(commands.Cog):
 
         # Keine zusätzliche Modus-Tabelle automatisch in den Tabellenkanal posten.
         # Der Tabellenkanal wird dadurch nur einmal aktualisiert und nicht doppelt befüllt.
-        completed_at = set_schedule_completed(slot_id)
+        completed_at = await run_sheet_io(set_schedule_completed, slot_id)
+        await flush_pending_writes_async(SCHEDULE_SHEET_NAME)
 
         await self.publish_schedule_to_channel()
         await self.publish_signup_to_channel()
@@ -6546,7 +7132,7 @@ class LadderCog(commands.Cog):
 
     async def finalize_slot(self, schedule_row: dict):
         slot_id = normalize_text(schedule_row.get("Slot ID"))
-        matches = get_matches_for_slot(slot_id)
+        matches = await run_sheet_io(get_matches_for_slot, slot_id)
 
         for match in matches:
             match_id = normalize_text(match.get("Match ID"))
@@ -6564,7 +7150,7 @@ class LadderCog(commands.Cog):
                     values[player["time_col"]] = "FF"
 
             if values:
-                update_match_cells(match_id, values)
+                await run_sheet_io(update_match_cells, match_id, values)
 
             await self.evaluate_match_if_complete(match_id)
 
@@ -6585,7 +7171,7 @@ class LadderCog(commands.Cog):
             reason = "TFNL Slot 60 Minuten nach Abschluss gelöscht"
 
         if not channel_id:
-            update_schedule_status(slot_id, "archived")
+            await run_sheet_io(update_schedule_status, slot_id, "archived")
             return
 
         try:
@@ -6598,7 +7184,7 @@ class LadderCog(commands.Cog):
         except Exception as e:
             await self.log_tfnl(f"Slot-Channel konnte nicht gelöscht werden: `{slot_id}` — {repr(e)}")
 
-        update_schedule_status(slot_id, "archived")
+        await run_sheet_io(update_schedule_status, slot_id, "archived")
         await self.publish_schedule_to_channel()
 
     # =====================================================
@@ -6610,7 +7196,7 @@ class LadderCog(commands.Cog):
 
         if self.last_slot_id_check_at is None or now_ts - self.last_slot_id_check_at >= 300:
             self.last_slot_id_check_at = now_ts
-            unique_changes = ensure_unique_schedule_slot_ids()
+            unique_changes = await run_sheet_io(ensure_unique_schedule_slot_ids)
 
             if unique_changes:
                 change_lines = []
@@ -6625,64 +7211,110 @@ class LadderCog(commands.Cog):
                     "Doppelte/leere Slot IDs automatisch korrigiert:\n" + "\n".join(change_lines[:15])
                 )
 
-        rows_with_index = load_schedule_rows_with_index()
+        # Persistierte Snapshots können hinter dem Sheet zurückliegen (z. B.
+        # seed_sent noch als paired). Die State-Machine darf darauf nicht
+        # laufen, sonst gehen Seed/Countdown/DMs doppelt raus.
+        force_refresh = not self.slot_state_fresh
 
-        for _, row in rows_with_index:
-            slot_id = normalize_text(row.get("Slot ID"))
-            status = normalize_text(row.get("Status")).lower()
+        if force_refresh:
+            await load_matches_rows_all_async(force_refresh=True)
+            await run_sheet_io(load_signup_rows_all, force_refresh=True)
 
-            if not slot_id:
-                continue
+        rows_with_index = await load_schedule_rows_with_index_async(force_refresh=force_refresh)
+        self.slot_state_fresh = True
+        rows = [row for _, row in rows_with_index]
+        now = datetime.now(BERLIN_TZ)
 
-            if status == "archived":
-                continue
+        # Neuer Snapshot (Sheet geändert, Cache neu geladen) -> komplett neu planen.
+        # Sonst werden nur die Zeilen geprüft, deren Übergang fällig ist.
+        if not self.slot_plan.is_current(rows):
+            self.slot_plan.rebuild(rows, now)
+
+        for position in self.slot_plan.pop_due(now):
+            await self.process_slot_row(rows[position])
+
+            # Hat der Schritt das Sheet geändert, plant der nächste Durchlauf
+            # mit dem neuen Snapshot. Sonst frühestens nach dem Loop-Intervall
+            # erneut prüfen (z. B. Channel-Löschung fehlgeschlagen).
+            self.slot_plan.schedule(
+                position,
+                datetime.now(BERLIN_TZ),
+                not_before=time.time() + TFNL_LOOP_INTERVAL_SECONDS,
+            )
 
-            if status in ("completed", "cancelled"):
-                await self.delete_slot_channel_if_due(row)
-                continue
+    async def process_slot_row(self, row: dict):
+        slot_id = normalize_text(row.get("Slot ID"))
+        status = normalize_text(row.get("Status")).lower()
 
-            if is_registration_open(row) and status not in (
-                "registration_open",
-                "paired",
-                "seed_sent",
-                "countdown_sent",
-                "running",
-                "completed",
-            ):
-                update_schedule_status(slot_id, "registration_open")
-                continue
+        if not slot_id:
+            return
 
-            if is_registration_due_for_pairing(row) and status in ("planned", "registration_open", ""):
-                await self.close_registration_and_pair(row)
-                continue
+        if status == "archived":
+            return
+
+        if status in ("completed", "cancelled"):
+            await self.delete_slot_channel_if_due(row)
+            return
 
-            if status == "paired" and is_seed_due(row):
+        if is_registration_open(row) and status not in REGISTRATION_OPEN_SKIP_STATUSES:
+            await run_sheet_io(update_schedule_status, slot_id, "registration_open")
+            # Anmeldung sofort sichtbar machen, nicht erst beim nächsten Timer.
+            await self.publish_schedule_to_channel()
+            await self.publish_signup_to_channel()
+            return
+
+        if is_registration_due_for_pairing(row) and status in ("planned", "registration_open", ""):
+            await self.close_registration_and_pair(row)
+            return
+
+        if status == "paired" and is_seed_due(row):
+            with sheet_priority(PRIORITY_RACE):
                 await self.send_seed_dms(row)
-                await self.publish_signup_to_channel()
-                continue
+            await self.publish_signup_to_channel()
+            return
 
-            # v20:
-            # Keine separate 1-Minuten-DM mehr senden.
-            # Der Countdown muss die letzte Bot-DM sein und läuft in der Race-Control-DM.
-            # Eine nachträgliche Prestart-DM würde den Countdown wieder nach oben schieben.
-            if status == "seed_sent" and is_countdown_due(row):
+        # v20:
+        # Keine separate 1-Minuten-DM mehr senden.
+        # Der Countdown muss die letzte Bot-DM sein und läuft in der Race-Control-DM.
+        # Eine nachträgliche Prestart-DM würde den Countdown wieder nach oben schieben.
+        if status == "seed_sent" and is_countdown_due(row):
+            with sheet_priority(PRIORITY_RACE):
                 await self.send_countdown_dms(row)
-                await self.publish_signup_to_channel()
-                continue
+            await self.publish_signup_to_channel()
+            return
 
-            if status == "countdown_sent" and is_start_due(row):
+        if status == "countdown_sent" and is_start_due(row):
+            with sheet_priority(PRIORITY_RACE):
                 await self.send_start_dms(row)
-                await self.publish_signup_to_channel()
-                continue
+            await self.publish_signup_to_channel()
+            return
 
-            if status == "running":
-                if is_slot_complete(slot_id):
+        if status == "running":
+            with sheet_priority(PRIORITY_RACE):
+                if await run_sheet_io(is_slot_complete, slot_id):
                     await self.complete_slot_if_ready(slot_id, debug=True)
-                    continue
+                    return
 
                 if is_slot_end_due(row):
                     await self.finalize_slot(row)
-                    continue
+                    return
+
+    async def wait_for_next_slot_transition(self):
+        """
+        Schläft bis zum nächsten geplanten Übergang, höchstens bis zum
+        Replan-Intervall bzw. zur nächsten Slot-ID-Prüfung.
+        """
+        now = datetime.now(BERLIN_TZ)
+        delay = float(TFNL_SLOT_REPLAN_SECONDS)
+        next_due = self.slot_plan.seconds_until_next(now)
+
+        if next_due is not None:
+            delay = min(delay, next_due)
+
+        if self.last_slot_id_check_at is not None:
+            delay = min(delay, self.last_slot_id_check_at + 300 - now.timestamp())
+
+        await asyncio.sleep(max(1.0, delay))
 
     async def close_registration_and_pair(self, schedule_row: dict):
         slot_id = normalize_text(schedule_row.get("Slot ID"))
@@ -6690,11 +7322,11 @@ class LadderCog(commands.Cog):
         if not slot_id:
             return
 
-        if matches_already_created(slot_id):
-            update_schedule_status(slot_id, "paired")
+        if await run_sheet_io(matches_already_created, slot_id):
+            await run_sheet_io(update_schedule_status, slot_id, "paired")
             return
 
-        participants = get_signup_participants_for_slot(slot_id)
+        participants = await run_sheet_io(get_signup_participants_for_slot, slot_id)
 
         try:
             slot_channel = await self.get_or_create_slot_channel(schedule_row)
@@ -6703,7 +7335,7 @@ class LadderCog(commands.Cog):
             await self.log_tfnl(f"Slot-Channel konnte beim Pairing nicht geladen/erstellt werden: {repr(e)}")
 
         if len(participants) < 2:
-            cancelled_at = set_schedule_cancelled(slot_id)
+            cancelled_at = await run_sheet_io(set_schedule_cancelled, slot_id)
 
             if slot_channel:
                 await slot_channel.send(
@@ -6719,11 +7351,11 @@ class LadderCog(commands.Cog):
             await self.publish_signup_to_channel()
             return
 
-        pairings = create_pairings(participants, schedule_row)
-        match_rows = build_match_rows(slot_id, schedule_row, pairings)
+        pairings = await run_sheet_io(create_pairings, participants, schedule_row)
+        match_rows = await run_sheet_io(build_match_rows, slot_id, schedule_row, pairings)
 
-        append_matches(match_rows)
-        update_schedule_status(slot_id, "paired")
+        await run_sheet_io(append_matches, match_rows)
+        await run_sheet_io(update_schedule_status, slot_id, "paired")
 
         if slot_channel:
             await slot_channel.send(
@@ -6731,7 +7363,7 @@ class LadderCog(commands.Cog):
                 "Die Paarungen wurden geheim ausgelost.\n"
                 "Ihr erhaltet die weiteren Informationen später per DM."
             )
-            await slot_channel.send(build_slot_runner_message(schedule_row))
+            await slot_channel.send(await run_sheet_io(build_slot_runner_message, schedule_row))
 
         await self.log_tfnl(f"Slot `{slot_id}` paired: {len(match_rows)} Match(es) erstellt.")
 
@@ -6743,7 +7375,7 @@ class LadderCog(commands.Cog):
         channel_id = normalize_text(schedule_row.get("Slot Channel ID"))
 
         if not channel_id:
-            update_schedule_status(slot_id, "archived")
+            await run_sheet_io(update_schedule_status, slot_id, "archived")
             await self.publish_schedule_to_channel()
             await self.log_tfnl(f"Slot `{slot_id}` manuell archiviert. Kein Slot Channel ID vorhanden.")
             return True
@@ -6759,7 +7391,7 @@ class LadderCog(commands.Cog):
             await self.log_tfnl(f"Slot-Channel konnte manuell nicht gelöscht werden: `{slot_id}` — {repr(e)}")
             return False
 
-        update_schedule_status(slot_id, "archived")
+        await run_sheet_io(update_schedule_status, slot_id, "archived")
         await self.publish_schedule_to_channel()
         await self.log_tfnl(f"Slot `{slot_id}` manuell archiviert und Channel gelöscht.")
         return True
@@ -6776,7 +7408,7 @@ class LadderCog(commands.Cog):
             # Die Routine läuft nur alle 3 Minuten.
             # Hier bewusst force_refresh=True, damit manuell im Sheet eingetragene
             # Zeiten/FFs zuverlässig erkannt werden und nicht im Cache hängen bleiben.
-            rows = load_matches_rows(force_refresh=True)
+            rows = await load_matches_rows_async(force_refresh=True)
 
             for match_row in rows:
                 if not match_needs_auto_evaluation(match_row):
@@ -6801,13 +7433,13 @@ class LadderCog(commands.Cog):
         step = normalize_text(step).lower()
         slot_id = normalize_text(slot_id)
 
-        _, schedule_row = find_schedule_row(slot_id)
+        _, schedule_row = await find_schedule_row_async(slot_id)
 
         if not schedule_row:
             return False, f"Slot `{slot_id}` wurde im Schedule nicht gefunden."
 
         if step in ("open", "open_signup", "registration_open", "anmeldung"):
-            update_schedule_status(slot_id, "registration_open")
+            await run_sheet_io(update_schedule_status, slot_id, "registration_open")
             await self.publish_schedule_to_channel()
             await self.publish_signup_to_channel()
             return True, f"Anmeldung für Slot `{slot_id}` wurde manuell geöffnet."
@@ -6872,29 +7504,38 @@ class LadderCog(commands.Cog):
 
     @tasks.loop(minutes=5)
     async def update_schedule_channel(self):
-        await self.publish_schedule_to_channel()
+        with sheet_priority(PRIORITY_BACKGROUND):
+            await self.publish_schedule_to_channel()
 
     @update_schedule_channel.before_loop
     async def before_update_schedule_channel(self):
         await self.bot.wait_until_ready()
-        # Nach Deploy sind alle Sheet-Caches leer. Deshalb nicht gleichzeitig
-        # mit Signup-Update und Slot-Prozess echte Reads feuern.
-        await asyncio.sleep(TFNL_STARTUP_STAGGER_SECONDS)
+        # Nach Deploy ohne persistierten Cache sind alle Sheet-Caches leer. Deshalb
+        # dann nicht gleichzeitig mit Signup-Update und Slot-Prozess echte Reads feuern.
+        await asyncio.sleep(startup_stagger_seconds(0))
 
     @tasks.loop(minutes=2)
     async def update_signup_channel(self):
-        await self.publish_signup_to_channel()
+        with sheet_priority(PRIORITY_BACKGROUND):
+            await self.publish_signup_to_channel()
 
     @update_signup_channel.before_loop
     async def before_update_signup_channel(self):
         await self.bot.wait_until_ready()
         # Signup-Ansicht startet bewusst versetzt nach Schedule.
-        await asyncio.sleep(TFNL_STARTUP_STAGGER_SECONDS + 15)
+        await asyncio.sleep(startup_stagger_seconds(15))
 
-    @tasks.loop(seconds=TFNL_LOOP_INTERVAL_SECONDS)
+    # Kein festes Intervall: Der Task schläft selbst bis zum nächsten geplanten
+    # Slot-Übergang (siehe wait_for_next_slot_transition).
+    @tasks.loop(seconds=0)
     async def process_ladder_slots(self):
         try:
-            await self.process_schedule_states()
+            # Scans und Statuswechsel laufen als Hintergrund-Last. Zeitkritische
+            # Schritte (Seed, Countdown, Start, Abschluss) heben die Priorität selbst an.
+            with sheet_priority(PRIORITY_BACKGROUND):
+                await self.process_schedule_states()
+
+            await self.wait_for_next_slot_transition()
         except Exception as e:
             error_text = repr(e)
 
@@ -6919,18 +7560,20 @@ class LadderCog(commands.Cog):
                 return
 
             await self.log_tfnl(f"Fehler in process_ladder_slots: {error_text}")
+            await asyncio.sleep(TFNL_LOOP_INTERVAL_SECONDS)
 
     @process_ladder_slots.before_loop
     async def before_process_ladder_slots(self):
         await self.bot.wait_until_ready()
         # Der Slot-Prozess ist der read-lastigste Task. Nach Deploy daher
         # erst starten, wenn Schedule-/Signup-Tasks zeitlich entzerrt wurden.
-        await asyncio.sleep(TFNL_STARTUP_STAGGER_SECONDS + 30)
+        await asyncio.sleep(startup_stagger_seconds(30))
 
     @tasks.loop(minutes=TFNL_AUTO_EVALUATE_INTERVAL_MINUTES)
     async def auto_evaluate_finished_matches(self):
         try:
-            await self.check_finished_matches_from_sheet()
+            with sheet_priority(PRIORITY_BACKGROUND):
+                await self.check_finished_matches_from_sheet()
         except Exception as e:
             error_text = repr(e)
 
@@ -6960,7 +7603,7 @@ class LadderCog(commands.Cog):
     async def before_auto_evaluate_finished_matches(self):
         await self.bot.wait_until_ready()
         # Nach Deploy später starten als der normale Slot-Prozess.
-        await asyncio.sleep(TFNL_STARTUP_STAGGER_SECONDS + 45)
+        await asyncio.sleep(startup_stagger_seconds(45))
 
     @tasks.loop(minutes=5)
     async def cleanup_results_channel_daily(self):
@@ -6974,13 +7617,49 @@ class LadderCog(commands.Cog):
             return
 
         self.last_results_channel_cleanup_date = now.date()
-        await self.purge_results_channel_and_post_info(reason="daily_03_cleanup")
+
+        with sheet_priority(PRIORITY_BACKGROUND):
+            await self.purge_results_channel_and_post_info(reason="daily_03_cleanup")
 
     @cleanup_results_channel_daily.before_loop
     async def before_cleanup_results_channel_daily(self):
         await self.bot.wait_until_ready()
         # Start bewusst nach den anderen Tasks, damit Deploy-Spitzen nicht alles gleichzeitig auslösen.
-        await asyncio.sleep(TFNL_STARTUP_STAGGER_SECONDS + 60)
+        await asyncio.sleep(startup_stagger_seconds(60))
+
+    @tasks.loop(minutes=TFNL_SEED_POOL_INTERVAL_MINUTES)
+    async def refill_seed_pool(self):
+        """
+        Erzeugt Seeds für Slots der nächsten TFNL_SEED_POOL_HORIZON_HOURS Stunden
+        vorab, damit Seed-DMs nicht auf langsame Generatoren warten.
+        """
+        try:
+            with sheet_priority(PRIORITY_BACKGROUND):
+                rows_with_index = await load_schedule_rows_with_index_async()
+
+            demand = build_seed_pool_demand([row for _, row in rows_with_index])
+
+            if not demand:
+                return
+
+            generated, errors = await SEED_POOL.fill(demand, generate_tfnl_seed_for_mode)
+
+            if generated:
+                await self.log_tfnl(
+                    f"Seed-Pool aufgefüllt: `{generated}` Seed(s) erzeugt. Bestand: "
+                    + ", ".join(f"`{mode}`={count}" for mode, count in sorted(SEED_POOL.counts().items()))
+                )
+
+            for error_text in errors:
+                await self.log_tfnl(f"Seed-Pool: Seed-Erzeugung fehlgeschlagen — {error_text}")
+
+        except Exception as e:
+            await self.log_tfnl(f"Fehler in refill_seed_pool: {repr(e)}")
+
+    @refill_seed_pool.before_loop
+    async def before_refill_seed_pool(self):
+        await self.bot.wait_until_ready()
+        await asyncio.sleep(startup_stagger_seconds(75))
 
     # =====================================================
     # COMMANDS
@@ -7293,8 +7972,9 @@ class LadderCog(commands.Cog):
             return
 
         try:
-            season = get_active_season()
-            message = build_elo_table_message(
+            season = await get_active_season_async()
+            message = await run_sheet_io(
+                build_elo_table_message,
                 scope=scope,
                 season=season,
                 mode=modus,
@@ -7313,21 +7993,26 @@ class LadderCog(commands.Cog):
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     @app_commands.command(
         name="tfnl_elo_rebuild",
-        description="Admin: Baut alle TFNL-ELO-Tabellen aus veröffentlichten Matches neu auf.",
+        description="Admin: Gleicht die TFNL-ELO-Tabellen mit den veröffentlichten Matches ab.",
+    )
+    @app_commands.describe(
+        vollstaendig="Wenn True: Tabellen komplett leeren und alles neu berechnen. Standard: False (inkrementell).",
     )
     @app_commands.checks.has_permissions(administrator=True)
-    async def tfnl_elo_rebuild(self, interaction: discord.Interaction):
+    async def tfnl_elo_rebuild(self, interaction: discord.Interaction, vollstaendig: bool = False):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
-            # Quellen genau einmal frisch laden und danach für Folgeausgaben im Cache halten.
-            matches_rows = load_matches_rows_all_combined(force_refresh=True)
-            schedule_rows = load_schedule_rows_all_combined(force_refresh=True)
-
-            stats = rebuild_elo_from_matches(
-                matches_rows=matches_rows,
-                schedule_rows=schedule_rows,
-            )
+            with sheet_priority(PRIORITY_ADMIN):
+                # Quellen genau einmal frisch laden und danach für Folgeausgaben im Cache halten.
+                matches_rows = await run_sheet_io(load_matches_rows_all_combined, force_refresh=True)
+                schedule_rows = await run_sheet_io(load_schedule_rows_all_combined, force_refresh=True)
+
+                stats = await run_sheet_io(
+                    rebuild_elo_from_matches if vollstaendig else update_elo_incremental,
+                    matches_rows,
+                    schedule_rows,
+                )
         except Exception as e:
             await interaction.followup.send(
                 f"ELO-Rebuild fehlgeschlagen:\n```{repr(e)}```",
@@ -7337,6 +8022,7 @@ class LadderCog(commands.Cog):
 
         await interaction.followup.send(
             "TFNL-ELO-Rebuild abgeschlossen.\n"
+            f"Modus: `{stats.get('mode', 'full')}`\n"
             f"Verarbeitete Matches: `{stats.get('processed_matches', 0)}`\n"
             f"Rating-Events: `{stats.get('processed_events', 0)}`\n"
             f"Übersprungene Matches: `{stats.get('skipped_matches', 0)}`",
@@ -7348,21 +8034,26 @@ class LadderCog(commands.Cog):
         name="tfnl_elo_rebuild_publish",
         description="Admin: Baut TFNL-ELO neu auf und postet danach die Tabellen quota-schonend.",
     )
+    @app_commands.describe(
+        vollstaendig="Wenn True: Tabellen komplett leeren und alles neu berechnen. Standard: False (inkrementell).",
+    )
     @app_commands.checks.has_permissions(administrator=True)
-    async def tfnl_elo_rebuild_publish(self, interaction: discord.Interaction):
+    async def tfnl_elo_rebuild_publish(self, interaction: discord.Interaction, vollstaendig: bool = False):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
-            matches_rows = load_matches_rows_all_combined(force_refresh=True)
-            schedule_rows = load_schedule_rows_all_combined(force_refresh=True)
-
-            stats = rebuild_elo_from_matches(
-                matches_rows=matches_rows,
-                schedule_rows=schedule_rows,
-            )
+            with sheet_priority(PRIORITY_ADMIN):
+                matches_rows = await run_sheet_io(load_matches_rows_all_combined, force_refresh=True)
+                schedule_rows = await run_sheet_io(load_schedule_rows_all_combined, force_refresh=True)
+
+                stats = await run_sheet_io(
+                    rebuild_elo_from_matches if vollstaendig else update_elo_incremental,
+                    matches_rows,
+                    schedule_rows,
+                )
 
-            # Direkt danach posten, ohne die Quellen erneut frisch aus Google zu ziehen.
-            await self.publish_standings_to_channel()
+                # Direkt danach posten, ohne die Quellen erneut frisch aus Google zu ziehen.
+                await self.publish_standings_to_channel()
         except Exception as e:
             await interaction.followup.send(
                 f"ELO-Rebuild + Tabellenposting fehlgeschlagen:\n```{repr(e)}```",
@@ -7372,6 +8063,7 @@ class LadderCog(commands.Cog):
 
         await interaction.followup.send(
             "TFNL-ELO-Rebuild abgeschlossen und Tabellen neu gepostet.\n"
+            f"Modus: `{stats.get('mode', 'full')}`\n"
             f"Verarbeitete Matches: `{stats.get('processed_matches', 0)}`\n"
             f"Rating-Events: `{stats.get('processed_events', 0)}`\n"
             f"Übersprungene Matches: `{stats.get('skipped_matches', 0)}`",
@@ -7388,7 +8080,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
-            status = ensure_ladder_elo_sheets()
+            status = await run_sheet_io(ensure_ladder_elo_sheets)
             self.elo_sheet_setup_status = status
         except Exception as e:
             await interaction.followup.send(
@@ -7441,7 +8133,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            embed = build_schedule_embed(days=5)
+            embed = await run_sheet_io(build_schedule_embed, days=5)
         except Exception as e:
             await interaction.followup.send(
                 f"Fehler beim Lesen des TFNL-Sheets:\n```{repr(e)}```",
@@ -7532,11 +8224,13 @@ class LadderCog(commands.Cog):
 
         try:
             async with self.sheet_write_lock:
-                stats = archive_season(
-                    selected_season,
-                    delete_from_live=delete_from_live,
-                    sheet_name=sheet.value,
-                )
+                with sheet_priority(PRIORITY_ADMIN):
+                    stats = await run_sheet_io(
+                        archive_season,
+                        selected_season,
+                        delete_from_live=delete_from_live,
+                        sheet_name=sheet.value,
+                    )
 
         except Exception as e:
             await interaction.followup.send(
@@ -7591,10 +8285,11 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
-            async with self.sheet_write_lock:
-                stats = rebuild_players_from_published_matches()
+            with sheet_priority(PRIORITY_ADMIN):
+                async with self.sheet_write_lock:
+                    stats = await run_sheet_io(rebuild_players_from_published_matches)
 
-            await self.publish_standings_to_channel()
+                await self.publish_standings_to_channel()
 
         except Exception as e:
             await interaction.followup.send(
@@ -7752,7 +8447,7 @@ class LadderCog(commands.Cog):
         await interaction.response.defer(ephemeral=False)
 
         try:
-            messages = build_mode_standings_messages(modus.value)
+            messages = await run_sheet_io(build_mode_standings_messages, modus.value)
         except Exception as e:
             await interaction.followup.send(
                 f"Fehler beim Erstellen der Modus-Tabelle:\n```{repr(e)}```",
@@ -7917,7 +8612,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        _, schedule_row = find_schedule_row(normalized_slot_id)
+        _, schedule_row = await run_sheet_io(find_schedule_row, normalized_slot_id)
 
         if not schedule_row:
             await interaction.followup.send(
@@ -7926,7 +8621,7 @@ class LadderCog(commands.Cog):
             )
             return
 
-        blockers = get_slot_completion_blockers(normalized_slot_id)
+        blockers = await run_sheet_io(get_slot_completion_blockers, normalized_slot_id)
 
         if blockers:
             preview = "\n".join(f"- {blocker}" for blocker in blockers[:15])
@@ -7988,7 +8683,7 @@ class LadderCog(commands.Cog):
     async def ladder_slotids_fix(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        changes = ensure_unique_schedule_slot_ids()
+        changes = await run_sheet_io(ensure_unique_schedule_slot_ids)
 
         if not changes:
             await interaction.followup.send(
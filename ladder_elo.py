@@ -192,6 +192,92 @@ def calculate_3way_results(
     return results
 
 
+class EloBatchReplay:
+    """
+    Rating-Zustand für Batch-Replays (kompletter Rebuild).
+
+    Rating-Keys werden auf Integer-IDs abgebildet, Elo und Ergebniszähler
+    liegen in flachen Listen. Die Rechnung ist bewusst identisch zu
+    calculate_new_elo() (gleiche Ausdrücke, gleiche Reihenfolge), spart aber
+    pro Spieler Funktionsaufrufe, Dict-Zugriffe und Objekt-Erzeugung.
+    """
+
+    def __init__(self, k_factor: float = DEFAULT_K_FACTOR, start_elo: float = START_ELO):
+        self.k_factor = k_factor
+        self.start_elo = float(start_elo)
+        self.key_ids: dict[tuple, int] = {}
+        self.keys: list[tuple] = []
+        self.elo: list[float] = []
+        self.wins: list[int] = []
+        self.draws: list[int] = []
+        self.lose: list[int] = []
+
+    def key_id(self, key: tuple) -> int:
+        key_id = self.key_ids.get(key)
+
+        if key_id is None:
+            key_id = len(self.keys)
+            self.key_ids[key] = key_id
+            self.keys.append(key)
+            self.elo.append(self.start_elo)
+            self.wins.append(0)
+            self.draws.append(0)
+            self.lose.append(0)
+
+        return key_id
+
+    def apply(
+        self,
+        key_ids: list[int],
+        scores: list[float],
+        result_types: list[str],
+    ) -> list[tuple[int, float, float, float, float] | None]:
+        """
+        Wendet ein Match in einem Scope an.
+        Liefert pro Spieler (Position, Elo vorher, Gegner-Elo, Elo nachher, Änderung)
+        oder None, wenn der Spieler keinen Gegner hatte.
+        """
+        elo = self.elo
+        k_factor = self.k_factor
+        old = [elo[key_id] for key_id in key_ids]
+        count = len(key_ids)
+        results: list[tuple[int, float, float, float, float] | None] = []
+
+        for position in range(count):
+            own_id = key_ids[position]
+            opponent_total = 0
+            opponents = 0
+
+            for other in range(count):
+                if key_ids[other] != own_id:
+                    opponent_total += old[other]
+                    opponents += 1
+
+            if not opponents:
+                results.append(None)
+                continue
+
+            opponent_elo = opponent_total / opponents
+            elo_before = old[position]
+            expected = expected_score(elo_before, opponent_elo)
+            change = k_factor * (scores[position] - expected)
+            elo_after = elo_before + change
+
+            result_type = result_types[position]
+
+            if result_type == "Sieg":
+                self.wins[own_id] += 1
+            elif result_type == "Remis":
+                self.draws[own_id] += 1
+            else:
+                self.lose[own_id] += 1
+
+            elo[own_id] = elo_after
+            results.append((position, elo_before, opponent_elo, elo_after, change))
+
+        return results
+
+
 def calculate_pairing_elo(
     season_mode_elo,
     alltime_mode_elo,
@@ -15,11 +15,12 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 
 from sheet_guard import (
     get_all_records_cached,
+    queue_cell_updates,
     row_values_cached,
+    set_sheet_ttl_policy,
     sheet_write_call,
     invalidate_cache as invalidate_global_sheet_cache,
 )
@@ -30,6 +31,8 @@ from ladder_elo import (
     SCOPE_SEASON_MODE,
     SCOPE_ALLTIME_OVERALL,
     SCOPE_ALLTIME_MODE,
+    ELO_SCOPES,
+    EloBatchReplay,
     PairingPlayer,
     calculate_new_elo,
     calculate_pairing_elo,
@@ -37,6 +40,8 @@ from ladder_elo import (
     create_elo_pairings,
     sort_standings_rows,
 )
+from ladder_store import LADDER_STORE
+from sheets_client import get_spreadsheet as get_shared_spreadsheet, get_worksheet, register_worksheet
 
 BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
@@ -50,11 +55,6 @@ CREDS_FILE = os.getenv(
     os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "credentials.json"),
 ).strip()
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 SETTINGS_SHEET_NAME = "Settings"
 SETTINGS_HEADERS = ["Key", "Value"]
 ACTIVE_SEASON_KEY = "ACTIVE_SEASON"
@@ -71,6 +71,13 @@ RATINGS_SHEET_NAME = "Ladder_Ratings"
 RATING_HISTORY_SHEET_NAME = "Ladder_RatingHistory"
 SEED_COMPARISON_SHEET_NAME = "Ladder_SeedComparison"
 
+# /laddertable und die Tabellenposts lesen Ladder_Ratings. Nach Ablauf des
+# kurzen Read-TTL wird bis zu diesem Fenster aus dem Cache geantwortet und
+# im Hintergrund aktualisiert. Eigene Writes invalidieren weiterhin sofort.
+ELO_SHEET_STALE_TTL_SECONDS = int(os.getenv("TFNL_ELO_SHEET_STALE_TTL_SECONDS", "900").strip())
+
+set_sheet_ttl_policy(RATINGS_SHEET_NAME, hard_ttl_seconds=ELO_SHEET_STALE_TTL_SECONDS)
+
 RATINGS_HEADERS = [
     "Player ID",
     "Player Name",
@@ -183,9 +190,7 @@ def format_elo_change_for_sheet(value) -> str:
 
 
 def get_spreadsheet():
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    client = gspread.authorize(creds)
-    return client.open_by_key(TFNL_SPREADSHEET_ID)
+    return get_shared_spreadsheet(TFNL_SPREADSHEET_ID, CREDS_FILE)
 
 
 def get_or_create_sheet(title: str, rows: int = 1000, cols: int = 30):
@@ -197,7 +202,7 @@ def get_or_create_sheet(title: str, rows: int = 1000, cols: int = 30):
     spreadsheet = get_spreadsheet()
 
     try:
-        sheet = spreadsheet.worksheet(title)
+        sheet = get_worksheet(spreadsheet, title)
     except gspread.WorksheetNotFound:
         sheet = sheet_write_call(
             lambda: spreadsheet.add_worksheet(title=title, rows=rows, cols=cols),
@@ -209,6 +214,7 @@ def get_or_create_sheet(title: str, rows: int = 1000, cols: int = 30):
                 f"cell:{title}:",
             ],
         )
+        register_worksheet(sheet)
 
     _WORKSHEET_CACHE[title] = sheet
     return sheet
@@ -313,12 +319,8 @@ def ensure_settings_sheet() -> str:
 
             sheet_write_call(
                 lambda: sheet.update_cell(row_index, 2, DEFAULT_ACTIVE_SEASON),
-                invalidate_prefixes=[
-                    f"records:{SETTINGS_SHEET_NAME}",
-                    f"values:{SETTINGS_SHEET_NAME}",
-                    f"row:{SETTINGS_SHEET_NAME}:",
-                    f"cell:{SETTINGS_SHEET_NAME}:",
-                ],
+                patch_sheet=SETTINGS_SHEET_NAME,
+                patch_rows={row_index: [(2, "Value", DEFAULT_ACTIVE_SEASON)]},
             )
             return DEFAULT_ACTIVE_SEASON
 
@@ -440,13 +442,16 @@ def get_history_sheet():
     return get_or_create_sheet(RATING_HISTORY_SHEET_NAME)
 
 
-def load_ratings_rows_with_index() -> list[tuple[int, dict]]:
-    rows = get_all_records_cached(
+def load_ratings_rows() -> list[dict]:
+    return get_all_records_cached(
         get_ratings_sheet,
         sheet_name=RATINGS_SHEET_NAME,
         ttl_seconds=30,
     )
-    return list(enumerate(rows, start=2))
+
+
+def load_ratings_rows_with_index() -> list[tuple[int, dict]]:
+    return list(enumerate(load_ratings_rows(), start=2))
 
 
 def load_history_rows() -> list[dict]:
@@ -548,17 +553,10 @@ def find_rating_row(
     scope: str,
 ) -> tuple[int | None, dict | None]:
     selected_season, selected_mode = scope_key_parts(scope, season, mode)
+    index = LADDER_STORE.ratings_by_key(load_ratings_rows())
+    key = (normalize_text(player_id), selected_season, selected_mode, normalize_text(scope))
 
-    for row_index, row in load_ratings_rows_with_index():
-        if (
-            normalize_text(row.get("Player ID")) == normalize_text(player_id)
-            and normalize_text(row.get("Season")) == selected_season
-            and normalize_text(row.get("Mode")) == selected_mode
-            and normalize_text(row.get("Scope")) == scope
-        ):
-            return row_index, row
-
-    return None, None
+    return index.get(key, (None, None))
 
 
 def get_rating_value(
@@ -619,12 +617,15 @@ def upsert_rating_row(
     ]
 
     if row_index:
-        sheet_write_call(
-            lambda: sheet.update(f"A{row_index}:L{row_index}", [values], value_input_option="USER_ENTERED"),
-            invalidate_prefixes=[
-                f"records:{RATINGS_SHEET_NAME}",
-                f"values:{RATINGS_SHEET_NAME}",
-                f"row:{RATINGS_SHEET_NAME}:",
+        # Bestehende Zeile: über den Write-Behind-Puffer, mehrere Matches kurz
+        # hintereinander landen so in einem batch_update.
+        queue_cell_updates(
+            get_ratings_sheet,
+            sheet_name=RATINGS_SHEET_NAME,
+            row_index=row_index,
+            cells=[
+                (col_index, column_name, value)
+                for col_index, (column_name, value) in enumerate(zip(RATINGS_HEADERS, values), start=1)
             ],
         )
     else:
@@ -909,181 +910,258 @@ def clear_elo_tables():
         )
 
 
-def rebuild_elo_from_matches(matches_rows: list[dict], schedule_rows: list[dict]) -> dict:
-    """
-    Baut ELO komplett neu auf.
-
-    Wichtig:
-    Diese Funktion arbeitet absichtlich speicherbasiert und schreibt am Ende gesammelt.
-    Dadurch werden beim Rebuild nicht pro Match mehrfach Ratings/History aus Google Sheets gelesen.
-    """
-    ensure_ladder_elo_sheets()
-    clear_elo_tables()
-
-    schedule_by_slot = {
-        normalize_text(row.get("Slot ID")): row
-        for row in schedule_rows
-        if normalize_text(row.get("Slot ID"))
-    }
-
-    ratings: dict[tuple[str, str, str, str], dict] = {}
-    history_rows: list[list] = []
-    created_at = now_text()
+def get_rating_state(
+    ratings: dict[tuple[str, str, str, str], dict],
+    player_id: str,
+    player_name: str,
+    season: str,
+    mode: str,
+    scope: str,
+) -> dict:
+    selected_season, selected_mode = scope_key_parts(scope, season, mode)
+    key = (normalize_text(player_id), selected_season, selected_mode, scope)
+
+    if key not in ratings:
+        ratings[key] = {
+            "player_id": normalize_text(player_id),
+            "player_name": normalize_text(player_name),
+            "season": selected_season,
+            "mode": selected_mode,
+            "scope": scope,
+            "elo": float(START_ELO),
+            "wins": 0,
+            "draws": 0,
+            "lose": 0,
+        }
 
-    scopes = [
-        SCOPE_SEASON_OVERALL,
-        SCOPE_SEASON_MODE,
-        SCOPE_ALLTIME_OVERALL,
-        SCOPE_ALLTIME_MODE,
-    ]
+    if normalize_text(player_name):
+        ratings[key]["player_name"] = normalize_text(player_name)
 
-    processed_matches = 0
-    processed_events = 0
-    skipped_matches = 0
+    return ratings[key]
 
-    def get_rating_state(player_id: str, player_name: str, season: str, mode: str, scope: str) -> dict:
-        selected_season, selected_mode = scope_key_parts(scope, season, mode)
-        key = (normalize_text(player_id), selected_season, selected_mode, scope)
-
-        if key not in ratings:
-            ratings[key] = {
-                "player_id": normalize_text(player_id),
-                "player_name": normalize_text(player_name),
-                "season": selected_season,
-                "mode": selected_mode,
-                "scope": scope,
-                "elo": float(START_ELO),
-                "wins": 0,
-                "draws": 0,
-                "lose": 0,
-            }
 
-        if normalize_text(player_name):
-            ratings[key]["player_name"] = normalize_text(player_name)
+def count_result(state: dict, result_type: str):
+    if result_type == "Sieg":
+        state["wins"] += 1
+    elif result_type == "Remis":
+        state["draws"] += 1
+    else:
+        state["lose"] += 1
 
-        return ratings[key]
 
-    for match_row in matches_rows:
-        if normalize_text(match_row.get("Veröffentlicht")).lower() != "ja":
-            continue
+def build_replay_match(
+    match_row: dict,
+    schedule_by_slot: dict[str, dict],
+    fallback_active_season: str,
+) -> dict | None:
+    """
+    Bereitet ein veröffentlichtes, beendetes Match für den ELO-Replay vor.
+    None: Match zählt (noch) nicht für ELO.
+    """
+    if normalize_text(match_row.get("Veröffentlicht")).lower() != "ja":
+        return None
 
-        if normalize_text(match_row.get("Status")).lower() != "finished":
-            continue
+    if normalize_text(match_row.get("Status")).lower() != "finished":
+        return None
 
-        match_id = normalize_text(match_row.get("Match ID"))
-        slot_id = normalize_text(match_row.get("Slot ID"))
-        race_type = normalize_text(match_row.get("Matchtyp"))
-        schedule_row = schedule_by_slot.get(slot_id, {})
+    slot_id = normalize_text(match_row.get("Slot ID"))
+    schedule_row = schedule_by_slot.get(slot_id, {})
 
-        season = (
+    return {
+        "match_id": normalize_text(match_row.get("Match ID")),
+        "slot_id": slot_id,
+        "race_type": normalize_text(match_row.get("Matchtyp")),
+        "season": (
             normalize_text(match_row.get("Season"))
             or normalize_text(schedule_row.get("Season"))
             or fallback_active_season
-        )
-        mode = (
+        ),
+        "mode": (
             normalize_text(schedule_row.get("Modus"))
             or normalize_text(match_row.get("Modus"))
             or "Unknown"
-        )
-        date_text = normalize_text(schedule_row.get("Datum"))
+        ),
+        "date_text": normalize_text(schedule_row.get("Datum")),
+        "players": parse_match_players(match_row),
+    }
 
-        players = parse_match_players(match_row)
 
-        if len(players) < 2:
-            skipped_matches += 1
-            continue
+def replay_match_elo(
+    ratings: dict[tuple[str, str, str, str], dict],
+    match: dict,
+    created_at: str,
+) -> list[list]:
+    """
+    Wendet ein Match auf den Rating-Zustand im Speicher an und liefert die
+    passenden History-Zeilen. Gleiche Rechnung wie process_match_elo().
+    """
+    players = match["players"]
+    history_rows: list[list] = []
 
-        match_had_events = False
+    for scope in ELO_SCOPES:
+        old_elos = {}
 
-        for scope in scopes:
-            old_elos = {}
+        for player in players:
+            state = get_rating_state(ratings, player["player_id"], player["name"], match["season"], match["mode"], scope)
+            old_elos[player["player_id"]] = float(state["elo"])
 
-            for player in players:
-                state = get_rating_state(
-                    player_id=player["player_id"],
-                    player_name=player["name"],
-                    season=season,
-                    mode=mode,
-                    scope=scope,
-                )
-                old_elos[player["player_id"]] = float(state["elo"])
+        for player in players:
+            opponents = [
+                other
+                for other in players
+                if other["player_id"] != player["player_id"]
+            ]
 
-            for player in players:
-                opponents = [
-                    other
-                    for other in players
-                    if other["player_id"] != player["player_id"]
-                ]
+            if not opponents:
+                continue
 
-                if not opponents:
-                    continue
+            state = get_rating_state(ratings, player["player_id"], player["name"], match["season"], match["mode"], scope)
 
-                state = get_rating_state(
-                    player_id=player["player_id"],
-                    player_name=player["name"],
-                    season=season,
-                    mode=mode,
-                    scope=scope,
-                )
+            opponent_elo = (
+                sum(old_elos[other["player_id"]] for other in opponents)
+                / len(opponents)
+            )
+            elo_before = old_elos[player["player_id"]]
+            elo_after, elo_change = calculate_new_elo(
+                elo_before,
+                opponent_elo,
+                player["score"],
+            )
 
-                opponent_elo = (
-                    sum(old_elos[other["player_id"]] for other in opponents)
-                    / len(opponents)
-                )
-                elo_before = old_elos[player["player_id"]]
-                elo_after, elo_change = calculate_new_elo(
-                    elo_before,
-                    opponent_elo,
+            count_result(state, player["result_type"])
+            state["elo"] = elo_after
+
+            opponent_info = ", ".join(
+                f"{opponent['name']} ({round(old_elos[opponent['player_id']], 1)})"
+                for opponent in opponents
+            )
+
+            history_rows.append(
+                [
+                    f"{match['match_id']}:{scope}:{player['player_id']}",
+                    match["season"],
+                    match["slot_id"],
+                    match["date_text"],
+                    match["mode"],
+                    match["race_type"],
+                    player["player_id"],
+                    player["name"],
+                    opponent_info,
+                    player["placement"],
                     player["score"],
-                )
+                    scope,
+                    format_elo(elo_before),
+                    format_elo(opponent_elo),
+                    format_elo(elo_after),
+                    format_elo_change_for_sheet(elo_change),
+                    player["result_type"],
+                    created_at,
+                ]
+            )
 
-                result_type = player["result_type"]
+    return history_rows
 
-                if result_type == "Sieg":
-                    state["wins"] += 1
-                elif result_type == "Remis":
-                    state["draws"] += 1
-                else:
-                    state["lose"] += 1
 
-                state["elo"] = elo_after
+def replay_matches_batch(
+    matches: list[dict],
+    created_at: str,
+) -> tuple[dict[tuple[str, str, str, str], dict], list[list], int]:
+    """
+    Batch-Variante von replay_match_elo() für komplette Rebuilds.
+    Liefert (Rating-Zustand, History-Zeilen, Anzahl Matches mit Events) –
+    ergebnisgleich zu einem Replay Match für Match.
+    """
+    engine = EloBatchReplay()
+    names: dict[int, str] = {}
+    scope_keys: dict[tuple[str, str, str], tuple[str, str]] = {}
+    history_rows: list[list] = []
+    processed_matches = 0
+
+    for match in matches:
+        players = match["players"]
+        player_ids = [player["player_id"] for player in players]
+        scores = [player["score"] for player in players]
+        result_types = [player["result_type"] for player in players]
+        match_had_events = False
+
+        for scope in ELO_SCOPES:
+            scope_key = (scope, match["season"], match["mode"])
+            selected = scope_keys.get(scope_key)
+
+            if selected is None:
+                selected = scope_key_parts(scope, match["season"], match["mode"])
+                scope_keys[scope_key] = selected
+
+            key_ids = [engine.key_id((player_id, selected[0], selected[1], scope)) for player_id in player_ids]
+
+            for key_id, player in zip(key_ids, players):
+                if player["name"]:
+                    names[key_id] = player["name"]
+
+            # Gerundete Vorher-Werte einmal pro Scope, für Elo Before und Opponent Info.
+            old_rounded = [round(engine.elo[key_id], 1) for key_id in key_ids]
+            labels = [f"{player['name']} ({rounded})" for player, rounded in zip(players, old_rounded)]
+
+            for result in engine.apply(key_ids, scores, result_types):
+                if result is None:
+                    continue
+
+                position, _, opponent_elo, elo_after, elo_change = result
+                player = players[position]
+                own_id = key_ids[position]
 
                 opponent_info = ", ".join(
-                    f"{opponent['name']} ({round(old_elos[opponent['player_id']], 1)})"
-                    for opponent in opponents
+                    [labels[other] for other in range(len(key_ids)) if key_ids[other] != own_id]
                 )
 
                 history_rows.append(
                     [
-                        f"{match_id}:{scope}:{player['player_id']}",
-                        season,
-                        slot_id,
-                        date_text,
-                        mode,
-                        race_type,
+                        f"{match['match_id']}:{scope}:{player['player_id']}",
+                        match["season"],
+                        match["slot_id"],
+                        match["date_text"],
+                        match["mode"],
+                        match["race_type"],
                         player["player_id"],
                         player["name"],
                         opponent_info,
                         player["placement"],
                         player["score"],
                         scope,
-                        format_elo(elo_before),
-                        format_elo(opponent_elo),
-                        format_elo(elo_after),
-                        format_elo_change_for_sheet(elo_change),
-                        result_type,
+                        # Entspricht format_elo()/format_elo_change_for_sheet() für float-Werte.
+                        str(old_rounded[position]),
+                        str(round(opponent_elo, 1)),
+                        str(round(elo_after, 1)),
+                        f"'{elo_change:+.1f}",
+                        player["result_type"],
                         created_at,
                     ]
                 )
-
-                processed_events += 1
                 match_had_events = True
 
         if match_had_events:
             processed_matches += 1
-        else:
-            skipped_matches += 1
 
+    ratings: dict[tuple[str, str, str, str], dict] = {}
+
+    for key_id, key in enumerate(engine.keys):
+        player_id, season, mode, scope = key
+        ratings[key] = {
+            "player_id": player_id,
+            "player_name": names.get(key_id, ""),
+            "season": season,
+            "mode": mode,
+            "scope": scope,
+            "elo": engine.elo[key_id],
+            "wins": engine.wins[key_id],
+            "draws": engine.draws[key_id],
+            "lose": engine.lose[key_id],
+        }
+
+    return ratings, history_rows, processed_matches
+
+
+def build_rating_sheet_rows(ratings: dict[tuple[str, str, str, str], dict], created_at: str) -> list[list]:
     rating_rows: list[list] = []
 
     for key in sorted(ratings.keys(), key=lambda item: (item[3], item[1], item[2], item[0])):
@@ -1112,8 +1190,11 @@ def rebuild_elo_from_matches(matches_rows: list[dict], schedule_rows: list[dict]
             ]
         )
 
+    return rating_rows
+
+
+def write_ratings_table(rating_rows: list[list]):
     ratings_sheet = get_ratings_sheet()
-    history_sheet = get_history_sheet()
 
     if rating_rows:
         sheet_write_call(
@@ -1124,32 +1205,395 @@ def rebuild_elo_from_matches(matches_rows: list[dict], schedule_rows: list[dict]
             ],
         )
 
-    if history_rows:
-        # In sinnvollen Blöcken schreiben, damit Google Sheets nicht an Payload-Größen scheitert.
-        chunk_size = 500
 
-        for index in range(0, len(history_rows), chunk_size):
-            chunk = history_rows[index:index + chunk_size]
-            sheet_write_call(
-                lambda chunk=chunk: history_sheet.append_rows(
-                    chunk,
-                    value_input_option="USER_ENTERED",
-                ),
-                invalidate_prefixes=[
-                    f"records:{RATING_HISTORY_SHEET_NAME}",
-                    f"values:{RATING_HISTORY_SHEET_NAME}",
-                ],
-            )
+def append_history_rows_chunked(history_rows: list[list]):
+    history_sheet = get_history_sheet()
+
+    # In sinnvollen Blöcken schreiben, damit Google Sheets nicht an Payload-Größen scheitert.
+    chunk_size = 500
+
+    for index in range(0, len(history_rows), chunk_size):
+        chunk = history_rows[index:index + chunk_size]
+        sheet_write_call(
+            lambda chunk=chunk: history_sheet.append_rows(
+                chunk,
+                value_input_option="USER_ENTERED",
+            ),
+            invalidate_prefixes=[
+                f"records:{RATING_HISTORY_SHEET_NAME}",
+                f"values:{RATING_HISTORY_SHEET_NAME}",
+            ],
+        )
+
+
+def rebuild_elo_from_matches(matches_rows: list[dict], schedule_rows: list[dict]) -> dict:
+    """
+    Baut ELO komplett neu auf.
+
+    Wichtig:
+    Diese Funktion arbeitet absichtlich speicherbasiert und schreibt am Ende gesammelt.
+    Dadurch werden beim Rebuild nicht pro Match mehrfach Ratings/History aus Google Sheets gelesen.
+    Für den Normalfall reicht update_elo_incremental().
+    """
+    ensure_ladder_elo_sheets()
+    clear_elo_tables()
+
+    schedule_by_slot = build_schedule_by_slot(schedule_rows)
+    fallback_active_season = get_active_season()
+
+    created_at = now_text()
+    replay_matches: list[dict] = []
+    skipped_matches = 0
+
+    for match_row in matches_rows:
+        match = build_replay_match(match_row, schedule_by_slot, fallback_active_season)
+
+        if match is None:
+            continue
+
+        if len(match["players"]) < 2:
+            skipped_matches += 1
+            continue
+
+        replay_matches.append(match)
+
+    ratings, history_rows, processed_matches = replay_matches_batch(replay_matches, created_at)
+    skipped_matches += len(replay_matches) - processed_matches
+
+    rating_rows = build_rating_sheet_rows(ratings, created_at)
+    write_ratings_table(rating_rows)
+    append_history_rows_chunked(history_rows)
+    reset_elo_checkpoint()
 
     return {
         "processed_matches": processed_matches,
-        "processed_events": processed_events,
+        "processed_events": len(history_rows),
         "skipped_matches": skipped_matches,
         "rating_rows": len(rating_rows),
         "history_rows": len(history_rows),
     }
 
 
+def build_schedule_by_slot(schedule_rows: list[dict]) -> dict[str, dict]:
+    return {
+        normalize_text(row.get("Slot ID")): row
+        for row in schedule_rows
+        if normalize_text(row.get("Slot ID"))
+    }
+
+
+# =========================================================
+# INKREMENTELLE ELO-ENGINE
+# =========================================================
+# Ladder_RatingHistory ist das Journal aller angewendeten Matches. Der
+# Rating-Zustand nach einem History-Präfix ist daraus eindeutig ableitbar
+# (letztes "Elo After" + Ergebniszähler pro Key). Der zuletzt abgeleitete
+# Zustand wird als Checkpoint (letzte Rating Event ID) im Prozess gehalten.
+#
+# update_elo_incremental():
+# - unveränderte Matches: nichts tun
+# - neue Matches (Event IDs fehlen in der History): nur diese anhängen
+# - geändertes/entferntes älteres Match: ab diesem Match neu rechnen
+#   (History ab dort ersetzen, Ratings neu schreiben)
+
+_ELO_CHECKPOINT: dict = {
+    "event_id": "",
+    "row_count": 0,
+    "ratings": {},
+}
+
+
+def reset_elo_checkpoint():
+    _ELO_CHECKPOINT.update({"event_id": "", "row_count": 0, "ratings": {}})
+
+
+def match_id_from_event_id(event_id: str) -> str:
+    parts = normalize_text(event_id).rsplit(":", 2)
+    return parts[0] if len(parts) == 3 else ""
+
+
+def fold_history_row(ratings: dict[tuple[str, str, str, str], dict], row: dict):
+    state = get_rating_state(
+        ratings,
+        row.get("Player ID"),
+        row.get("Player Name"),
+        normalize_text(row.get("Season")),
+        normalize_text(row.get("Mode")),
+        normalize_text(row.get("Elo Scope")),
+    )
+    state["elo"] = float_value(row.get("Elo After"), state["elo"])
+    count_result(state, normalize_text(row.get("Result Type")))
+
+
+def copy_ratings(ratings: dict[tuple[str, str, str, str], dict]) -> dict[tuple[str, str, str, str], dict]:
+    return {key: dict(state) for key, state in ratings.items()}
+
+
+def ratings_from_history(history_rows: list[dict], row_count: int) -> dict[tuple[str, str, str, str], dict]:
+    """
+    Rating-Zustand nach den ersten row_count History-Zeilen.
+    Setzt auf dem Checkpoint auf, wenn dessen Präfix unverändert ist.
+    """
+    checkpoint_count = _ELO_CHECKPOINT["row_count"]
+    start = 0
+    ratings: dict[tuple[str, str, str, str], dict] = {}
+
+    if (
+        0 < checkpoint_count <= row_count
+        and normalize_text(history_rows[checkpoint_count - 1].get("Rating Event ID")) == _ELO_CHECKPOINT["event_id"]
+    ):
+        ratings = copy_ratings(_ELO_CHECKPOINT["ratings"])
+        start = checkpoint_count
+
+    for row in history_rows[start:row_count]:
+        fold_history_row(ratings, row)
+
+    return ratings
+
+
+def store_elo_checkpoint(history_rows: list[list] | list[dict], ratings: dict[tuple[str, str, str, str], dict]):
+    if not history_rows:
+        reset_elo_checkpoint()
+        return
+
+    last_row = history_rows[-1]
+    event_id = last_row.get("Rating Event ID") if isinstance(last_row, dict) else last_row[0]
+
+    _ELO_CHECKPOINT.update(
+        {
+            "event_id": normalize_text(event_id),
+            "row_count": len(history_rows),
+            "ratings": copy_ratings(ratings),
+        }
+    )
+
+
+def history_match_signature(history_rows: list[dict]) -> tuple[list[str], dict[str, dict]]:
+    """
+    Reihenfolge der Matches im Journal + je Match die erfassten Events/Ergebnisse.
+    """
+    order: list[str] = []
+    signatures: dict[str, dict] = {}
+
+    for position, row in enumerate(history_rows):
+        event_id = normalize_text(row.get("Rating Event ID"))
+        match_id = match_id_from_event_id(event_id)
+
+        if not match_id:
+            continue
+
+        signature = signatures.get(match_id)
+
+        if signature is None:
+            signature = {
+                "first_row": position,
+                "last_row": position,
+                "events": set(),
+                "results": set(),
+                "season": normalize_text(row.get("Season")),
+                "mode": normalize_text(row.get("Mode")),
+            }
+            signatures[match_id] = signature
+            order.append(match_id)
+
+        signature["last_row"] = position
+        signature["events"].add(event_id)
+        signature["results"].add(
+            (normalize_text(row.get("Player ID")), normalize_text(row.get("Result Type")))
+        )
+
+    return order, signatures
+
+
+def match_signature(match: dict) -> dict:
+    return {
+        "events": {
+            f"{match['match_id']}:{scope}:{player['player_id']}"
+            for scope in ELO_SCOPES
+            for player in match["players"]
+        },
+        "results": {(player["player_id"], player["result_type"]) for player in match["players"]},
+        "season": match["season"],
+        "mode": match["mode"],
+    }
+
+
+def signature_matches(journal: dict, match: dict) -> bool:
+    expected = match_signature(match)
+    return all(journal[key] == expected[key] for key in ("events", "results", "season", "mode"))
+
+
+def update_elo_incremental(matches_rows: list[dict], schedule_rows: list[dict]) -> dict:
+    """
+    Bringt Ladder_Ratings/Ladder_RatingHistory inkrementell auf den Stand der Matches.
+    Fällt auf rebuild_elo_from_matches() zurück, wenn das Journal nicht
+    konsistent fortgeschrieben werden kann.
+    """
+    ensure_ladder_elo_sheets()
+
+    schedule_by_slot = build_schedule_by_slot(schedule_rows)
+    fallback_active_season = get_active_season()
+    created_at = now_text()
+
+    eligible: dict[str, dict] = {}
+    eligible_order: list[str] = []
+    skipped_matches = 0
+
+    for match_row in matches_rows:
+        match = build_replay_match(match_row, schedule_by_slot, fallback_active_season)
+
+        if match is None:
+            continue
+
+        if len(match["players"]) < 2 or not match["match_id"]:
+            skipped_matches += 1
+            continue
+
+        if match["match_id"] not in eligible:
+            eligible[match["match_id"]] = match
+            eligible_order.append(match["match_id"])
+
+    history_rows = get_all_records_cached(
+        get_history_sheet,
+        sheet_name=RATING_HISTORY_SHEET_NAME,
+        ttl_seconds=300,
+        force_refresh=True,
+    )
+    journal_order, journal = history_match_signature(history_rows)
+
+    # Frühestes Match im Journal, das nicht mehr zum aktuellen Stand passt.
+    rewind_at = len(journal_order)
+
+    for position, match_id in enumerate(journal_order):
+        match = eligible.get(match_id)
+
+        if match is None or not signature_matches(journal[match_id], match):
+            rewind_at = position
+            break
+
+    kept_matches = journal_order[:rewind_at]
+    keep_row_count = journal[journal_order[rewind_at]]["first_row"] if rewind_at < len(journal_order) else len(history_rows)
+
+    # Journal muss pro Match zusammenhängend sein, sonst lässt sich kein Präfix behalten.
+    if any(journal[match_id]["last_row"] >= keep_row_count for match_id in kept_matches):
+        stats = rebuild_elo_from_matches(matches_rows, schedule_rows)
+        stats["mode"] = "full"
+        return stats
+
+    ratings = ratings_from_history(history_rows, keep_row_count)
+    store_elo_checkpoint(history_rows[:keep_row_count], ratings)
+
+    kept = set(kept_matches)
+    replay_order = [match_id for match_id in journal_order[rewind_at:] if match_id in eligible]
+    replay_order += [match_id for match_id in eligible_order if match_id not in kept and match_id not in replay_order]
+
+    new_history_rows: list[list] = []
+    touched_keys: set[tuple[str, str, str, str]] = set()
+
+    for match_id in replay_order:
+        match = eligible[match_id]
+        new_history_rows.extend(replay_match_elo(ratings, match, created_at))
+
+        for scope in ELO_SCOPES:
+            selected_season, selected_mode = scope_key_parts(scope, match["season"], match["mode"])
+            touched_keys.update(
+                (player["player_id"], selected_season, selected_mode, scope)
+                for player in match["players"]
+            )
+
+    rewound = rewind_at < len(journal_order)
+
+    if rewound:
+        history_sheet = get_history_sheet()
+        first_dropped_row = keep_row_count + 2
+
+        sheet_write_call(
+            lambda: history_sheet.batch_clear([f"A{first_dropped_row}:R{history_sheet.row_count}"]),
+            invalidate_prefixes=[
+                f"records:{RATING_HISTORY_SHEET_NAME}",
+                f"values:{RATING_HISTORY_SHEET_NAME}",
+                f"row:{RATING_HISTORY_SHEET_NAME}:",
+            ],
+        )
+
+        # Ratings können beliebig betroffen sein (auch entfallene Keys): komplett neu schreiben.
+        clear_ratings_table()
+        write_ratings_table(build_rating_sheet_rows(ratings, created_at))
+    else:
+        write_rating_states(ratings, touched_keys, created_at)
+
+    append_history_rows_chunked(new_history_rows)
+
+    if new_history_rows:
+        _ELO_CHECKPOINT.update(
+            {
+                "event_id": normalize_text(new_history_rows[-1][0]),
+                "row_count": keep_row_count + len(new_history_rows),
+                "ratings": copy_ratings(ratings),
+            }
+        )
+
+    return {
+        "mode": "rewind" if rewound else "incremental",
+        "processed_matches": len(replay_order),
+        "processed_events": len(new_history_rows),
+        "skipped_matches": skipped_matches,
+        "kept_matches": len(kept_matches),
+        "checkpoint_event_id": _ELO_CHECKPOINT["event_id"],
+        "rating_rows": len(ratings),
+        "history_rows": keep_row_count + len(new_history_rows),
+    }
+
+
+def clear_ratings_table():
+    ratings_sheet = get_ratings_sheet()
+
+    if ratings_sheet.row_count > 1:
+        sheet_write_call(
+            lambda: ratings_sheet.batch_clear([f"A2:L{ratings_sheet.row_count}"]),
+            invalidate_prefixes=[
+                f"records:{RATINGS_SHEET_NAME}",
+                f"values:{RATINGS_SHEET_NAME}",
+                f"row:{RATINGS_SHEET_NAME}:",
+            ],
+        )
+
+
+def write_rating_states(
+    ratings: dict[tuple[str, str, str, str], dict],
+    keys: set[tuple[str, str, str, str]],
+    created_at: str,
+):
+    """
+    Schreibt nur die geänderten Rating-Zeilen: bestehende per Zellupdate,
+    neue gesammelt per append_rows.
+    """
+    if not keys:
+        return
+
+    index = LADDER_STORE.ratings_by_key(load_ratings_rows())
+    new_rows: list[list] = []
+
+    for row in build_rating_sheet_rows({key: ratings[key] for key in keys}, created_at):
+        key = (row[0], row[2], row[3], row[4])
+        row_index, _ = index.get(key, (None, None))
+
+        if row_index:
+            queue_cell_updates(
+                get_ratings_sheet,
+                sheet_name=RATINGS_SHEET_NAME,
+                row_index=row_index,
+                cells=[
+                    (col_index, column_name, value)
+                    for col_index, (column_name, value) in enumerate(zip(RATINGS_HEADERS, row), start=1)
+                ],
+            )
+        else:
+            new_rows.append(row)
+
+    write_ratings_table(new_rows)
+
+
 def build_standings_rows(scope: str, season: str, mode: str = "", limit: int | None = None) -> list[dict]:
     ensure_ladder_elo_sheets()
 
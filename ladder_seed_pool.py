@@ -0,0 +1,220 @@
+# ladder_seed_pool.py
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+
+# =========================================================
+# SEED POOL
+# =========================================================
+# Vorab erzeugte TFNL-Seeds pro Modus. Ein Hintergrund-Task füllt den Pool für
+# Slots der nächsten Stunden auf, beim Seed-Schritt wird nur noch ein fertiger,
+# bereits validierter Seed entnommen. Dieses Modul enthält bewusst keine
+# Discord-, Sheet- oder HTTP-Logik: Der Generator wird von außen übergeben
+# (generate_tfnl_seed_for_mode in ladder.py).
+
+SEED_POOL_VERSION = "tfnl-seed-pool-v1"
+print(f"[SEED_POOL] geladen: {SEED_POOL_VERSION}")
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default)).strip()))
+    except ValueError:
+        return default
+
+
+# Pool-Datei überlebt Neustarts. Leer = nur im Speicher.
+SEED_POOL_PATH = os.getenv("TFNL_SEED_POOL_PATH", "tfnl_seed_pool.json").strip()
+SEED_POOL_MAX_AGE_HOURS = _env_int("TFNL_SEED_POOL_MAX_AGE_HOURS", 24, minimum=1)
+SEED_POOL_MAX_PER_MODE = _env_int("TFNL_SEED_POOL_MAX_PER_MODE", 4, minimum=1)
+# Welcher Generator die Seeds erzeugt. Einträge eines anderen Generators (z. B.
+# Stub-Seeds nach Abschalten von TFNL_SEED_STUB_GENERATOR) werden verworfen.
+SEED_POOL_GENERATOR_TAG = (
+    "stub"
+    if os.getenv("TFNL_SEED_STUB_GENERATOR", "0").strip().lower() in ("1", "true", "yes", "ja", "on")
+    else "live"
+)
+
+SeedGenerator = Callable[[str], Awaitable[tuple[str, dict]]]
+
+
+def normalize_text(value) -> str:
+    return str(value or "").strip()
+
+
+class SeedPool:
+    def __init__(
+        self,
+        path: str = SEED_POOL_PATH,
+        max_age_seconds: int = SEED_POOL_MAX_AGE_HOURS * 3600,
+        max_per_mode: int = SEED_POOL_MAX_PER_MODE,
+        generator_tag: str = SEED_POOL_GENERATOR_TAG,
+    ):
+        self.path = path
+        self.generator_tag = generator_tag
+        self.max_age_seconds = max_age_seconds
+        self.max_per_mode = max_per_mode
+        # Modus (kanonisch) -> Einträge, älteste zuerst
+        self._entries: dict[str, list[dict]] = {}
+        self._fill_locks: dict[str, asyncio.Lock] = {}
+        self._load()
+
+    # -----------------------------------------------------
+    # Persistenz
+    # -----------------------------------------------------
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except Exception as exc:
+            print(f"[SEED_POOL] Pool-Datei konnte nicht gelesen werden: {repr(exc)}")
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        for mode, entries in data.items():
+            if isinstance(entries, list):
+                self._entries[mode] = [entry for entry in entries if isinstance(entry, dict)]
+
+        if self.prune():
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+
+        try:
+            # Atomar ersetzen, damit ein Absturz keine halbe Datei hinterlässt.
+            fd, tmp_path = tempfile.mkstemp(prefix=".seed_pool_", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self._entries, handle, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as exc:
+            print(f"[SEED_POOL] Pool-Datei konnte nicht geschrieben werden: {repr(exc)}")
+
+    # -----------------------------------------------------
+    # Zugriff
+    # -----------------------------------------------------
+
+    def prune(self) -> int:
+        """
+        Entfernt abgelaufene Seeds und Seeds eines anderen Generators.
+        Gibt die Anzahl entfernter Einträge zurück.
+        """
+        cutoff = time.time() - self.max_age_seconds
+        removed = 0
+
+        for mode in list(self._entries):
+            entries = self._entries[mode]
+            fresh = [
+                entry
+                for entry in entries
+                if float(entry.get("created_at") or 0) >= cutoff
+                and entry.get("generator") == self.generator_tag
+            ]
+            removed += len(entries) - len(fresh)
+
+            if fresh:
+                self._entries[mode] = fresh
+            else:
+                del self._entries[mode]
+
+        return removed
+
+    def available(self, mode: str) -> int:
+        return len(self._entries.get(mode, ()))
+
+    def counts(self) -> dict[str, int]:
+        return {mode: len(entries) for mode, entries in self._entries.items()}
+
+    def add(self, mode: str, seed_url: str, diagnostics: dict | None = None):
+        diagnostics = dict(diagnostics or {})
+        self._entries.setdefault(mode, []).append(
+            {
+                "seed_url": normalize_text(seed_url),
+                "seed_hash": normalize_text(diagnostics.get("seed_hash")),
+                "diagnostics": diagnostics,
+                "generator": self.generator_tag,
+                "created_at": time.time(),
+            }
+        )
+        self._save()
+
+    def take(self, mode: str) -> dict | None:
+        """
+        Entnimmt den ältesten gültigen Seed für den Modus (oder None).
+        Ein entnommener Seed wird sofort aus der Pool-Datei entfernt, damit er
+        nie zwei Slots zugewiesen wird.
+        """
+        removed = self.prune()
+        entries = self._entries.get(mode)
+
+        if not entries:
+            if removed:
+                self._save()
+            return None
+
+        entry = entries.pop(0)
+
+        if not entries:
+            del self._entries[mode]
+
+        self._save()
+        return entry
+
+    # -----------------------------------------------------
+    # Auffüllen
+    # -----------------------------------------------------
+
+    async def fill(self, demand: dict[str, int], generator: SeedGenerator) -> tuple[int, list[str]]:
+        """
+        Erzeugt pro Modus so viele Seeds, bis der Bedarf (gedeckelt auf
+        max_per_mode) gedeckt ist. Seeds werden nacheinander erzeugt, um die
+        Generator-APIs nicht zu fluten.
+
+        Rückgabe: (Anzahl erzeugter Seeds, Fehlertexte)
+        """
+        if self.prune():
+            self._save()
+
+        generated = 0
+        errors = []
+
+        for mode, wanted in demand.items():
+            lock = self._fill_locks.setdefault(mode, asyncio.Lock())
+
+            async with lock:
+                missing = min(int(wanted), self.max_per_mode) - self.available(mode)
+
+                for _ in range(max(0, missing)):
+                    try:
+                        seed_url, diagnostics = await generator(mode)
+                    except Exception as exc:
+                        errors.append(f"{mode}: {repr(exc)}")
+                        # Nächster Versuch erst im nächsten Durchlauf.
+                        break
+
+                    if not normalize_text(seed_url):
+                        errors.append(f"{mode}: Generator lieferte keine Seed URL.")
+                        break
+
+                    self.add(mode, seed_url, diagnostics)
+                    generated += 1
+
+        return generated, errors
+
+
+SEED_POOL = SeedPool()
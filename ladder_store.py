@@ -0,0 +1,124 @@
+# ladder_store.py
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+
+# =========================================================
+# LADDER STORE
+# =========================================================
+# Hash-Indizes über die Sheet-Snapshots aus sheet_guard.
+# sheet_guard liefert unveränderliche Snapshots: Solange sich das Objekt nicht
+# ändert, ändern sich auch die Daten nicht. Ein Index wird deshalb pro
+# Snapshot-Version (Identität + Season) genau einmal gebaut und danach von
+# allen Lookup-Helpern geteilt. Lookups nach Slot ID / Match ID / Spieler
+# werden dadurch O(1) statt eines Scans über alle Zeilen.
+
+
+def normalize_text(value) -> str:
+    return str(value or "").strip()
+
+
+class LadderStore:
+    def __init__(self):
+        # Name -> (Snapshot, Variante, Index)
+        self._indexes: dict[str, tuple[Any, Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_index(self, name: str, rows, variant, builder: Callable[[], Any]):
+        with self._lock:
+            cached = self._indexes.get(name)
+
+            if cached is not None and cached[0] is rows and cached[1] == variant:
+                return cached[2]
+
+        # Bauen außerhalb des Locks. Parallel gebaute Indizes sind identisch,
+        # der letzte gewinnt.
+        index = builder()
+
+        with self._lock:
+            self._indexes[name] = (rows, variant, index)
+
+        return index
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    @staticmethod
+    def _season_rows(rows, season: str):
+        selected_season = normalize_text(season)
+
+        for row_index, row in enumerate(rows, start=2):
+            if normalize_text(row.get("Season")) == selected_season:
+                yield row_index, row
+
+    def schedule_by_slot(self, rows, season: str) -> dict[str, tuple[int, dict]]:
+        """
+        Slot ID -> (Zeilenindex, Zeile). Bei Duplikaten gewinnt die erste Zeile.
+        """
+        def build():
+            index = {}
+            for row_index, row in self._season_rows(rows, season):
+                index.setdefault(normalize_text(row.get("Slot ID")), (row_index, row))
+            return index
+
+        return self._get_index("schedule_by_slot", rows, normalize_text(season), build)
+
+    def matches_by_id(self, rows, season: str) -> dict[str, tuple[int, dict]]:
+        """
+        Match ID -> (Zeilenindex, Zeile). Bei Duplikaten gewinnt die erste Zeile.
+        """
+        def build():
+            index = {}
+            for row_index, row in self._season_rows(rows, season):
+                index.setdefault(normalize_text(row.get("Match ID")), (row_index, row))
+            return index
+
+        return self._get_index("matches_by_id", rows, normalize_text(season), build)
+
+    def matches_by_slot(self, rows, season: str) -> dict[str, tuple[dict, ...]]:
+        """
+        Slot ID -> Matches in Sheet-Reihenfolge.
+        """
+        def build():
+            grouped: dict[str, list[dict]] = {}
+            for _, row in self._season_rows(rows, season):
+                grouped.setdefault(normalize_text(row.get("Slot ID")), []).append(row)
+            return {slot_id: tuple(slot_rows) for slot_id, slot_rows in grouped.items()}
+
+        return self._get_index("matches_by_slot", rows, normalize_text(season), build)
+
+    def signups_by_slot(self, rows, season: str) -> dict[str, tuple[dict, ...]]:
+        """
+        Slot ID -> Signup-Zeilen in Sheet-Reihenfolge (alle Status).
+        """
+        def build():
+            grouped: dict[str, list[dict]] = {}
+            for _, row in self._season_rows(rows, season):
+                grouped.setdefault(normalize_text(row.get("Slot ID")), []).append(row)
+            return {slot_id: tuple(slot_rows) for slot_id, slot_rows in grouped.items()}
+
+        return self._get_index("signups_by_slot", rows, normalize_text(season), build)
+
+    def ratings_by_key(self, rows) -> dict[tuple[str, str, str, str], tuple[int, dict]]:
+        """
+        (Player ID, Season, Mode, Scope) -> (Zeilenindex, Zeile) für Ladder_Ratings.
+        """
+        def build():
+            index = {}
+            for row_index, row in enumerate(rows, start=2):
+                key = (
+                    normalize_text(row.get("Player ID")),
+                    normalize_text(row.get("Season")),
+                    normalize_text(row.get("Mode")),
+                    normalize_text(row.get("Scope")),
+                )
+                index.setdefault(key, (row_index, row))
+            return index
+
+        return self._get_index("ratings_by_key", rows, None, build)
+
+
+LADDER_STORE = LadderStore()
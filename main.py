@@ -5,12 +5,12 @@ from discord.ext import commands
 from dotenv import load_dotenv
 import os
 import datetime
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 import asyncio
 from aiohttp import web
 from datetime import datetime as dt, timedelta
 
+from sheets_client import get_gspread_client, get_spreadsheet_by_title, get_worksheet
+
 # =========================================================
 # .env laden / Konfiguration
 # =========================================================
@@ -325,16 +325,14 @@ TWITCH_MAP = {
 # =========================================================
 # Google Sheets
 # =========================================================
-SCOPE = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
 SPREADSHEET_TITLE = os.getenv("SPREADSHEET_TITLE", "Season #4 - Spielbetrieb")
 
 SHEETS_ENABLED = True
 GC = WB = None
 
 try:
-    CREDS = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    GC = gspread.authorize(CREDS)
-    WB = GC.open(SPREADSHEET_TITLE)
+    GC = get_gspread_client(CREDS_FILE)
+    WB = get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
     print("✅ Google Sheets verbunden (ohne Master-Tab)")
 except Exception as e:
     SHEETS_ENABLED = False
@@ -461,7 +459,7 @@ class TerminModal(discord.ui.Modal, title="Neues TFL-Match eintragen"):
 # =========================================================
 def load_open_games_for_result(div_number: str):
     sheets_required()
-    ws = WB.worksheet(f"{div_number}.DIV")
+    ws = get_worksheet(WB, f"{div_number}.DIV")
     rows = ws.get_all_values()
 
     out = []
@@ -733,7 +731,7 @@ class ResultEntryModal(discord.ui.Modal, title="Ergebnis eintragen"):
 
         try:
             sheets_required()
-            ws = WB.worksheet(f"{self.division}.DIV")
+            ws = get_worksheet(WB, f"{self.division}.DIV")
 
             now = dt.now(BERLIN_TZ)
             now_str = now.strftime("%d.%m.%Y %H:%M")
@@ -839,7 +837,7 @@ async def result(interaction: discord.Interaction):
 def list_div_players(div_number: str):
     try:
         sheets_required()
-        ws = WB.worksheet(f"{div_number}.DIV")
+        ws = get_worksheet(WB, f"{div_number}.DIV")
         return _collect_players_from_div_ws(ws)
     except Exception:
         return []
@@ -847,7 +845,7 @@ def list_div_players(div_number: str):
 
 def playerexit_apply(div_number: str, quitting_player: str, reporter: str):
     sheets_required()
-    ws = WB.worksheet(f"{div_number}.DIV")
+    ws = get_worksheet(WB, f"{div_number}.DIV")
     rows = ws.get_all_values()
 
     now_str = dt.now(BERLIN_TZ).strftime("%d.%m.%Y %H:%M")
@@ -1203,7 +1201,7 @@ def list_streichungen(div_number: str):
     - Streichmodus/-info: M2-M9 und N2-N9
     """
     sheets_required()
-    ws = WB.worksheet(f"{div_number}.DIV")
+    ws = get_worksheet(WB, f"{div_number}.DIV")
     rows = ws.get_all_values()
 
     eintraege = []
@@ -1233,7 +1231,7 @@ def list_rest_players(div_number: str) -> list[str]:
     Doppelte Einträge werden entfernt, Reihenfolge bleibt erhalten.
     """
     sheets_required()
-    ws = WB.worksheet(f"{div_number}.DIV")
+    ws = get_worksheet(WB, f"{div_number}.DIV")
     rows = ws.get_all_values()
 
     players = []
@@ -1259,7 +1257,7 @@ def list_restprogramm(div_number: str, player_name: str):
     an denen der angegebene Spieler beteiligt ist.
     """
     sheets_required()
-    ws = WB.worksheet(f"{div_number}.DIV")
+    ws = get_worksheet(WB, f"{div_number}.DIV")
     rows = ws.get_all_values()
 
     matches = []
@@ -1292,7 +1290,7 @@ def list_restprogramm(div_number: str, player_name: str):
 def _get_div_ws(div_number: str):
     sheets_required()
     ws_name = f"{div_number}.DIV"
-    return WB.worksheet(ws_name)
+    return get_worksheet(WB, ws_name)
 
 
 def spielplan_read_players(div_number: str):
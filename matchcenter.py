@@ -7,11 +7,10 @@ from datetime import datetime as dt, timedelta
 
 import discord
 import pytz
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     acell_cached,
@@ -19,6 +18,7 @@ from sheet_guard import (
     get_all_values_cached,
     sheet_write_call,
 )
+from sheets_client import get_gspread_client, get_spreadsheet_by_title, get_worksheet
 
 # =========================================================
 # ENV / CONFIG
@@ -150,11 +150,6 @@ TWITCH_MAP = {
 # GOOGLE SHEETS
 # =========================================================
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 SHEETS_ENABLED = True
 GC = None
 WB = None
@@ -162,9 +157,8 @@ _WORKSHEET_NAME_CACHE = {}
 _WORKSHEET_GID_CACHE = {}
 
 try:
-    CREDS = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    GC = gspread.authorize(CREDS)
-    WB = GC.open(SPREADSHEET_TITLE)
+    GC = get_gspread_client(CREDS_FILE)
+    WB = get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
     print("✅ matchcenter Google Sheets verbunden")
 except Exception as e:
     SHEETS_ENABLED = False
@@ -183,7 +177,7 @@ def get_cached_worksheet_by_name(sheet_name: str):
     if sheet_name in _WORKSHEET_NAME_CACHE:
         return _WORKSHEET_NAME_CACHE[sheet_name]
 
-    ws = WB.worksheet(sheet_name)
+    ws = get_worksheet(WB, sheet_name)
     _WORKSHEET_NAME_CACHE[sheet_name] = ws
     return ws
 
@@ -250,13 +244,13 @@ def get_worksheet_by_gid(workbook, gid: int):
     if gid in _WORKSHEET_GID_CACHE:
         return _WORKSHEET_GID_CACHE[gid]
 
-    for ws in workbook.worksheets():
-        _WORKSHEET_GID_CACHE[int(ws.id)] = ws
-
-    if gid in _WORKSHEET_GID_CACHE:
-        return _WORKSHEET_GID_CACHE[gid]
+    try:
+        ws = get_worksheet(workbook, gid=gid)
+    except WorksheetNotFound:
+        raise RuntimeError(f"Worksheet mit gid={gid} nicht gefunden.")
 
-    raise RuntimeError(f"Worksheet mit gid={gid} nicht gefunden.")
+    _WORKSHEET_GID_CACHE[gid] = ws
+    return ws
 
 
 def get_runner_modes() -> list[str]:
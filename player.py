@@ -6,12 +6,16 @@ import unicodedata
 import discord
 from discord import app_commands
 from discord.ext import commands
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     col_values_cached,
     row_values_cached,
+    set_sheet_ttl_policy,
     sheet_write_call,
 )
+from sheets_client import get_worksheet
+from division_data import get_division_snapshot
 
 import signup
 import asnyc
@@ -68,6 +72,12 @@ print(f"[PLAYER] geladen: {PLAYER_PERFORMANCE_VERSION}")
 
 PLAYER_SHEET_CACHE_TTL_SECONDS = int(os.getenv("PLAYER_SHEET_CACHE_TTL_SECONDS", "120"))
 PLAYER_MODE_CACHE_TTL_SECONDS = int(os.getenv("PLAYER_MODE_CACHE_TTL_SECONDS", "300"))
+# /player-Menüs antworten nach Ablauf des TTL noch so lange aus dem Cache,
+# während im Hintergrund neu geladen wird.
+PLAYER_SHEET_STALE_TTL_SECONDS = int(os.getenv("PLAYER_SHEET_STALE_TTL_SECONDS", "900"))
+
+for _div_number in range(1, 7):
+    set_sheet_ttl_policy(f"{_div_number}.DIV", hard_ttl_seconds=PLAYER_SHEET_STALE_TTL_SECONDS)
 
 _PLAYER_WORKSHEET_CACHE_BY_NAME = {}
 _PLAYER_WORKSHEET_CACHE_BY_GID = {}
@@ -119,14 +129,13 @@ def get_worksheet_by_gid(workbook, gid: int):
     if gid in _PLAYER_WORKSHEET_CACHE_BY_GID:
         return _PLAYER_WORKSHEET_CACHE_BY_GID[gid]
 
-    for ws in workbook.worksheets():
-        _PLAYER_WORKSHEET_CACHE_BY_GID[int(ws.id)] = ws
-        _PLAYER_WORKSHEET_CACHE_BY_NAME[getattr(ws, "title", "")] = ws
-
-    if gid in _PLAYER_WORKSHEET_CACHE_BY_GID:
-        return _PLAYER_WORKSHEET_CACHE_BY_GID[gid]
+    try:
+        ws = get_worksheet(workbook, gid=gid)
+    except WorksheetNotFound:
+        raise RuntimeError(f"Worksheet mit gid={gid} nicht gefunden.")
 
-    raise RuntimeError(f"Worksheet mit gid={gid} nicht gefunden.")
+    _PLAYER_WORKSHEET_CACHE_BY_GID[gid] = ws
+    return ws
 
 
 def get_player_division_worksheet(div_number: int):
@@ -135,7 +144,7 @@ def get_player_division_worksheet(div_number: int):
     if sheet_name in _PLAYER_WORKSHEET_CACHE_BY_NAME:
         return _PLAYER_WORKSHEET_CACHE_BY_NAME[sheet_name]
 
-    ws = restinfo.WB.worksheet(sheet_name)
+    ws = get_worksheet(restinfo.WB, sheet_name)
     _PLAYER_WORKSHEET_CACHE_BY_NAME[sheet_name] = ws
     return ws
 
@@ -155,12 +164,30 @@ def player_invalidate_prefixes(ws, fallback: str = "PlayerSheet") -> list[str]:
     ]
 
 
+def _column_l_rows_by_name(snapshot) -> dict[str, tuple[int, int]]:
+    """
+    Normalisierter Name aus Spalte L -> (Division, Zeile).
+    Erster Treffer in Division- und Zeilenreihenfolge gewinnt.
+    """
+    index = {}
+
+    for div_number in snapshot.divisions():
+        for idx, row in enumerate(snapshot.rows(div_number), start=1):
+            name = normalize_name(row[11] if len(row) > 11 else "")  # Spalte L
+
+            if name:
+                index.setdefault(name, (int(div_number), idx))
+
+    return index
+
+
 def get_division_worksheet_for_name_candidates(name_candidates: list[str]):
     """
     Sucht den Spieler in allen Division-Tabs 1.DIV bis 6.DIV in Spalte L.
     Gibt (worksheet, row_index, division_number) zurück.
 
     row_index ist die echte Google-Sheet-Zeile, also 1-basiert.
+    Alle Tabs kommen aus einem gemeinsamen Batch-Read (division_data).
     """
     targets = {normalize_name(x) for x in name_candidates if x}
     targets.discard("")
@@ -168,20 +195,14 @@ def get_division_worksheet_for_name_candidates(name_candidates: list[str]):
     if not targets:
         return None, None, None
 
-    for div_number in range(1, 7):
-        ws = get_player_division_worksheet(div_number)
-        values = col_values_cached(
-            lambda: ws,
-            sheet_name=player_sheet_name(ws, f"{div_number}.DIV"),
-            col=12,  # Spalte L
-            ttl_seconds=PLAYER_SHEET_CACHE_TTL_SECONDS,
-        )
+    rows_by_name = get_division_snapshot().index("player_column_l_rows", _column_l_rows_by_name)
+    hits = [rows_by_name[target] for target in targets if target in rows_by_name]
 
-        for idx, cell_value in enumerate(values, start=1):
-            if normalize_name(cell_value) in targets:
-                return ws, idx, div_number
+    if not hits:
+        return None, None, None
 
-    return None, None, None
+    div_number, row_index = min(hits)
+    return get_player_division_worksheet(div_number), row_index, div_number
 
 
 def load_current_streichmodi_for_name_candidates(name_candidates: list[str]) -> tuple[str, str]:
@@ -2,10 +2,9 @@ import os
 import re
 import unicodedata
 
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-
+from division_data import get_division_snapshot
 from sheet_guard import get_all_values_cached
+from sheets_client import get_gspread_client, get_spreadsheet_by_title, get_worksheet
 
 
 DIV_COL_LEFT = 4
@@ -15,11 +14,6 @@ DIV_COL_RIGHT = 6
 CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
 SPREADSHEET_TITLE = os.getenv("SPREADSHEET_TITLE", "Season #4 - Spielbetrieb")
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 GC = None
 WB = None
 SHEETS_ENABLED = True
@@ -31,9 +25,8 @@ RESTINFO_SHEET_CACHE_TTL_SECONDS = int(os.getenv("RESTINFO_SHEET_CACHE_TTL_SECON
 _WORKSHEET_CACHE = {}
 
 try:
-    CREDS = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    GC = gspread.authorize(CREDS)
-    WB = GC.open(SPREADSHEET_TITLE)
+    GC = get_gspread_client(CREDS_FILE)
+    WB = get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
 except Exception:
     SHEETS_ENABLED = False
     WB = None
@@ -61,7 +54,7 @@ def _division_worksheet(div_number: str):
     if sheet_name in _WORKSHEET_CACHE:
         return _WORKSHEET_CACHE[sheet_name]
 
-    ws = WB.worksheet(sheet_name)
+    ws = get_worksheet(WB, sheet_name)
     _WORKSHEET_CACHE[sheet_name] = ws
     return ws
 
@@ -111,8 +104,10 @@ def list_rest_players(div_number: str) -> list[str]:
 
 
 def list_restprogramm(div_number: str, player_name: str):
-    rows = _division_values(div_number)
+    return _restprogramm_from_rows(_division_values(div_number), player_name)
 
+
+def _restprogramm_from_rows(rows: list[list[str]], player_name: str):
     matches = []
     target = normalize_name(player_name)
 
@@ -169,36 +164,41 @@ def format_restprogramm_text(div_number: str, player: str) -> str:
 
 
 def find_divisions_with_open_matches(player_name: str) -> list[str]:
-    found = []
-
-    for div_number in ["1", "2", "3", "4", "5", "6"]:
-        try:
-            matches = list_restprogramm(div_number, player_name)
-        except Exception:
-            continue
+    # Alle Divisionen aus einem gemeinsamen Batch-Read statt sechs Einzel-Reads.
+    try:
+        snapshot = get_division_snapshot()
+    except Exception:
+        return []
+
+    return [
+        div_number
+        for div_number in snapshot.divisions()
+        if _restprogramm_from_rows(snapshot.rows(div_number), player_name)
+    ]
 
-        if matches:
-            found.append(div_number)
 
-    return found
+def _column_l_players_by_division(snapshot) -> dict[str, set[str]]:
+    return {
+        div_number: {normalize_name(player) for player in _unique_players_from_column_l(snapshot.rows(div_number))}
+        for div_number in snapshot.divisions()
+    }
 
 
 def find_divisions_with_player(player_name: str) -> list[str]:
     target = normalize_name(player_name)
-    found = []
 
-    for div_number in ["1", "2", "3", "4", "5", "6"]:
-        try:
-            players = list_rest_players(div_number)
-        except Exception:
-            continue
+    try:
+        snapshot = get_division_snapshot()
+    except Exception:
+        return []
 
-        for player in players:
-            if normalize_name(player) == target:
-                found.append(div_number)
-                break
+    players_by_division = snapshot.index("restinfo_column_l_players", _column_l_players_by_division)
 
-    return found
+    return [
+        div_number
+        for div_number in snapshot.divisions()
+        if target in players_by_division[div_number]
+    ]
 
 
 def get_open_restprogramm_text_for_name_candidates(name_candidates: list[str]) -> str:
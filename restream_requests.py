@@ -6,17 +6,19 @@ from dataclasses import dataclass, field
 from datetime import datetime as dt, timedelta, time
 
 import discord
-import gspread
 import pytz
-from oauth2client.service_account import ServiceAccountCredentials
 from discord import app_commands
 from discord.ext import commands
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     get_all_records_cached,
+    row_cells,
     row_values_cached,
+    scoped_sheet_name,
     sheet_write_call,
 )
+from sheets_client import get_worksheet
 
 
 # =========================================================
@@ -42,11 +44,6 @@ CREDS_FILE = os.getenv(
     os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "credentials.json"),
 ).strip()
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 RESTREAM_REQUEST_HEADERS = [
     "Request ID",
     "Guild ID",
@@ -190,31 +187,20 @@ def get_restream_requests_sheet():
     if RESTREAM_REQUESTS_WORKSHEET_CACHE is not None:
         return RESTREAM_REQUESTS_WORKSHEET_CACHE
 
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    client = gspread.authorize(creds)
-    spreadsheet = client.open_by_key(RESTREAM_REQUESTS_SPREADSHEET_ID)
-
-    worksheet = None
-
     try:
-        worksheet = spreadsheet.get_worksheet_by_id(RESTREAM_REQUESTS_WORKSHEET_GID)
-    except Exception:
-        worksheet = None
-
-    if worksheet is None:
-        for candidate in spreadsheet.worksheets():
-            if int(getattr(candidate, "id", 0)) == RESTREAM_REQUESTS_WORKSHEET_GID:
-                worksheet = candidate
-                break
-
-    if worksheet is None:
+        worksheet = get_worksheet(
+            RESTREAM_REQUESTS_SPREADSHEET_ID,
+            gid=RESTREAM_REQUESTS_WORKSHEET_GID,
+            creds_file=CREDS_FILE,
+        )
+    except WorksheetNotFound:
         raise RuntimeError(
             f"Restream-Requests-Worksheet mit GID `{RESTREAM_REQUESTS_WORKSHEET_GID}` wurde nicht gefunden."
         )
 
     existing_headers = row_values_cached(
         lambda: worksheet,
-        sheet_name=getattr(worksheet, "title", "RestreamRequests"),
+        sheet_name=restream_request_sheet_name(worksheet),
         row=1,
         ttl_seconds=300,
     )
@@ -232,7 +218,10 @@ def get_restream_requests_sheet():
 def restream_request_sheet_name(sheet=None) -> str:
     if sheet is None:
         sheet = RESTREAM_REQUESTS_WORKSHEET_CACHE
-    return getattr(sheet, "title", "RestreamRequests")
+    return scoped_sheet_name(
+        RESTREAM_REQUESTS_SPREADSHEET_ID,
+        getattr(sheet, "title", "RestreamRequests"),
+    )
 
 
 def restream_request_invalidate_prefixes(sheet=None) -> list[str]:
@@ -391,6 +380,8 @@ def save_restream_request(req: RestreamRequest):
         sheet_write_call(
             lambda: sheet.update(f"A{row_index}:V{row_index}", [values], value_input_option="USER_ENTERED"),
             invalidate_prefixes=restream_request_invalidate_prefixes(sheet),
+            patch_sheet=restream_request_sheet_name(sheet),
+            patch_rows={row_index: row_cells(1, values, RESTREAM_REQUEST_HEADERS)},
         )
     else:
         sheet_write_call(
@@ -0,0 +1,186 @@
+# results_log.py
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+
+
+# =========================================================
+# RESULTS LOG
+# =========================================================
+# Append-only Log der Ergebnis-Channel-Nachrichten (JSON Lines).
+# Jede Zeile ist eine Operation: upsert (neu/bearbeitet) oder delete.
+# Beim Start wird das Log einmal abgespielt; der Cursor ist die höchste je
+# gesehene Message-ID. Der Bot liest danach nur noch Nachrichten mit
+# `after=cursor`, Edits/Deletes kommen über die Raw-Events.
+# Das Log wächst unbegrenzt (ganze Seasons), wird aber kompaktiert, sobald es
+# deutlich mehr Operationen als lebende Einträge enthält.
+
+RESULTS_LOG_VERSION = "results-log-v1"
+print(f"[RESULTS_LOG] geladen: {RESULTS_LOG_VERSION}")
+
+RESULTS_LOG_PATH = os.getenv("RESULTS_LOG_PATH", "results_log.jsonl").strip()
+
+
+class ResultsLog:
+    def __init__(self, path: str = RESULTS_LOG_PATH):
+        self.path = path
+        self.cursor: int | None = None
+        self._items: dict[int, dict] = {}
+        self._op_count = 0
+        self._sorted: list[dict] | None = None
+        self._lock = threading.Lock()
+        self._load()
+
+    # -----------------------------------------------------
+    # Persistenz
+    # -----------------------------------------------------
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+
+                    if not line:
+                        continue
+
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Abgebrochene letzte Zeile nach Absturz ignorieren.
+                        continue
+
+                    self._apply(record)
+                    self._op_count += 1
+        except Exception as exc:
+            print(f"[RESULTS_LOG] Log konnte nicht gelesen werden: {repr(exc)}")
+            return
+
+        print(f"[RESULTS_LOG] {len(self._items)} Einträge geladen, Cursor {self.cursor}")
+
+    def _apply(self, record: dict):
+        op = record.get("op")
+        message_id = int(record.get("id") or 0)
+
+        if not message_id:
+            return
+
+        if op == "upsert" and isinstance(record.get("item"), dict):
+            self._items[message_id] = record["item"]
+            self.cursor = max(self.cursor or 0, message_id)
+        elif op == "delete":
+            self._items.pop(message_id, None)
+        elif op == "cursor":
+            self.cursor = max(self.cursor or 0, message_id)
+
+    def _append(self, records: list[dict]):
+        for record in records:
+            self._apply(record)
+
+        self._op_count += len(records)
+        self._sorted = None
+
+        if not self.path:
+            return
+
+        try:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                for record in records:
+                    handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        except Exception as exc:
+            print(f"[RESULTS_LOG] Log konnte nicht geschrieben werden: {repr(exc)}")
+            return
+
+        if self._op_count > 2 * len(self._items) + 100:
+            self._compact()
+
+    def _compact(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        records = [
+            {"op": "upsert", "id": message_id, "item": item}
+            for message_id, item in sorted(self._items.items())
+        ]
+
+        if self.cursor and self.cursor not in self._items:
+            records.append({"op": "cursor", "id": self.cursor})
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".results_log_", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                for record in records:
+                    handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+            self._op_count = len(records)
+        except Exception as exc:
+            print(f"[RESULTS_LOG] Log konnte nicht kompaktiert werden: {repr(exc)}")
+
+    # -----------------------------------------------------
+    # Operationen
+    # -----------------------------------------------------
+
+    def upsert_many(self, items: list[dict]) -> int:
+        """
+        Übernimmt neue oder geänderte Nachrichten (Dict mit "id").
+        Rückgabe: Anzahl tatsächlich geänderter Einträge.
+        """
+        with self._lock:
+            records = []
+
+            for item in items:
+                message_id = int(item["id"])
+
+                if self._items.get(message_id) == item:
+                    continue
+
+                records.append({"op": "upsert", "id": message_id, "item": item})
+
+            if records:
+                self._append(records)
+
+            return len(records)
+
+    def update_content(self, message_id: int, content: str) -> bool:
+        """
+        Edit einer bekannten Nachricht. Unbekannte IDs werden ignoriert.
+        """
+        with self._lock:
+            item = self._items.get(int(message_id))
+
+            if item is None or item.get("content") == content:
+                return False
+
+            self._append([{"op": "upsert", "id": int(message_id), "item": dict(item, content=content)}])
+            return True
+
+    def delete_many(self, message_ids) -> int:
+        with self._lock:
+            records = [
+                {"op": "delete", "id": int(message_id)}
+                for message_id in message_ids
+                if int(message_id) in self._items
+            ]
+
+            if records:
+                self._append(records)
+
+            return len(records)
+
+    def items(self) -> list[dict]:
+        """
+        Alle Einträge, neueste zuerst (wie channel.history()).
+        Die Liste wird nur nach Änderungen neu gebaut.
+        """
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = [self._items[message_id] for message_id in sorted(self._items, reverse=True)]
+
+            return self._sorted
+
+
+RESULTS_LOG = ResultsLog()
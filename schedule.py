@@ -4,15 +4,16 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import discord
-import gspread
 from discord import app_commands
 from discord.ext import commands
-from oauth2client.service_account import ServiceAccountCredentials
+from gspread.exceptions import WorksheetNotFound
 
 from sheet_guard import (
     get_all_values_cached,
     sheet_write_call,
+    worksheet_cache_name,
 )
+from sheets_client import get_spreadsheet as get_shared_spreadsheet, get_worksheet
 
 # =========================
 # ANPASSEN
@@ -42,39 +43,13 @@ SCHEDULE_SHEET_CACHE_TTL_SECONDS = int(os.getenv("SCHEDULE_SHEET_CACHE_TTL_SECON
 # =========================
 # GOOGLE SHEETS
 # =========================
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
 
-_GSPREAD_CLIENT_CACHE = None
-_SPREADSHEET_CACHE = None
 _CUP_WORKSHEET_CACHE = None
 
 
-def get_gspread_client() -> gspread.Client:
-    global _GSPREAD_CLIENT_CACHE
-
-    if _GSPREAD_CLIENT_CACHE is not None:
-        return _GSPREAD_CLIENT_CACHE
-
-    creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    _GSPREAD_CLIENT_CACHE = gspread.authorize(creds)
-    return _GSPREAD_CLIENT_CACHE
-
-
 def get_spreadsheet():
-    global _SPREADSHEET_CACHE
-
-    if _SPREADSHEET_CACHE is not None:
-        return _SPREADSHEET_CACHE
-
-    client = get_gspread_client()
-    _SPREADSHEET_CACHE = client.open_by_key(SPREADSHEET_ID)
-    print("DEBUG schedule spreadsheet geöffnet:", _SPREADSHEET_CACHE.title)
-    return _SPREADSHEET_CACHE
+    return get_shared_spreadsheet(SPREADSHEET_ID, CREDS_FILE)
 
 
 def get_cup_worksheet():
@@ -83,21 +58,19 @@ def get_cup_worksheet():
     if _CUP_WORKSHEET_CACHE is not None:
         return _CUP_WORKSHEET_CACHE
 
-    spreadsheet = get_spreadsheet()
-
-    for ws in spreadsheet.worksheets():
-        if int(ws.id) == int(WORKSHEET_GID):
-            print("DEBUG schedule passendes worksheet gefunden:", ws.title)
-            _CUP_WORKSHEET_CACHE = ws
-            return _CUP_WORKSHEET_CACHE
+    try:
+        _CUP_WORKSHEET_CACHE = get_worksheet(get_spreadsheet(), gid=WORKSHEET_GID)
+    except WorksheetNotFound:
+        raise RuntimeError(
+            f"Worksheet mit gid/id {WORKSHEET_GID} nicht gefunden."
+        )
 
-    raise RuntimeError(
-        f"Worksheet mit gid/id {WORKSHEET_GID} nicht gefunden."
-    )
+    print("DEBUG schedule passendes worksheet gefunden:", _CUP_WORKSHEET_CACHE.title)
+    return _CUP_WORKSHEET_CACHE
 
 
 def get_schedule_sheet_cache_name(ws) -> str:
-    return getattr(ws, "title", "CupSchedule")
+    return worksheet_cache_name(ws, "CupSchedule")
 
 
 def schedule_invalidate_prefixes(ws) -> list[str]:
@@ -361,6 +334,8 @@ class CupTerminModal(discord.ui.Modal, title="Cuptermin eintragen"):
             sheet_write_call(
                 lambda: ws.update_cell(self.match_data["row"], 5, start_dt.strftime(DATETIME_FORMAT)),
                 invalidate_prefixes=schedule_invalidate_prefixes(ws),
+                patch_sheet=get_schedule_sheet_cache_name(ws),
+                patch_rows={self.match_data["row"]: [(5, None, start_dt.strftime(DATETIME_FORMAT))]},
             )
         except Exception as e:
             await interaction.response.send_message(
@@ -411,6 +386,8 @@ class CupResultModal(discord.ui.Modal, title="Cupresult eintragen"):
             sheet_write_call(
                 lambda: ws.update_cell(self.match_data["row"], 3, result_text),
                 invalidate_prefixes=schedule_invalidate_prefixes(ws),
+                patch_sheet=get_schedule_sheet_cache_name(ws),
+                patch_rows={self.match_data["row"]: [(3, None, result_text)]},
             )
         except Exception as e:
             await interaction.response.send_message(
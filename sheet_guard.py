@@ -1,9 +1,21 @@
 # sheet_guard.py
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextvars
+import functools
+import json
 import os
 import random
+import re
+import sqlite3
+import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -18,7 +30,7 @@ except Exception:  # fallback, falls gspread beim Import noch nicht verfügbar i
 # ZENTRALER GOOGLE-SHEETS-SCHUTZ
 # =========================================================
 
-SHEET_GUARD_VERSION = "sheet-guard-optimized-v1"
+SHEET_GUARD_VERSION = "sheet-guard-optimized-v2-async"
 print(f"[SHEET_GUARD] geladen: {SHEET_GUARD_VERSION}")
 
 
@@ -50,333 +62,2011 @@ def _env_int(name: str, default: int, minimum: int | None = None, maximum: int |
 class CacheEntry:
     created_at: float
     value: Any
+    # Aus dem Persistenz-Cache geladen: sofort nutzbar, aber beim ersten Read neu laden.
+    revalidate: bool = False
+
+
+# =========================================================
+# UNVERÄNDERLICHE SNAPSHOTS
+# =========================================================
+# Der Cache hält eingefrorene Snapshots statt Deepcopies. Alle Aufrufer teilen
+# sich dieselben Objekte, ein Cache-Hit kostet dadurch O(1) statt O(Zeilen×Spalten).
+# FrozenRow/FrozenList verhalten sich beim Lesen wie dict/list (auch für JSON),
+# werfen aber bei Mutation einen TypeError. Wer verändern will, holt sich per
+# thaw_snapshot() eine eigene Kopie (Copy-on-Write).
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} ist ein geteilter Cache-Snapshot und darf nicht verändert werden. "
+        "Vorher thaw_snapshot() aufrufen."
+    )
+
+
+class FrozenRow(dict):
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+
+class FrozenList(list):
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(value, memo) for value in self]
+
+
+def freeze_snapshot(value: Any):
+    """
+    Friert Sheet-Daten (Listen von Listen / Listen von Dicts) rekursiv ein.
+    Bereits eingefrorene Werte werden unverändert zurückgegeben.
+    """
+    if isinstance(value, (FrozenRow, FrozenList)):
+        return value
+
+    if isinstance(value, dict):
+        return FrozenRow((key, freeze_snapshot(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze_snapshot(item) for item in value)
+
+    return value
+
+
+def thaw_snapshot(value: Any):
+    """
+    Liefert eine veränderbare Kopie eines Snapshots.
+    Nur dort aufrufen, wo wirklich mutiert wird.
+    """
+    return deepcopy(value)
 
 
 _CACHE: dict[str, CacheEntry] = {}
 
-# Wenn Google 429 liefert, blocken wir weitere echte Reads kurz.
-_QUOTA_COOLDOWN_UNTIL = 0.0
-_LAST_QUOTA_LOG_AT = 0.0
+# Die async-Wrapper führen gspread-Calls in Worker-Threads aus. Der Cache wird
+# deshalb aus mehreren Threads gelesen und geschrieben.
+_CACHE_LOCK = threading.RLock()
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+# Eigener Executor für race/interactive: Hintergrund-Jobs, die beim Pacing in
+# time.sleep warten, dürfen diesen Klassen keine Worker wegnehmen.
+_PRIORITY_EXECUTOR: ThreadPoolExecutor | None = None
+
+# Wenn Google 429 liefert, blocken wir weitere echte Reads des betroffenen
+# Namespaces (Spreadsheets) kurz. Namespace -> Zeitpunkt.
+_QUOTA_COOLDOWN_UNTIL: dict[str, float] = {}
+_QUOTA_LOCK = threading.Lock()
+_LAST_QUOTA_LOG_AT = 0.0
+
+# Per Render-ENV steuerbar.
+# Ziel: weniger echte Sheet-Reads, weniger Retry-Druck bei 429, stabilere Ladezeiten.
+DEFAULT_READ_TTL_SECONDS = _env_int("SHEET_GUARD_READ_TTL_SECONDS", 90, minimum=0, maximum=3600)
+DEFAULT_WRITE_RETRIES = _env_int("SHEET_GUARD_WRITE_RETRIES", 2, minimum=0, maximum=10)
+DEFAULT_READ_RETRIES = _env_int("SHEET_GUARD_READ_RETRIES", 2, minimum=0, maximum=10)
+DEFAULT_QUOTA_COOLDOWN_SECONDS = _env_int("SHEET_GUARD_QUOTA_COOLDOWN_SECONDS", 60, minimum=5, maximum=600)
+DEFAULT_RETRY_MAX_SLEEP_SECONDS = _env_int("SHEET_GUARD_RETRY_MAX_SLEEP_SECONDS", 8, minimum=1, maximum=60)
+DEFAULT_CACHE_MAX_ENTRIES = _env_int("SHEET_GUARD_CACHE_MAX_ENTRIES", 300, minimum=50, maximum=5000)
+DEFAULT_EXECUTOR_WORKERS = _env_int("SHEET_GUARD_EXECUTOR_WORKERS", 4, minimum=1, maximum=32)
+DEFAULT_PRIORITY_EXECUTOR_WORKERS = _env_int("SHEET_GUARD_PRIORITY_EXECUTOR_WORKERS", 2, minimum=1, maximum=32)
+# Globales Stale-Fenster nach Ablauf des TTL (0 = aus). Pro Sheet über
+# set_sheet_ttl_policy() überschreibbar.
+DEFAULT_STALE_TTL_SECONDS = _env_int("SHEET_GUARD_STALE_TTL_SECONDS", 0, minimum=0, maximum=86400)
+# Write-Behind: Zellupdates werden so lange gesammelt und dann als ein batch_update geschrieben.
+DEFAULT_WRITE_BEHIND_SECONDS = _env_int("SHEET_GUARD_WRITE_BEHIND_SECONDS", 2, minimum=0, maximum=60)
+# Ab so vielen Fehlversuchen wird der Write-Fehler gemeldet. Die Zellen bleiben trotzdem in der Queue.
+DEFAULT_WRITE_BEHIND_MAX_FAILURES = _env_int("SHEET_GUARD_WRITE_BEHIND_MAX_FAILURES", 3, minimum=1, maximum=20)
+DEFAULT_WRITE_BEHIND_RETRY_MAX_SECONDS = _env_int("SHEET_GUARD_WRITE_BEHIND_RETRY_MAX_SECONDS", 60, minimum=1, maximum=3600)
+# Persistenter Snapshot-Cache für warme Neustarts. Leerer Pfad = aus.
+DEFAULT_PERSIST_PATH = os.getenv("SHEET_GUARD_PERSIST_PATH", "sheet_guard_cache.sqlite3").strip()
+DEFAULT_PERSIST_INTERVAL_SECONDS = _env_int("SHEET_GUARD_PERSIST_INTERVAL_SECONDS", 30, minimum=1, maximum=3600)
+DEFAULT_PERSIST_MAX_AGE_SECONDS = _env_int("SHEET_GUARD_PERSIST_MAX_AGE_SECONDS", 1800, minimum=0, maximum=7 * 86400)
+# Token-Buckets, getrennt nach Read und Write. 0 = Bucket aus.
+# Google erlaubt standardmäßig 60 Requests/Minute pro Nutzer. Der Bot nutzt
+# genau einen Service-Account, deshalb begrenzt der gemeinsame Bucket ("*")
+# alle Spreadsheets zusammen auf dieses Limit. Die Buckets pro Namespace
+# (Spreadsheet) sind kleiner und sorgen nur für Fairness: Ein Spreadsheet kann
+# den gemeinsamen Bucket nicht allein leeren.
+DEFAULT_READS_PER_MINUTE = _env_int("SHEET_GUARD_READS_PER_MINUTE", 60, minimum=0, maximum=10000)
+DEFAULT_WRITES_PER_MINUTE = _env_int("SHEET_GUARD_WRITES_PER_MINUTE", 60, minimum=0, maximum=10000)
+DEFAULT_NAMESPACE_READS_PER_MINUTE = _env_int("SHEET_GUARD_NAMESPACE_READS_PER_MINUTE", 40, minimum=0, maximum=10000)
+DEFAULT_NAMESPACE_WRITES_PER_MINUTE = _env_int("SHEET_GUARD_NAMESPACE_WRITES_PER_MINUTE", 40, minimum=0, maximum=10000)
+# Anteil der Bucket-Kapazität (Prozent), den Hintergrund-Loops bzw. Admin-Rebuilds
+# für höhere Prioritätsklassen frei lassen müssen.
+DEFAULT_BACKGROUND_HEADROOM_PERCENT = _env_int("SHEET_GUARD_BACKGROUND_HEADROOM_PERCENT", 30, minimum=0, maximum=90)
+DEFAULT_ADMIN_HEADROOM_PERCENT = _env_int("SHEET_GUARD_ADMIN_HEADROOM_PERCENT", 50, minimum=0, maximum=90)
+
+
+def _now() -> float:
+    return time.time()
+
+
+class QuotaDeferred(Exception):
+    """
+    Synchroner Sheet-Call auf dem Event-Loop-Thread ohne Quota-Headroom.
+    Statt den Loop per time.sleep anzuhalten, wird der Call abgelehnt
+    (bzw. der Stale-Snapshot geliefert).
+    """
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _is_quota_error(exc: Exception) -> bool:
+    if isinstance(exc, QuotaDeferred):
+        return True
+
+    text = str(exc).lower()
+    return (
+        "429" in text
+        or "quota exceeded" in text
+        or "too many requests" in text
+        or "rate limit" in text
+    )
+
+
+# =========================================================
+# NAMESPACES + QUOTA
+# =========================================================
+# Cache-Keys enthalten nur den Sheet-Namen. Tabs aus eigenen Spreadsheets
+# (Cup-Schedule, Async, Season-Signup, Restream-Requests, ...) werden deshalb
+# als "{spreadsheet_id}/{titel}" übergeben (siehe worksheet_cache_name), damit
+# gleichnamige Tabs ("Signup", "Schedule") sich nicht überschreiben oder
+# gemeinsam invalidiert werden. Der Teil vor dem "/" ist der Namespace mit
+# eigenem 429-Cooldown und eigenem Token-Bucket. Reine Titel (TFNL-Ladder,
+# Spielbetrieb) gehören zum Default-Namespace "".
+
+_NAMESPACE_RE = re.compile(r"^([A-Za-z0-9_-]{20,})/")
+
+
+def scoped_sheet_name(spreadsheet_id: str | None, sheet_name: str) -> str:
+    if not spreadsheet_id:
+        return sheet_name
+    return f"{spreadsheet_id}/{sheet_name}"
+
+
+def worksheet_cache_name(ws, fallback: str) -> str:
+    """
+    Cache-Name eines Worksheets inkl. Spreadsheet-Namespace.
+    gspread 6 hat ws.spreadsheet_id, gspread 5 nur ws.spreadsheet.id.
+    """
+    title = getattr(ws, "title", None) or fallback
+    spreadsheet_id = getattr(ws, "spreadsheet_id", None) or getattr(getattr(ws, "spreadsheet", None), "id", None)
+    return scoped_sheet_name(spreadsheet_id, title)
+
+
+def sheet_namespace(sheet_name: str | None) -> str:
+    match = _NAMESPACE_RE.match(sheet_name or "")
+    return match.group(1) if match else ""
+
+
+def _cache_key_namespace(cache_key: str | None) -> str:
+    if not cache_key:
+        return ""
+    return sheet_namespace(_cache_key_sheet_name(cache_key))
+
+
+def _write_namespace(prefixes: list[str] | None, patch_sheet: str | None) -> str:
+    if patch_sheet:
+        return sheet_namespace(patch_sheet)
+
+    for prefix in prefixes or []:
+        namespace = _cache_key_namespace(prefix)
+        if namespace:
+            return namespace
+
+    return ""
+
+
+def _set_quota_cooldown(seconds: int | None = None, namespace: str = ""):
+    selected_seconds = seconds if seconds is not None else DEFAULT_QUOTA_COOLDOWN_SECONDS
+
+    with _QUOTA_LOCK:
+        _QUOTA_COOLDOWN_UNTIL[namespace] = max(
+            _QUOTA_COOLDOWN_UNTIL.get(namespace, 0.0),
+            _now() + selected_seconds,
+        )
+
+
+def _quota_cooldown_until(namespace: str | None) -> float:
+    with _QUOTA_LOCK:
+        if namespace is None:
+            return max(_QUOTA_COOLDOWN_UNTIL.values(), default=0.0)
+        return _QUOTA_COOLDOWN_UNTIL.get(namespace, 0.0)
+
+
+def is_quota_cooldown_active(namespace: str | None = None) -> bool:
+    """
+    namespace=None: irgendein Namespace im Cooldown.
+    """
+    return _now() < _quota_cooldown_until(namespace)
+
+
+def seconds_until_quota_retry(namespace: str | None = None) -> int:
+    return max(0, int(_quota_cooldown_until(namespace) - _now()))
+
+
+# Prioritätsklassen für Sheet-I/O. Die Klasse hängt am Aufrufkontext
+# (contextvars) und wird über run_in_sheet_executor/asyncio.to_thread in die
+# Worker-Threads mitgenommen:
+#   race        - Countdown/Start/Finish/Ergebnis-Writes, wird nie zurückgestellt
+#   interactive - Nutzer-Klicks und Commands (Default)
+#   background  - Loops (Channel-Updates, Slot-Prozess, Auto-Wertung)
+#   admin       - Rebuilds und Archivierung
+# Niedrigere Klassen bekommen nur Tokens, solange im Bucket noch Headroom für
+# die höheren Klassen bleibt. Sonst warten sie bzw. bekommen den Stale-Snapshot.
+
+PRIORITY_RACE = "race"
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_ADMIN = "admin"
+
+_SHEET_PRIORITY: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "sheet_guard_priority",
+    default=PRIORITY_INTERACTIVE,
+)
+
+
+@contextmanager
+def sheet_priority(priority: str):
+    """
+    with sheet_priority(PRIORITY_BACKGROUND): ...
+    Gilt für alle Sheet-Calls im Block, auch in async-Code.
+    """
+    token = _SHEET_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _SHEET_PRIORITY.reset(token)
+
+
+def current_sheet_priority() -> str:
+    return _SHEET_PRIORITY.get()
+
+
+def _headroom_fraction(priority: str) -> float:
+    if priority == PRIORITY_BACKGROUND:
+        return DEFAULT_BACKGROUND_HEADROOM_PERCENT / 100.0
+    if priority == PRIORITY_ADMIN:
+        return DEFAULT_ADMIN_HEADROOM_PERCENT / 100.0
+    return 0.0
+
+
+class _TokenBucket:
+    __slots__ = ("rate_per_second", "capacity", "tokens", "updated_at")
+
+    def __init__(self, per_minute: int):
+        self.rate_per_second = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated_at = _now()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+
+    def seconds_until(self, level: float) -> float:
+        if self.tokens >= level:
+            return 0.0
+        return (level - self.tokens) / self.rate_per_second
+
+
+# (Namespace oder "*" für den Service-Account, "read"/"write") -> Bucket
+_QUOTA_BUCKETS: dict[tuple[str, str], _TokenBucket] = {}
+
+
+def _bucket_rate(scope: str, kind: str) -> int:
+    if scope == "*":
+        return DEFAULT_WRITES_PER_MINUTE if kind == "write" else DEFAULT_READS_PER_MINUTE
+    return DEFAULT_NAMESPACE_WRITES_PER_MINUTE if kind == "write" else DEFAULT_NAMESPACE_READS_PER_MINUTE
+
+
+def _quota_buckets(namespace: str, kind: str, now: float) -> list[_TokenBucket]:
+    buckets = []
+
+    for scope in (namespace, "*"):
+        rate = _bucket_rate(scope, kind)
+        if rate <= 0:
+            continue
+
+        bucket = _QUOTA_BUCKETS.get((scope, kind))
+        if bucket is None:
+            bucket = _TokenBucket(rate)
+            _QUOTA_BUCKETS[(scope, kind)] = bucket
+
+        bucket.refill(now)
+        buckets.append(bucket)
+
+    return buckets
+
+
+def _acquire_quota(namespace: str, kind: str, priority: str) -> tuple[bool, float]:
+    """
+    Versucht, einen Request im Namespace- und im gemeinsamen Bucket zu buchen.
+    Liefert (gebucht, Wartezeit):
+    - race wird immer gebucht (auch ins Minus) und wartet ggf. die Schuld ab.
+    - andere Klassen werden nur gebucht, wenn danach noch ihr Headroom bleibt,
+      sonst (False, Sekunden bis zum nächsten Versuch).
+    """
+    now = _now()
+
+    with _QUOTA_LOCK:
+        buckets = _quota_buckets(namespace, kind, now)
+
+        if priority != PRIORITY_RACE:
+            fraction = _headroom_fraction(priority)
+            wait_seconds = max(
+                (bucket.seconds_until(fraction * bucket.capacity + 1.0) for bucket in buckets),
+                default=0.0,
+            )
+            if wait_seconds > 0:
+                return False, wait_seconds
+
+        for bucket in buckets:
+            bucket.tokens -= 1.0
+
+        return True, max((bucket.seconds_until(0.0) for bucket in buckets), default=0.0)
+
+
+def has_quota_headroom(namespace: str = "", kind: str = "read", priority: str | None = None) -> bool:
+    """
+    True, wenn ein Request dieser Klasse jetzt ohne Warten gebucht würde.
+    """
+    selected_priority = priority or current_sheet_priority()
+
+    if selected_priority == PRIORITY_RACE:
+        return True
+
+    fraction = _headroom_fraction(selected_priority)
+
+    with _QUOTA_LOCK:
+        buckets = _quota_buckets(namespace, kind, _now())
+        return all(bucket.tokens >= fraction * bucket.capacity + 1.0 for bucket in buckets)
+
+
+def _pace_quota(namespace: str, kind: str):
+    priority = current_sheet_priority()
+    # Auf dem Event-Loop-Thread wird nie geschlafen: race läuft gebucht sofort,
+    # alle anderen Klassen bekommen QuotaDeferred (Stale-Fallback im Aufrufer).
+    on_loop = _on_event_loop_thread()
+
+    while True:
+        granted, wait_seconds = _acquire_quota(namespace, kind, priority)
+
+        if granted and (wait_seconds <= 0 or on_loop):
+            return
+
+        if on_loop:
+            if should_log_quota_warning():
+                print(
+                    f"[SHEET_GUARD] Sync-Sheet-Call auf dem Event-Loop ohne Quota-Headroom "
+                    f"abgelehnt ({namespace or 'default'}/{kind}, {priority})."
+                )
+            raise QuotaDeferred(f"Kein Quota-Headroom ({namespace or 'default'}/{kind}).")
+
+        time.sleep(wait_seconds)
+
+        if granted:
+            return
+
+
+async def _pace_quota_async(namespace: str, kind: str):
+    priority = current_sheet_priority()
+
+    while True:
+        granted, wait_seconds = _acquire_quota(namespace, kind, priority)
+
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+        if granted:
+            return
+
+
+def should_log_quota_warning(interval_seconds: int = 60) -> bool:
+    """
+    Verhindert Discord-/Console-Spam.
+    Gibt nur alle X Sekunden True zurück.
+    """
+    global _LAST_QUOTA_LOG_AT
+    now = _now()
+    if now - _LAST_QUOTA_LOG_AT >= interval_seconds:
+        _LAST_QUOTA_LOG_AT = now
+        return True
+    return False
+
+
+def invalidate_cache(key_prefix: str | None = None):
+    """
+    key_prefix=None: alles löschen
+    key_prefix="records:Schedule": nur passende Keys löschen
+    """
+    global _CACHE_GENERATION
+
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _INVALIDATION_LOG.append((_CACHE_GENERATION, key_prefix))
+
+        _mark_persist_prefix_deleted(key_prefix)
+
+        if key_prefix is None:
+            _CACHE.clear()
+            return
+
+        for key in list(_CACHE.keys()):
+            if key.startswith(key_prefix):
+                _CACHE.pop(key, None)
+
+
+def _note_write(key_prefix: str):
+    """
+    Markiert Keys als geändert, ohne sie zu löschen (die Snapshots wurden
+    bereits gepatcht). Laufende Fetches mit älterem Stand werden dadurch
+    nicht mehr in den Cache geschrieben.
+    """
+    global _CACHE_GENERATION
+
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _INVALIDATION_LOG.append((_CACHE_GENERATION, key_prefix))
+
+
+def _prune_cache_if_needed():
+    """
+    Verhindert, dass der Prozess bei vielen dynamischen Keys unnötig Cache ansammelt.
+    Entfernt die ältesten Einträge, wenn das Limit überschritten wird.
+    """
+    with _CACHE_LOCK:
+        if len(_CACHE) <= DEFAULT_CACHE_MAX_ENTRIES:
+            return
+
+        overflow = len(_CACHE) - DEFAULT_CACHE_MAX_ENTRIES
+        oldest_keys = sorted(_CACHE.keys(), key=lambda key: _CACHE[key].created_at)[:overflow]
+
+        for key in oldest_keys:
+            _CACHE.pop(key, None)
+            _mark_persist_dirty(key)
+
+
+def get_cache_value(key: str, ttl_seconds: int):
+    with _CACHE_LOCK:
+        if ttl_seconds <= 0:
+            _CACHE.pop(key, None)
+            return None
+
+        entry = _CACHE.get(key)
+        if not entry:
+            return None
+
+        if _now() - entry.created_at > ttl_seconds:
+            _CACHE.pop(key, None)
+            return None
+
+        return entry.value
+
+
+# =========================================================
+# STALE-WHILE-REVALIDATE
+# =========================================================
+# soft TTL: bis hierhin gilt ein Eintrag als frisch.
+# hard TTL: bis hierhin wird der Eintrag sofort ausgeliefert und im Hintergrund
+#           neu geladen. Danach wird wie bisher synchron nachgeladen.
+
+@dataclass(frozen=True)
+class SheetTtlPolicy:
+    hard_ttl_seconds: int
+    soft_ttl_seconds: int | None = None
+
+
+_SHEET_TTL_POLICIES: dict[str, SheetTtlPolicy] = {}
+_REFRESHING: set[str] = set()
+
+
+def set_sheet_ttl_policy(sheet_name: str, *, hard_ttl_seconds: int, soft_ttl_seconds: int | None = None):
+    """
+    Aktiviert Stale-While-Revalidate für ein Sheet.
+    soft_ttl_seconds=None: der ttl_seconds-Wert des jeweiligen Aufrufers gilt als soft TTL.
+    """
+    _SHEET_TTL_POLICIES[sheet_name] = SheetTtlPolicy(
+        hard_ttl_seconds=max(0, int(hard_ttl_seconds)),
+        soft_ttl_seconds=None if soft_ttl_seconds is None else max(0, int(soft_ttl_seconds)),
+    )
+
+
+def _resolve_ttls(sheet_name: str, ttl_seconds: int) -> tuple[int, int]:
+    policy = _SHEET_TTL_POLICIES.get(sheet_name)
+
+    if policy is None:
+        soft = ttl_seconds
+        hard = ttl_seconds + DEFAULT_STALE_TTL_SECONDS if ttl_seconds > 0 else 0
+        return soft, hard
+
+    soft = ttl_seconds if policy.soft_ttl_seconds is None else policy.soft_ttl_seconds
+    return soft, max(soft, policy.hard_ttl_seconds)
+
+
+def _lookup_cache(cache_key: str, soft_ttl_seconds: int, hard_ttl_seconds: int) -> tuple[Any, bool] | None:
+    """
+    Liefert (Wert, ist_stale) oder None bei Miss.
+    """
+    with _CACHE_LOCK:
+        if soft_ttl_seconds <= 0:
+            _CACHE.pop(cache_key, None)
+            return None
+
+        entry = _CACHE.get(cache_key)
+        if not entry:
+            return None
+
+        age = _now() - entry.created_at
+
+        if entry.revalidate and age <= max(hard_ttl_seconds, DEFAULT_PERSIST_MAX_AGE_SECONDS):
+            return entry.value, True
+
+        if age <= soft_ttl_seconds:
+            return entry.value, False
+
+        if age <= hard_ttl_seconds:
+            return entry.value, True
+
+        _CACHE.pop(cache_key, None)
+        return None
+
+
+def _schedule_background_refresh(
+    cache_key: str,
+    call: Callable[[], Any] | None,
+    fetch: Callable[[], Any] | None = None,
+):
+    """
+    fetch ersetzt den Standard-Fetch (call lesen und unter cache_key ablegen),
+    z. B. für Batch-Reads, die mehrere Keys auf einmal befüllen.
+    """
+    namespace = _cache_key_namespace(cache_key)
+    fetch = fetch or (lambda: _fetch_and_store(cache_key, call))
+
+    if is_quota_cooldown_active(namespace):
+        return
+
+    # Ohne Headroom bleibt der Snapshot stale, der nächste Read versucht es erneut.
+    if not has_quota_headroom(namespace, "read", PRIORITY_BACKGROUND):
+        return
+
+    with _CACHE_LOCK:
+        if cache_key in _REFRESHING:
+            return
+        _REFRESHING.add(cache_key)
+
+    def job():
+        try:
+            with sheet_priority(PRIORITY_BACKGROUND):
+                _single_flight(cache_key, fetch)
+        except Exception as exc:
+            print(f"[SHEET_GUARD] Hintergrund-Refresh fehlgeschlagen ({cache_key}): {repr(exc)}")
+        finally:
+            with _CACHE_LOCK:
+                _REFRESHING.discard(cache_key)
+
+    try:
+        _get_executor().submit(job)
+    except RuntimeError:
+        # Executor wurde bereits heruntergefahren (Shutdown).
+        with _CACHE_LOCK:
+            _REFRESHING.discard(cache_key)
+
+
+def _deferred_stale_entry(cache_key: str) -> CacheEntry | None:
+    """
+    Hintergrund-/Admin-Reads ohne Quota-Headroom bekommen einen vorhandenen
+    (auch abgelaufenen) Snapshot statt eines echten Reads.
+    """
+    if current_sheet_priority() not in (PRIORITY_BACKGROUND, PRIORITY_ADMIN):
+        return None
+
+    if has_quota_headroom(_cache_key_namespace(cache_key), "read"):
+        return None
+
+    return _get_stale_entry(cache_key)
+
+
+def _get_stale_entry(cache_key: str | None) -> CacheEntry | None:
+    if not cache_key:
+        return None
+
+    with _CACHE_LOCK:
+        return _CACHE.get(cache_key)
+
+
+def set_cache_value(key: str, value: Any):
+    snapshot = freeze_snapshot(value)
+
+    with _CACHE_LOCK:
+        _CACHE[key] = CacheEntry(created_at=_now(), value=snapshot)
+        _mark_persist_dirty(key)
+    _prune_cache_if_needed()
+
+    return snapshot
+
+
+# =========================================================
+# PERSISTENTER SNAPSHOT-CACHE
+# =========================================================
+# Snapshots von Sheets mit Stale-Policy (und Header-Zeilen) werden gebündelt in
+# eine lokale SQLite-Datei geschrieben. Beim Start werden sie als
+# "stale, aber nutzbar" geladen und beim ersten Read im Hintergrund neu geladen.
+# Ein Neustart beginnt dadurch mit warmem Cache statt mit einem Read-Burst.
+
+_PERSIST_DIRTY_KEYS: set[str] = set()
+# None = kompletter Cache wurde invalidiert.
+_PERSIST_DELETED_PREFIXES: list[str | None] = []
+_PERSIST_TIMER: threading.Timer | None = None
+_PERSIST_LOCK = threading.Lock()
+_PERSIST_LOADED_COUNT = 0
+
+
+def _cache_key_sheet_name(cache_key: str) -> str:
+    parts = cache_key.split(":", 2)
+    return parts[1] if len(parts) > 1 else ""
+
+
+def _is_persistable_key(cache_key: str) -> bool:
+    sheet_name = _cache_key_sheet_name(cache_key)
+
+    if cache_key == f"row:{sheet_name}:1":
+        return True
+
+    policy = _SHEET_TTL_POLICIES.get(sheet_name)
+    return policy is not None and cache_key.split(":", 1)[0] in ("records", "values")
+
+
+def _mark_persist_dirty(cache_key: str):
+    # Nicht persistierbare Keys (cell/col/row, Sheets ohne Policy) landen nie
+    # in der Datei; sie würden nur DELETEs und Flush-Timer auslösen.
+    if not DEFAULT_PERSIST_PATH or not _is_persistable_key(cache_key):
+        return
+
+    with _CACHE_LOCK:
+        _PERSIST_DIRTY_KEYS.add(cache_key)
+        _schedule_persist_flush()
+
+
+def _mark_persist_prefix_deleted(key_prefix: str | None):
+    if not DEFAULT_PERSIST_PATH:
+        return
+
+    with _CACHE_LOCK:
+        _PERSIST_DELETED_PREFIXES.append(key_prefix)
+        _schedule_persist_flush()
+
+
+def _schedule_persist_flush():
+    global _PERSIST_TIMER
+
+    if _PERSIST_TIMER is not None:
+        return
+
+    timer = threading.Timer(DEFAULT_PERSIST_INTERVAL_SECONDS, _persist_from_timer)
+    timer.daemon = True
+    _PERSIST_TIMER = timer
+    timer.start()
+
+
+def _persist_from_timer():
+    try:
+        persist_cache_snapshots()
+    except Exception as exc:
+        print(f"[SHEET_GUARD] Persistenter Cache konnte nicht geschrieben werden: {repr(exc)}")
+
+
+def _open_persist_db() -> sqlite3.Connection:
+    connection = sqlite3.connect(DEFAULT_PERSIST_PATH, timeout=5)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS snapshots ("
+        "cache_key TEXT PRIMARY KEY, created_at REAL NOT NULL, payload BLOB NOT NULL)"
+    )
+    return connection
+
+
+def persist_cache_snapshots():
+    """
+    Schreibt geänderte Snapshots in die Persistenz-Datei (blockierend).
+    Läuft normalerweise gebündelt im Hintergrund und beim Beenden.
+    """
+    global _PERSIST_TIMER
+
+    if not DEFAULT_PERSIST_PATH:
+        return
+
+    with _CACHE_LOCK:
+        if _PERSIST_TIMER is not None:
+            _PERSIST_TIMER.cancel()
+            _PERSIST_TIMER = None
+
+        deleted_prefixes = list(_PERSIST_DELETED_PREFIXES)
+        _PERSIST_DELETED_PREFIXES.clear()
+        dirty_keys = set(_PERSIST_DIRTY_KEYS)
+        _PERSIST_DIRTY_KEYS.clear()
+
+        upserts = []
+        deletes = []
+
+        for key in dirty_keys:
+            entry = _CACHE.get(key)
+
+            if entry is None or not _is_persistable_key(key):
+                deletes.append(key)
+            else:
+                upserts.append((key, entry.created_at, entry.value))
+
+    if not deleted_prefixes and not upserts and not deletes:
+        return
+
+    rows = [
+        (key, created_at, zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+        for key, created_at, value in upserts
+    ]
+
+    with _PERSIST_LOCK:
+        connection = _open_persist_db()
+        try:
+            with connection:
+                for prefix in deleted_prefixes:
+                    if prefix is None:
+                        connection.execute("DELETE FROM snapshots")
+                    else:
+                        connection.execute(
+                            "DELETE FROM snapshots WHERE substr(cache_key, 1, ?) = ?",
+                            (len(prefix), prefix),
+                        )
+
+                connection.executemany("DELETE FROM snapshots WHERE cache_key = ?", [(key,) for key in deletes])
+                connection.executemany(
+                    "INSERT OR REPLACE INTO snapshots (cache_key, created_at, payload) VALUES (?, ?, ?)",
+                    rows,
+                )
+        finally:
+            connection.close()
+
+
+def load_persisted_cache() -> int:
+    """
+    Lädt persistierte Snapshots als revalidierungspflichtige Cache-Einträge.
+    Einträge, die älter als DEFAULT_PERSIST_MAX_AGE_SECONDS sind, werden ignoriert.
+    """
+    global _PERSIST_LOADED_COUNT
+
+    if not DEFAULT_PERSIST_PATH or not os.path.exists(DEFAULT_PERSIST_PATH):
+        return 0
+
+    min_created_at = _now() - DEFAULT_PERSIST_MAX_AGE_SECONDS
+    loaded = 0
+
+    with _PERSIST_LOCK:
+        connection = _open_persist_db()
+        try:
+            rows = connection.execute(
+                "SELECT cache_key, created_at, payload FROM snapshots WHERE created_at >= ?",
+                (min_created_at,),
+            ).fetchall()
+        finally:
+            connection.close()
+
+    with _CACHE_LOCK:
+        for key, created_at, payload in rows:
+            if key in _CACHE:
+                continue
+
+            try:
+                value = json.loads(zlib.decompress(payload).decode("utf-8"))
+            except Exception:
+                continue
+
+            _CACHE[key] = CacheEntry(created_at=created_at, value=freeze_snapshot(value), revalidate=True)
+            loaded += 1
+
+        _PERSIST_LOADED_COUNT += loaded
+
+    if loaded:
+        print(f"[SHEET_GUARD] {loaded} Snapshot(s) aus {DEFAULT_PERSIST_PATH} geladen (werden im Hintergrund aktualisiert).")
+
+    return loaded
+
+
+def has_warm_persisted_cache() -> bool:
+    return _PERSIST_LOADED_COUNT > 0
+
+
+def _persist_at_exit():
+    try:
+        persist_cache_snapshots()
+    except Exception as exc:
+        print(f"[SHEET_GUARD] Persistenter Cache beim Beenden nicht geschrieben: {repr(exc)}")
+
+
+atexit.register(_persist_at_exit)
+
+try:
+    load_persisted_cache()
+except Exception as _persist_exc:
+    print(f"[SHEET_GUARD] Persistenter Cache konnte nicht geladen werden: {repr(_persist_exc)}")
+
+
+# =========================================================
+# SINGLE-FLIGHT
+# =========================================================
+# Gleichzeitige Cache-Misses auf denselben Key (z. B. viele Finish-Klicks bei
+# Slot-Ende) teilen sich einen einzigen echten Google-Read. Threads warten auf
+# den laufenden Fetch, Coroutinen auf denselben Task.
+#
+# Jede Invalidierung erhöht _CACHE_GENERATION. Ein Fetch, der vor einem
+# passenden Write gestartet wurde, wird weder geteilt noch in den Cache
+# geschrieben, damit keine veralteten Daten den Write überdecken.
+
+_CACHE_GENERATION = 0
+_INVALIDATION_LOG: deque[tuple[int, str | None]] = deque(maxlen=256)
+
+
+def _invalidated_since(cache_key: str, generation: int) -> bool:
+    with _CACHE_LOCK:
+        if generation == _CACHE_GENERATION:
+            return False
+
+        if not _INVALIDATION_LOG or _INVALIDATION_LOG[0][0] > generation + 1:
+            # Log ist übergelaufen -> vorsichtshalber als invalidiert behandeln.
+            return True
+
+        for entry_generation, prefix in reversed(_INVALIDATION_LOG):
+            if entry_generation <= generation:
+                break
+            if prefix is None or cache_key.startswith(prefix):
+                return True
+
+        return False
+
+
+def _store_fetched(cache_key: str, value: Any, generation: int):
+    with _CACHE_LOCK:
+        entry = _CACHE.get(cache_key)
+
+        # Stale-Fallback aus run_sheet_call: nicht als frisch neu einlagern.
+        if entry is not None and entry.value is value:
+            return value
+
+    # Noch nicht geflushte Write-Behind-Zellen über frisch geladene Daten legen,
+    # sonst würde ein Read die eigenen ausstehenden Writes "zurückdrehen".
+    value = _overlay_pending_writes(cache_key, freeze_snapshot(value))
+
+    if _invalidated_since(cache_key, generation):
+        return value
+
+    return set_cache_value(cache_key, value)
+
+
+class _Flight:
+    __slots__ = ("event", "generation", "result", "error")
+
+    def __init__(self, generation: int):
+        self.event = threading.Event()
+        self.generation = generation
+        self.result = None
+        self.error: BaseException | None = None
+
+
+_INFLIGHT: dict[str, _Flight] = {}
+_INFLIGHT_ASYNC: dict[str, tuple[int, asyncio.Future]] = {}
+
+
+def _single_flight(cache_key: str, func: Callable[[], Any]):
+    with _CACHE_LOCK:
+        flight = _INFLIGHT.get(cache_key)
+
+        if flight is not None and not _invalidated_since(cache_key, flight.generation):
+            leader = False
+        else:
+            flight = _Flight(_CACHE_GENERATION)
+            _INFLIGHT[cache_key] = flight
+            leader = True
+
+    if not leader:
+        flight.event.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = func()
+        return flight.result
+    except BaseException as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _CACHE_LOCK:
+            if _INFLIGHT.get(cache_key) is flight:
+                _INFLIGHT.pop(cache_key, None)
+        flight.event.set()
+
+
+def _sleep_for_retry(attempt: int):
+    # Exponential Backoff mit Jitter, aber bewusst gedeckelt.
+    base = min(2 ** attempt, DEFAULT_RETRY_MAX_SLEEP_SECONDS)
+    jitter = random.uniform(0.1, 0.7)
+    time.sleep(base + jitter)
+
+
+def run_sheet_call(
+    func: Callable[[], Any],
+    *,
+    retries: int = DEFAULT_READ_RETRIES,
+    allow_stale_on_quota: bool = False,
+    stale_cache_key: str | None = None,
+    namespace: str = "",
+    quota_kind: str = "read",
+):
+    """
+    Zentraler Wrapper für echte Google-Sheets-Calls.
+
+    - drosselt per Token-Bucket, bevor Google 429 liefert
+    - fängt 429 ab
+    - setzt Cooldown für den Namespace
+    - macht Exponential Backoff
+    - kann bei 429 alte Cache-Daten zurückgeben
+
+    Auf dem Event-Loop-Thread (Sync-Helper direkt aus einer Coroutine) wird
+    weder gedrosselt noch per Backoff geschlafen: Es gibt den Stale-Snapshot
+    oder die Exception.
+    """
+    last_exc: Exception | None = None
+    on_loop = _on_event_loop_thread()
+
+    for attempt in range(retries + 1):
+        try:
+            _pace_quota(namespace, quota_kind)
+            return func()
+        except Exception as exc:
+            last_exc = exc
+
+            if not _is_quota_error(exc):
+                raise
+
+            # Selbst abgelehnt, nicht von Google: kein Cooldown.
+            if not isinstance(exc, QuotaDeferred):
+                _set_quota_cooldown(namespace=namespace)
+
+            if allow_stale_on_quota:
+                entry = _get_stale_entry(stale_cache_key)
+                if entry is not None:
+                    return entry.value
+
+            if attempt >= retries or on_loop:
+                raise
+
+            _sleep_for_retry(attempt)
+
+    if last_exc:
+        raise last_exc
+
+    raise RuntimeError("Unbekannter Fehler in run_sheet_call().")
+
+
+def _cached_read(
+    cache_key: str,
+    call: Callable[[], Any],
+    *,
+    sheet_name: str,
+    ttl_seconds: int,
+    force_refresh: bool = False,
+):
+    if not force_refresh:
+        entry = _deferred_stale_entry(cache_key)
+        if entry is not None:
+            return entry.value
+
+        hit = _lookup_cache(cache_key, *_resolve_ttls(sheet_name, ttl_seconds))
+        if hit is not None:
+            value, is_stale = hit
+            if is_stale:
+                _schedule_background_refresh(cache_key, call)
+            return value
+
+    if is_quota_cooldown_active(_cache_key_namespace(cache_key)):
+        entry = _get_stale_entry(cache_key)
+        if entry is not None:
+            return entry.value
+
+    return _single_flight(cache_key, lambda: _fetch_and_store(cache_key, call))
+
+
+def _fetch_and_store(cache_key: str, call: Callable[[], Any]):
+    generation = _CACHE_GENERATION
+    value = run_sheet_call(
+        call,
+        retries=DEFAULT_READ_RETRIES,
+        allow_stale_on_quota=True,
+        stale_cache_key=cache_key,
+        namespace=_cache_key_namespace(cache_key),
+    )
+    return _store_fetched(cache_key, value, generation)
+
+
+def get_all_records_cached(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+    force_refresh: bool = False,
+):
+    return _cached_read(
+        f"records:{sheet_name}",
+        lambda: worksheet_getter().get_all_records(),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+        force_refresh=force_refresh,
+    )
+
+
+def get_all_values_cached(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+    force_refresh: bool = False,
+):
+    return _cached_read(
+        f"values:{sheet_name}",
+        lambda: worksheet_getter().get_all_values(),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+        force_refresh=force_refresh,
+    )
+
+
+def row_values_cached(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    row: int,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+):
+    return _cached_read(
+        f"row:{sheet_name}:{row}",
+        lambda: worksheet_getter().row_values(row),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def col_values_cached(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    col: int,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+):
+    return _cached_read(
+        f"col:{sheet_name}:{col}",
+        lambda: worksheet_getter().col_values(col),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def _tab_title(sheet_name: str) -> str:
+    if sheet_namespace(sheet_name):
+        return sheet_name.split("/", 1)[1]
+    return sheet_name
+
+
+def _a1_sheet_range(sheet_name: str) -> str:
+    # Ganzes Tab; Titel wie "1.DIV" müssen in A1-Notation gequotet werden.
+    return "'" + _tab_title(sheet_name).replace("'", "''") + "'"
+
+
+def _fill_value_gaps(rows: list[list[Any]]) -> list[list[Any]]:
+    # values_batch_get kürzt leere Zellen am Zeilenende, get_all_values nicht.
+    width = max((len(row) for row in rows), default=0)
+    return [list(row) + [""] * (width - len(row)) for row in rows]
+
+
+def _fetch_values_batch(spreadsheet_getter: Callable[[], Any], sheet_names: list[str]) -> dict[str, Any]:
+    generation = _CACHE_GENERATION
+    cache_keys = {sheet_name: f"values:{sheet_name}" for sheet_name in sheet_names}
+    stale_entries = {sheet_name: _get_stale_entry(key) for sheet_name, key in cache_keys.items()}
+    has_stale = all(entry is not None for entry in stale_entries.values())
+
+    try:
+        response = run_sheet_call(
+            lambda: spreadsheet_getter().values_batch_get(
+                [_a1_sheet_range(sheet_name) for sheet_name in sheet_names]
+            ),
+            # Mit vollständigem Stale-Stand wie bei allow_stale_on_quota sofort zurückfallen.
+            retries=0 if has_stale else DEFAULT_READ_RETRIES,
+            namespace=_cache_key_namespace(cache_keys[sheet_names[0]]),
+        )
+    except Exception as exc:
+        if not has_stale or not _is_quota_error(exc):
+            raise
+        return {sheet_name: entry.value for sheet_name, entry in stale_entries.items()}
+
+    value_ranges = response.get("valueRanges") or []
+    result = {}
+
+    # valueRanges kommen in der Reihenfolge der angefragten Ranges.
+    for sheet_name, value_range in zip(sheet_names, value_ranges):
+        rows = _fill_value_gaps(value_range.get("values") or [])
+        result[sheet_name] = _store_fetched(cache_keys[sheet_name], rows, generation)
+
+    return result
+
+
+def get_all_values_batch_cached(
+    spreadsheet_getter: Callable[[], Any],
+    *,
+    sheet_names: list[str],
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+    force_refresh: bool = False,
+) -> dict[str, Any]:
+    """
+    get_all_values_cached für mehrere Tabs desselben Spreadsheets.
+
+    Die Snapshots liegen unter denselben Keys (values:<Tab>) wie bei
+    get_all_values_cached; Invalidierung, Write-Patches und Persistenz wirken
+    auf beide Wege gleich. Alle Tabs ohne nutzbaren Snapshot werden mit einem
+    einzigen values_batch_get gelesen, stale Tabs werden sofort geliefert und
+    gemeinsam im Hintergrund neu geladen.
+
+    Rückgabe: Sheet-Name -> Werte (wie get_all_values)
+    """
+    values: dict[str, Any] = {}
+    missing: list[str] = []
+    stale: list[str] = []
+
+    for sheet_name in sheet_names:
+        cache_key = f"values:{sheet_name}"
+
+        if not force_refresh:
+            entry = _deferred_stale_entry(cache_key)
+            if entry is not None:
+                values[sheet_name] = entry.value
+                continue
+
+            hit = _lookup_cache(cache_key, *_resolve_ttls(sheet_name, ttl_seconds))
+            if hit is not None:
+                values[sheet_name], is_stale = hit
+                if is_stale:
+                    stale.append(sheet_name)
+                continue
+
+        if is_quota_cooldown_active(_cache_key_namespace(cache_key)):
+            entry = _get_stale_entry(cache_key)
+            if entry is not None:
+                values[sheet_name] = entry.value
+                continue
+
+        missing.append(sheet_name)
+
+    if stale:
+        _schedule_background_refresh(
+            "batch:values:" + "|".join(stale),
+            None,
+            fetch=lambda: _fetch_values_batch(spreadsheet_getter, stale),
+        )
+
+    if missing:
+        values.update(
+            _single_flight(
+                "batch:values:" + "|".join(missing),
+                lambda: _fetch_values_batch(spreadsheet_getter, missing),
+            )
+        )
+
+    return {sheet_name: values[sheet_name] for sheet_name in sheet_names}
+
+
+def acell_cached(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    cell: str,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+):
+    return _cached_read(
+        f"cell:{sheet_name}:{cell}",
+        lambda: worksheet_getter().acell(cell).value,
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def sheet_write_call(
+    func: Callable[[], Any],
+    *,
+    invalidate_prefixes: list[str] | None = None,
+    patch_sheet: str | None = None,
+    patch_rows: dict[int, list[tuple[int, str | None, Any]]] | None = None,
+):
+    """
+    Zentraler Wrapper für Writes.
+    Ausstehende Write-Behind-Zellen der betroffenen Sheets werden vorher
+    geschrieben, damit die Reihenfolge erhalten bleibt (z. B. vor Zeilen-Löschungen).
+
+    Danach betroffene Caches invalidieren. Mit patch_sheet/patch_rows
+    ({row_index: [(Spalte, Spaltenname oder None, Wert), ...]}) werden die
+    gecachten records/values/row-Snapshots dieses Sheets stattdessen gepatcht.
+    """
+    prefixes = invalidate_prefixes or []
+
+    for sheet_name in _sheets_to_flush(prefixes, patch_sheet):
+        flush_pending_writes(sheet_name)
+
+    result = run_sheet_call(
+        func,
+        retries=DEFAULT_WRITE_RETRIES,
+        namespace=_write_namespace(prefixes, patch_sheet),
+        quota_kind="write",
+    )
+    _apply_write_to_cache(prefixes, patch_sheet, patch_rows)
+
+    return result
+
+
+def _apply_write_to_cache(
+    invalidate_prefixes: list[str],
+    patch_sheet: str | None,
+    patch_rows: dict[int, list[tuple[int, str | None, Any]]] | None,
+):
+    patched_prefixes = set()
 
-# Per Render-ENV steuerbar.
-# Ziel: weniger echte Sheet-Reads, weniger Retry-Druck bei 429, stabilere Ladezeiten.
-DEFAULT_READ_TTL_SECONDS = _env_int("SHEET_GUARD_READ_TTL_SECONDS", 90, minimum=0, maximum=3600)
-DEFAULT_WRITE_RETRIES = _env_int("SHEET_GUARD_WRITE_RETRIES", 2, minimum=0, maximum=10)
-DEFAULT_READ_RETRIES = _env_int("SHEET_GUARD_READ_RETRIES", 2, minimum=0, maximum=10)
-DEFAULT_QUOTA_COOLDOWN_SECONDS = _env_int("SHEET_GUARD_QUOTA_COOLDOWN_SECONDS", 60, minimum=5, maximum=600)
-DEFAULT_RETRY_MAX_SLEEP_SECONDS = _env_int("SHEET_GUARD_RETRY_MAX_SLEEP_SECONDS", 8, minimum=1, maximum=60)
-DEFAULT_CACHE_MAX_ENTRIES = _env_int("SHEET_GUARD_CACHE_MAX_ENTRIES", 300, minimum=50, maximum=5000)
+    if patch_sheet and patch_rows:
+        _patch_cached_sheet(patch_sheet, patch_rows)
+        patched_prefixes = set(_patchable_prefixes(patch_sheet)) | {
+            f"col:{patch_sheet}:",
+            f"cell:{patch_sheet}:",
+        }
 
+    for prefix in invalidate_prefixes:
+        if prefix not in patched_prefixes:
+            invalidate_cache(prefix)
 
-def _now() -> float:
-    return time.time()
 
+def row_cells(start_col: int, values: list[Any], column_names: list[str] | None = None) -> list[tuple[int, str | None, Any]]:
+    """
+    Baut die Zellliste für einen zusammenhängenden Zeilenbereich,
+    z. B. ws.update("D5:E5", [[a, b]]) -> row_cells(4, [a, b]).
+    """
+    cells = []
 
-def _is_quota_error(exc: Exception) -> bool:
-    text = str(exc).lower()
-    return (
-        "429" in text
-        or "quota exceeded" in text
-        or "too many requests" in text
-        or "rate limit" in text
-    )
+    for offset, value in enumerate(values):
+        column_name = column_names[offset] if column_names and offset < len(column_names) else None
+        cells.append((start_col + offset, column_name, value))
 
+    return cells
 
-def _set_quota_cooldown(seconds: int | None = None):
-    global _QUOTA_COOLDOWN_UNTIL
-    selected_seconds = seconds if seconds is not None else DEFAULT_QUOTA_COOLDOWN_SECONDS
-    _QUOTA_COOLDOWN_UNTIL = max(_QUOTA_COOLDOWN_UNTIL, _now() + selected_seconds)
 
+# =========================================================
+# WRITE-BEHIND
+# =========================================================
+# Zellupdates auf bekannte Zeilen werden pro Sheet gesammelt und nach
+# DEFAULT_WRITE_BEHIND_SECONDS als ein einziges batch_update geschrieben.
+# Die gecachten Snapshots (records/values/row) werden sofort gepatcht, damit
+# nachfolgende Reads den neuen Stand sehen. Wer Durability braucht, ruft
+# flush_pending_writes() bzw. flush_pending_writes_async() auf.
+# Fehlgeschlagene Flushes werden nie verworfen, sondern mit Backoff erneut
+# versucht. Nach DEFAULT_WRITE_BEHIND_MAX_FAILURES Fehlversuchen wird einmal
+# der über set_write_failure_handler() registrierte Handler aufgerufen.
+
+@dataclass
+class _PendingSheetWrites:
+    worksheet_getter: Callable[[], Any]
+    # (row, col) -> (Spaltenname für records-Snapshots, Wert)
+    cells: dict[tuple[int, int], tuple[str | None, Any]]
+    timer: threading.Timer | None = None
+    failures: int = 0
 
-def is_quota_cooldown_active() -> bool:
-    return _now() < _QUOTA_COOLDOWN_UNTIL
 
+_PENDING_WRITES: dict[str, _PendingSheetWrites] = {}
+# Zellen, deren batch_update gerade läuft. Bleiben bis zum Erfolg im Overlay.
+_FLUSHING_WRITES: dict[str, dict[tuple[int, int], tuple[str | None, Any]]] = {}
+_FLUSH_LOCKS: dict[str, threading.Lock] = {}
+# handler(sheet_name, Zellenzahl, Fehlversuche, Exception). Läuft im Flush-Thread.
+_WRITE_FAILURE_HANDLER: Callable[[str, int, int, BaseException], None] | None = None
 
-def seconds_until_quota_retry() -> int:
-    if not is_quota_cooldown_active():
-        return 0
-    return max(0, int(_QUOTA_COOLDOWN_UNTIL - _now()))
 
+def _rowcol_to_a1(row: int, col: int) -> str:
+    letters = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return f"{letters}{row}"
 
-def should_log_quota_warning(interval_seconds: int = 60) -> bool:
+
+def _sheet_names_for_prefixes(prefixes: list[str] | None) -> list[str]:
+    names = []
+
+    for prefix in prefixes or []:
+        if ":" not in prefix:
+            continue
+
+        sheet_name = prefix.split(":", 1)[1].rstrip(":")
+        if sheet_name and sheet_name not in names:
+            names.append(sheet_name)
+
+    return names
+
+
+def _sheets_to_flush(prefixes: list[str], patch_sheet: str | None) -> list[str]:
+    names = _sheet_names_for_prefixes(prefixes)
+
+    if patch_sheet and patch_sheet not in names:
+        names.append(patch_sheet)
+
+    return names
+
+
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _patch_records_snapshot(snapshot, row_index: int, cells: list[tuple[int, str | None, Any]]):
+    position = row_index - 2
+
+    if not isinstance(snapshot, list) or position < 0 or position >= len(snapshot):
+        return None
+
+    row = dict(snapshot[position])
+    # get_all_records liefert die Keys in Header-Reihenfolge.
+    header_names = list(row.keys())
+
+    for col, column_name, value in cells:
+        if not column_name:
+            if col < 1 or col > len(header_names):
+                return None
+            column_name = header_names[col - 1]
+
+        row[column_name] = value
+
+    rows = list(snapshot)
+    rows[position] = FrozenRow(row)
+    return FrozenList(rows)
+
+
+def _patch_value_row(snapshot_row, cells: list[tuple[int, str | None, Any]]):
+    row = list(snapshot_row or [])
+
+    for col, _, value in cells:
+        if len(row) < col:
+            row.extend([""] * (col - len(row)))
+        row[col - 1] = _cell_text(value)
+
+    return FrozenList(row)
+
+
+def _patch_values_snapshot(snapshot, row_index: int, cells: list[tuple[int, str | None, Any]]):
+    position = row_index - 1
+
+    if not isinstance(snapshot, list) or position < 0 or position >= len(snapshot):
+        return None
+
+    rows = list(snapshot)
+    rows[position] = _patch_value_row(snapshot[position], cells)
+    return FrozenList(rows)
+
+
+def _patch_snapshot_for_key(cache_key: str, sheet_name: str, snapshot, row_cells: dict[int, list]):
     """
-    Verhindert Discord-/Console-Spam.
-    Gibt nur alle X Sekunden True zurück.
+    Wendet Zellupdates (row_index -> [(col, name, value)]) auf einen Snapshot an.
+    Gibt None zurück, wenn der Snapshot nicht sicher gepatcht werden kann.
     """
-    global _LAST_QUOTA_LOG_AT
-    now = _now()
-    if now - _LAST_QUOTA_LOG_AT >= interval_seconds:
-        _LAST_QUOTA_LOG_AT = now
-        return True
-    return False
+    if cache_key == f"records:{sheet_name}":
+        for row_index, cells in row_cells.items():
+            snapshot = _patch_records_snapshot(snapshot, row_index, cells)
+            if snapshot is None:
+                return None
+        return snapshot
+
+    if cache_key == f"values:{sheet_name}":
+        for row_index, cells in row_cells.items():
+            snapshot = _patch_values_snapshot(snapshot, row_index, cells)
+            if snapshot is None:
+                return None
+        return snapshot
+
+    row_prefix = f"row:{sheet_name}:"
+    if cache_key.startswith(row_prefix):
+        try:
+            row_index = int(cache_key[len(row_prefix):])
+        except ValueError:
+            return None
 
+        if row_index not in row_cells:
+            return snapshot
 
-def invalidate_cache(key_prefix: str | None = None):
+        return _patch_value_row(snapshot, row_cells[row_index])
+
+    return None
+
+
+def _group_cells_by_row(cells: dict[tuple[int, int], tuple[str | None, Any]]) -> dict[int, list]:
+    row_cells: dict[int, list] = {}
+
+    for (row, col), (column_name, value) in sorted(cells.items()):
+        row_cells.setdefault(row, []).append((col, column_name, value))
+
+    return row_cells
+
+
+def _patchable_prefixes(sheet_name: str) -> tuple[str, str, str]:
+    return (f"records:{sheet_name}", f"values:{sheet_name}", f"row:{sheet_name}:")
+
+
+def _patch_cached_sheet(sheet_name: str, row_cells: dict[int, list]):
     """
-    key_prefix=None: alles löschen
-    key_prefix="records:Schedule": nur passende Keys löschen
+    Patcht alle gecachten Snapshots eines Sheets in-place (neue Snapshot-Objekte,
+    gleiches created_at). Nicht patchbare Keys werden gezielt verworfen.
+    """
+    prefixes = _patchable_prefixes(sheet_name)
+
+    with _CACHE_LOCK:
+        for prefix in prefixes:
+            _note_write(prefix)
+
+        for key in list(_CACHE.keys()):
+            if key.startswith(f"cell:{sheet_name}:") or key.startswith(f"col:{sheet_name}:"):
+                _CACHE.pop(key, None)
+                continue
+
+            if not (key == prefixes[0] or key == prefixes[1] or key.startswith(prefixes[2])):
+                continue
+
+            entry = _CACHE[key]
+            patched = _patch_snapshot_for_key(key, sheet_name, entry.value, row_cells)
+
+            if patched is None:
+                _CACHE.pop(key, None)
+            else:
+                _CACHE[key] = CacheEntry(created_at=entry.created_at, value=patched, revalidate=entry.revalidate)
+
+            _mark_persist_dirty(key)
+
+
+def _overlay_pending_writes(cache_key: str, snapshot):
+    with _CACHE_LOCK:
+        if not _PENDING_WRITES and not _FLUSHING_WRITES:
+            return snapshot
+
+        for sheet_name in set(_PENDING_WRITES) | set(_FLUSHING_WRITES):
+            cells = dict(_FLUSHING_WRITES.get(sheet_name, {}))
+            pending = _PENDING_WRITES.get(sheet_name)
+            if pending is not None:
+                cells.update(pending.cells)
+
+            if not cells:
+                continue
+
+            if not (
+                cache_key in (f"records:{sheet_name}", f"values:{sheet_name}")
+                or cache_key.startswith(f"row:{sheet_name}:")
+            ):
+                continue
+
+            patched = _patch_snapshot_for_key(cache_key, sheet_name, snapshot, _group_cells_by_row(cells))
+            return snapshot if patched is None else patched
+
+    return snapshot
+
+
+def queue_cell_updates(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    row_index: int,
+    cells: list[tuple[int, str | None, Any]],
+):
+    """
+    Reiht Zellupdates für eine bekannte Zeile ein.
+    cells: [(Spaltenindex 1-basiert, Spaltenname oder None, Wert), ...]
+
+    Mehrere Updates auf dieselbe Zelle innerhalb des Flush-Fensters werden
+    zusammengelegt (letzter Wert gewinnt).
     """
-    if key_prefix is None:
-        _CACHE.clear()
+    if not cells:
         return
 
-    for key in list(_CACHE.keys()):
-        if key.startswith(key_prefix):
-            _CACHE.pop(key, None)
+    if DEFAULT_WRITE_BEHIND_SECONDS <= 0:
+        requests = [
+            {"range": _rowcol_to_a1(row_index, col), "values": [[value]]}
+            for col, _, value in cells
+        ]
+        sheet_write_call(
+            lambda: worksheet_getter().batch_update(requests, value_input_option="USER_ENTERED"),
+            patch_sheet=sheet_name,
+            patch_rows={row_index: list(cells)},
+        )
+        return
 
+    with _CACHE_LOCK:
+        pending = _PENDING_WRITES.get(sheet_name)
 
-def _prune_cache_if_needed():
+        if pending is None:
+            pending = _PendingSheetWrites(worksheet_getter=worksheet_getter, cells={})
+            _PENDING_WRITES[sheet_name] = pending
+
+        pending.worksheet_getter = worksheet_getter
+
+        for col, column_name, value in cells:
+            pending.cells[(row_index, col)] = (column_name, value)
+
+        _patch_cached_sheet(sheet_name, {row_index: list(cells)})
+
+        if pending.timer is None:
+            _start_flush_timer(sheet_name, pending, DEFAULT_WRITE_BEHIND_SECONDS)
+
+
+def _start_flush_timer(sheet_name: str, pending: _PendingSheetWrites, delay_seconds: float):
+    timer = threading.Timer(delay_seconds, _flush_from_timer, args=(sheet_name,))
+    timer.daemon = True
+    pending.timer = timer
+    timer.start()
+
+
+def _flush_from_timer(sheet_name: str):
+    try:
+        flush_pending_writes(sheet_name)
+    except Exception as exc:
+        print(f"[SHEET_GUARD] Write-Behind-Flush für {sheet_name} fehlgeschlagen: {repr(exc)}")
+
+
+def _get_flush_lock(sheet_name: str) -> threading.Lock:
+    with _CACHE_LOCK:
+        lock = _FLUSH_LOCKS.get(sheet_name)
+        if lock is None:
+            lock = threading.Lock()
+            _FLUSH_LOCKS[sheet_name] = lock
+        return lock
+
+
+def has_pending_writes(sheet_name: str | None = None) -> bool:
+    with _CACHE_LOCK:
+        if sheet_name is None:
+            return bool(_PENDING_WRITES) or bool(_FLUSHING_WRITES)
+        return sheet_name in _PENDING_WRITES or sheet_name in _FLUSHING_WRITES
+
+
+def flush_pending_writes(sheet_name: str | None = None):
     """
-    Verhindert, dass der Prozess bei vielen dynamischen Keys unnötig Cache ansammelt.
-    Entfernt die ältesten Einträge, wenn das Limit überschritten wird.
+    Schreibt ausstehende Write-Behind-Zellen sofort (blockierend).
+    sheet_name=None: alle Sheets.
+    Wirft bei endgültigem Fehler die letzte Exception.
     """
-    if len(_CACHE) <= DEFAULT_CACHE_MAX_ENTRIES:
+    if sheet_name is None:
+        with _CACHE_LOCK:
+            sheet_names = list(_PENDING_WRITES.keys())
+
+        for name in sheet_names:
+            flush_pending_writes(name)
         return
 
-    overflow = len(_CACHE) - DEFAULT_CACHE_MAX_ENTRIES
-    oldest_keys = sorted(_CACHE.keys(), key=lambda key: _CACHE[key].created_at)[:overflow]
+    with _get_flush_lock(sheet_name):
+        with _CACHE_LOCK:
+            pending = _PENDING_WRITES.pop(sheet_name, None)
 
-    for key in oldest_keys:
-        _CACHE.pop(key, None)
+            if pending is None:
+                return
 
+            if pending.timer is not None:
+                pending.timer.cancel()
+                pending.timer = None
 
-def get_cache_value(key: str, ttl_seconds: int):
-    if ttl_seconds <= 0:
-        _CACHE.pop(key, None)
-        return None
+            _FLUSHING_WRITES[sheet_name] = dict(pending.cells)
 
-    entry = _CACHE.get(key)
-    if not entry:
-        return None
+        requests = [
+            {"range": _rowcol_to_a1(row, col), "values": [[value]]}
+            for (row, col), (_, value) in sorted(pending.cells.items())
+        ]
 
-    if _now() - entry.created_at > ttl_seconds:
-        _CACHE.pop(key, None)
-        return None
+        try:
+            run_sheet_call(
+                lambda: pending.worksheet_getter().batch_update(requests, value_input_option="USER_ENTERED"),
+                retries=DEFAULT_WRITE_RETRIES,
+                namespace=sheet_namespace(sheet_name),
+                quota_kind="write",
+            )
+        except Exception as exc:
+            _requeue_failed_writes(sheet_name, pending, exc)
+            raise
+        finally:
+            with _CACHE_LOCK:
+                _FLUSHING_WRITES.pop(sheet_name, None)
 
-    return deepcopy(entry.value)
+        if pending.failures >= DEFAULT_WRITE_BEHIND_MAX_FAILURES:
+            print(
+                f"[SHEET_GUARD] Write-Behind für {sheet_name} nach {pending.failures} Fehlversuchen "
+                f"geschrieben ({len(pending.cells)} Zelle(n))."
+            )
 
+        # Fetches, die vor dem Flush gestartet wurden, nicht mehr cachen.
+        for prefix in _patchable_prefixes(sheet_name):
+            _note_write(prefix)
 
-def set_cache_value(key: str, value: Any):
-    _CACHE[key] = CacheEntry(created_at=_now(), value=deepcopy(value))
-    _prune_cache_if_needed()
 
+def set_write_failure_handler(handler: Callable[[str, int, int, BaseException], None] | None):
+    """
+    Registriert den Handler für dauerhaft fehlschlagende Write-Behind-Flushes.
+    Er wird pro Fehlerserie einmal aufgerufen, aus dem Flush-Thread heraus.
+    None entfernt den Handler.
+    """
+    global _WRITE_FAILURE_HANDLER
+    _WRITE_FAILURE_HANDLER = handler
 
-def _sleep_for_retry(attempt: int):
-    # Exponential Backoff mit Jitter, aber bewusst gedeckelt.
+
+def _report_write_failure(sheet_name: str, cell_count: int, failures: int, exc: BaseException):
+    print(
+        f"[SHEET_GUARD] Write-Behind für {sheet_name} seit {failures} Fehlversuchen nicht geschrieben "
+        f"({cell_count} Zelle(n)): {repr(exc)}. Neuer Versuch läuft weiter."
+    )
+
+    handler = _WRITE_FAILURE_HANDLER
+
+    if handler is None:
+        return
+
+    try:
+        handler(sheet_name, cell_count, failures, exc)
+    except Exception as handler_exc:
+        print(f"[SHEET_GUARD] Write-Failure-Handler fehlgeschlagen: {repr(handler_exc)}")
+
+
+def _requeue_failed_writes(sheet_name: str, failed: _PendingSheetWrites, exc: BaseException):
+    # Ergebnis- und Statuszellen dürfen nicht verloren gehen: nie verwerfen,
+    # nur den Abstand bis zum nächsten Versuch vergrößern.
+    with _CACHE_LOCK:
+        failed.failures += 1
+        current = _PENDING_WRITES.get(sheet_name)
+
+        if current is None:
+            _PENDING_WRITES[sheet_name] = failed
+            current = failed
+        else:
+            # Neuere Werte derselben Zelle haben Vorrang.
+            for cell_key, cell_value in failed.cells.items():
+                current.cells.setdefault(cell_key, cell_value)
+            current.failures = max(current.failures, failed.failures)
+
+        failures = current.failures
+        cell_count = len(current.cells)
+
+        if current.timer is None:
+            delay = min(2 ** min(failures, 12), DEFAULT_WRITE_BEHIND_RETRY_MAX_SECONDS)
+            _start_flush_timer(sheet_name, current, delay)
+
+    if failures == DEFAULT_WRITE_BEHIND_MAX_FAILURES:
+        _report_write_failure(sheet_name, cell_count, failures, exc)
+
+
+def _flush_all_at_exit():
+    try:
+        flush_pending_writes()
+    except Exception as exc:
+        print(f"[SHEET_GUARD] Write-Behind beim Beenden nicht vollständig geschrieben: {repr(exc)}")
+
+
+atexit.register(_flush_all_at_exit)
+
+
+# =========================================================
+# ASYNC-API
+# =========================================================
+# Die synchronen Wrapper oben blockieren den aufrufenden Thread (inkl.
+# time.sleep beim Backoff). Aus Discord-Coroutinen heraus sollen deshalb die
+# async-Varianten genutzt werden: gspread läuft im begrenzten Sheet-Executor,
+# Backoff passiert per asyncio.sleep, der Event-Loop bleibt frei.
+
+
+def _get_executor(priority: str = PRIORITY_BACKGROUND) -> ThreadPoolExecutor:
+    global _EXECUTOR, _PRIORITY_EXECUTOR
+
+    if priority in (PRIORITY_RACE, PRIORITY_INTERACTIVE):
+        if _PRIORITY_EXECUTOR is None:
+            _PRIORITY_EXECUTOR = ThreadPoolExecutor(
+                max_workers=DEFAULT_PRIORITY_EXECUTOR_WORKERS,
+                thread_name_prefix="sheet-guard-priority",
+            )
+
+        return _PRIORITY_EXECUTOR
+
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=DEFAULT_EXECUTOR_WORKERS,
+            thread_name_prefix="sheet-guard",
+        )
+
+    return _EXECUTOR
+
+
+def shutdown_sheet_executor(wait: bool = False):
+    global _EXECUTOR, _PRIORITY_EXECUTOR
+
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=wait)
+        _EXECUTOR = None
+
+    if _PRIORITY_EXECUTOR is not None:
+        _PRIORITY_EXECUTOR.shutdown(wait=wait)
+        _PRIORITY_EXECUTOR = None
+
+
+async def run_in_sheet_executor(func: Callable[..., Any], *args, **kwargs):
+    """
+    Führt eine blockierende Funktion (gspread oder ein synchroner Sheet-Helper)
+    im begrenzten Sheet-Executor aus. race/interactive laufen in einem eigenen
+    Executor und warten nie hinter gedrosselten Hintergrund-/Admin-Jobs.
+    """
+    loop = asyncio.get_running_loop()
+    # run_in_executor übernimmt den Kontext nicht selbst (anders als
+    # asyncio.to_thread). Ohne copy_context ginge die Priorität verloren.
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _get_executor(current_sheet_priority()),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+
+
+async def _async_sleep_for_retry(attempt: int):
     base = min(2 ** attempt, DEFAULT_RETRY_MAX_SLEEP_SECONDS)
     jitter = random.uniform(0.1, 0.7)
-    time.sleep(base + jitter)
+    await asyncio.sleep(base + jitter)
 
 
-def run_sheet_call(
+async def run_sheet_call_async(
     func: Callable[[], Any],
     *,
     retries: int = DEFAULT_READ_RETRIES,
     allow_stale_on_quota: bool = False,
     stale_cache_key: str | None = None,
+    namespace: str = "",
+    quota_kind: str = "read",
 ):
     """
-    Zentraler Wrapper für echte Google-Sheets-Calls.
-
-    - Fängt 429 ab
-    - setzt globalen Cooldown
-    - macht Exponential Backoff
-    - kann bei 429 alte Cache-Daten zurückgeben
+    Async-Gegenstück zu run_sheet_call().
+    Gleiche Quota-/Cooldown-Logik, aber ohne den Event-Loop zu blockieren.
     """
     last_exc: Exception | None = None
 
     for attempt in range(retries + 1):
         try:
-            return func()
+            await _pace_quota_async(namespace, quota_kind)
+            return await run_in_sheet_executor(func)
         except Exception as exc:
             last_exc = exc
 
             if not _is_quota_error(exc):
                 raise
 
-            _set_quota_cooldown()
+            _set_quota_cooldown(namespace=namespace)
 
-            if allow_stale_on_quota and stale_cache_key:
-                entry = _CACHE.get(stale_cache_key)
+            if allow_stale_on_quota:
+                entry = _get_stale_entry(stale_cache_key)
                 if entry is not None:
-                    return deepcopy(entry.value)
+                    return entry.value
 
             if attempt >= retries:
                 raise
 
-            _sleep_for_retry(attempt)
+            await _async_sleep_for_retry(attempt)
 
     if last_exc:
         raise last_exc
 
-    raise RuntimeError("Unbekannter Fehler in run_sheet_call().")
+    raise RuntimeError("Unbekannter Fehler in run_sheet_call_async().")
 
 
-def get_all_records_cached(
-    worksheet_getter: Callable[[], Any],
+async def _cached_read_async(
+    cache_key: str,
+    call: Callable[[], Any],
     *,
     sheet_name: str,
-    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+    ttl_seconds: int,
     force_refresh: bool = False,
 ):
-    cache_key = f"records:{sheet_name}"
-
     if not force_refresh:
-        cached = get_cache_value(cache_key, ttl_seconds)
-        if cached is not None:
-            return cached
+        entry = _deferred_stale_entry(cache_key)
+        if entry is not None:
+            return entry.value
 
-    if is_quota_cooldown_active():
-        entry = _CACHE.get(cache_key)
+        hit = _lookup_cache(cache_key, *_resolve_ttls(sheet_name, ttl_seconds))
+        if hit is not None:
+            value, is_stale = hit
+            if is_stale:
+                _schedule_background_refresh(cache_key, call)
+            return value
+
+    if is_quota_cooldown_active(_cache_key_namespace(cache_key)):
+        entry = _get_stale_entry(cache_key)
         if entry is not None:
-            return deepcopy(entry.value)
+            return entry.value
 
-    def call():
-        return worksheet_getter().get_all_records()
+    inflight = _INFLIGHT_ASYNC.get(cache_key)
 
-    rows = run_sheet_call(
-        call,
+    if inflight is None or inflight[1].done() or _invalidated_since(cache_key, inflight[0]):
+        generation = _CACHE_GENERATION
+        task = asyncio.ensure_future(_fetch_and_store_async(cache_key, call, generation))
+        _INFLIGHT_ASYNC[cache_key] = (generation, task)
+
+        def _forget(done_task, key=cache_key):
+            current = _INFLIGHT_ASYNC.get(key)
+            if current is not None and current[1] is done_task:
+                _INFLIGHT_ASYNC.pop(key, None)
+
+        task.add_done_callback(_forget)
+    else:
+        task = inflight[1]
+
+    # shield: Ein abgebrochener Aufrufer darf den geteilten Fetch nicht abbrechen.
+    return await asyncio.shield(task)
+
+
+def _fetch_shared_in_thread(cache_key: str, call: Callable[[], Any], started_at: float):
+    # Hat ein paralleler synchroner Read (z. B. aus run_in_sheet_executor) den
+    # Key inzwischen frisch geladen, wird dessen Ergebnis übernommen.
+    entry = _get_stale_entry(cache_key)
+    if entry is not None and entry.created_at >= started_at:
+        return entry.value
+
+    return _single_flight(cache_key, lambda: freeze_snapshot(call()))
+
+
+async def _fetch_and_store_async(cache_key: str, call: Callable[[], Any], generation: int):
+    started_at = _now()
+    value = await run_sheet_call_async(
+        lambda: _fetch_shared_in_thread(cache_key, call, started_at),
         retries=DEFAULT_READ_RETRIES,
         allow_stale_on_quota=True,
         stale_cache_key=cache_key,
+        namespace=_cache_key_namespace(cache_key),
     )
-    set_cache_value(cache_key, rows)
-    return deepcopy(rows)
+    return _store_fetched(cache_key, value, generation)
 
 
-def get_all_values_cached(
+async def get_all_records_cached_async(
     worksheet_getter: Callable[[], Any],
     *,
     sheet_name: str,
     ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
     force_refresh: bool = False,
 ):
-    cache_key = f"values:{sheet_name}"
-
-    if not force_refresh:
-        cached = get_cache_value(cache_key, ttl_seconds)
-        if cached is not None:
-            return cached
-
-    if is_quota_cooldown_active():
-        entry = _CACHE.get(cache_key)
-        if entry is not None:
-            return deepcopy(entry.value)
+    return await _cached_read_async(
+        f"records:{sheet_name}",
+        lambda: worksheet_getter().get_all_records(),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+        force_refresh=force_refresh,
+    )
 
-    def call():
-        return worksheet_getter().get_all_values()
 
-    values = run_sheet_call(
-        call,
-        retries=DEFAULT_READ_RETRIES,
-        allow_stale_on_quota=True,
-        stale_cache_key=cache_key,
+async def get_all_values_cached_async(
+    worksheet_getter: Callable[[], Any],
+    *,
+    sheet_name: str,
+    ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
+    force_refresh: bool = False,
+):
+    return await _cached_read_async(
+        f"values:{sheet_name}",
+        lambda: worksheet_getter().get_all_values(),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+        force_refresh=force_refresh,
     )
-    set_cache_value(cache_key, values)
-    return deepcopy(values)
 
 
-def row_values_cached(
+async def row_values_cached_async(
     worksheet_getter: Callable[[], Any],
     *,
     sheet_name: str,
     row: int,
     ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
 ):
-    cache_key = f"row:{sheet_name}:{row}"
-
-    cached = get_cache_value(cache_key, ttl_seconds)
-    if cached is not None:
-        return cached
-
-    if is_quota_cooldown_active():
-        entry = _CACHE.get(cache_key)
-        if entry is not None:
-            return deepcopy(entry.value)
-
-    def call():
-        return worksheet_getter().row_values(row)
-
-    values = run_sheet_call(
-        call,
-        retries=DEFAULT_READ_RETRIES,
-        allow_stale_on_quota=True,
-        stale_cache_key=cache_key,
+    return await _cached_read_async(
+        f"row:{sheet_name}:{row}",
+        lambda: worksheet_getter().row_values(row),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
     )
-    set_cache_value(cache_key, values)
-    return deepcopy(values)
 
 
-def col_values_cached(
+async def col_values_cached_async(
     worksheet_getter: Callable[[], Any],
     *,
     sheet_name: str,
     col: int,
     ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
 ):
-    cache_key = f"col:{sheet_name}:{col}"
-
-    cached = get_cache_value(cache_key, ttl_seconds)
-    if cached is not None:
-        return cached
-
-    if is_quota_cooldown_active():
-        entry = _CACHE.get(cache_key)
-        if entry is not None:
-            return deepcopy(entry.value)
-
-    def call():
-        return worksheet_getter().col_values(col)
-
-    values = run_sheet_call(
-        call,
-        retries=DEFAULT_READ_RETRIES,
-        allow_stale_on_quota=True,
-        stale_cache_key=cache_key,
+    return await _cached_read_async(
+        f"col:{sheet_name}:{col}",
+        lambda: worksheet_getter().col_values(col),
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
     )
-    set_cache_value(cache_key, values)
-    return deepcopy(values)
 
 
-def acell_cached(
+async def acell_cached_async(
     worksheet_getter: Callable[[], Any],
     *,
     sheet_name: str,
     cell: str,
     ttl_seconds: int = DEFAULT_READ_TTL_SECONDS,
 ):
-    cache_key = f"cell:{sheet_name}:{cell}"
+    return await _cached_read_async(
+        f"cell:{sheet_name}:{cell}",
+        lambda: worksheet_getter().acell(cell).value,
+        sheet_name=sheet_name,
+        ttl_seconds=ttl_seconds,
+    )
 
-    cached = get_cache_value(cache_key, ttl_seconds)
-    if cached is not None:
-        return cached
 
-    if is_quota_cooldown_active():
-        entry = _CACHE.get(cache_key)
-        if entry is not None:
-            return deepcopy(entry.value)
+async def sheet_write_call_async(
+    func: Callable[[], Any],
+    *,
+    invalidate_prefixes: list[str] | None = None,
+    patch_sheet: str | None = None,
+    patch_rows: dict[int, list[tuple[int, str | None, Any]]] | None = None,
+):
+    """
+    Async-Gegenstück zu sheet_write_call().
+    """
+    prefixes = invalidate_prefixes or []
 
-    def call():
-        return worksheet_getter().acell(cell).value
+    for sheet_name in _sheets_to_flush(prefixes, patch_sheet):
+        await flush_pending_writes_async(sheet_name)
 
-    value = run_sheet_call(
-        call,
-        retries=DEFAULT_READ_RETRIES,
-        allow_stale_on_quota=True,
-        stale_cache_key=cache_key,
+    result = await run_sheet_call_async(
+        func,
+        retries=DEFAULT_WRITE_RETRIES,
+        namespace=_write_namespace(prefixes, patch_sheet),
+        quota_kind="write",
     )
-    set_cache_value(cache_key, value)
-    return value
+    _apply_write_to_cache(prefixes, patch_sheet, patch_rows)
+
+    return result
 
 
-def sheet_write_call(func: Callable[[], Any], *, invalidate_prefixes: list[str] | None = None):
+async def flush_pending_writes_async(sheet_name: str | None = None):
     """
-    Zentraler Wrapper für Writes.
-    Danach betroffene Caches invalidieren.
+    Async-Gegenstück zu flush_pending_writes() für Aufrufer, die auf die
+    tatsächliche Persistierung warten müssen.
     """
-    result = run_sheet_call(func, retries=DEFAULT_WRITE_RETRIES)
-
-    for prefix in invalidate_prefixes or []:
-        invalidate_cache(prefix)
+    if not has_pending_writes(sheet_name):
+        return
 
-    return result
+    await run_in_sheet_executor(flush_pending_writes, sheet_name)
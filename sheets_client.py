@@ -0,0 +1,202 @@
+# sheets_client.py
+from __future__ import annotations
+
+import os
+import threading
+
+import gspread
+from gspread.exceptions import WorksheetNotFound
+from oauth2client.service_account import ServiceAccountCredentials
+
+
+# =========================================================
+# GEMEINSAMER GSPREAD-CLIENT + WORKSHEET-REGISTRY
+# =========================================================
+# Alle Extensions teilen sich pro Credentials-Datei einen gspread-Client:
+# ein OAuth-Token-Refresher, eine Keep-Alive-HTTP-Session mit Connection-Pool.
+# Spreadsheets werden einmal geöffnet, Worksheets aus einem einzigen
+# Metadaten-Fetch (spreadsheet.worksheets()) nach Titel und gid aufgelöst.
+
+SHEETS_CLIENT_VERSION = "sheets-client-shared-v1"
+print(f"[SHEETS_CLIENT] geladen: {SHEETS_CLIENT_VERSION}")
+
+SCOPE = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+DEFAULT_CREDS_FILE = os.getenv(
+    "GOOGLE_SERVICE_ACCOUNT_FILE",
+    os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json"),
+).strip()
+
+# Größe des HTTP-Connection-Pools. Sollte mindestens der Worker-Anzahl der
+# Sheet-Executoren (SHEET_GUARD_EXECUTOR_WORKERS +
+# SHEET_GUARD_PRIORITY_EXECUTOR_WORKERS) entsprechen.
+HTTP_POOL_SIZE = max(1, int(os.getenv("SHEETS_CLIENT_HTTP_POOL_SIZE", "10").strip() or 10))
+
+_LOCK = threading.RLock()
+_CLIENTS: dict[str, gspread.Client] = {}
+_SPREADSHEETS_BY_ID: dict[str, gspread.Spreadsheet] = {}
+_SPREADSHEET_IDS_BY_TITLE: dict[str, str] = {}
+# spreadsheet_id -> {"title": {titel: ws}, "gid": {gid: ws}}
+_WORKSHEETS: dict[str, dict[str, dict]] = {}
+
+
+def _resolve_creds_file(creds_file: str | None) -> str:
+    return (creds_file or DEFAULT_CREDS_FILE or "credentials.json").strip()
+
+
+def _client_session(client):
+    """
+    gspread 5 hält die requests-Session in client.session,
+    gspread 6 in client.http_client.session.
+    """
+    session = getattr(client, "session", None)
+
+    if session is None:
+        session = getattr(getattr(client, "http_client", None), "session", None)
+
+    return session
+
+
+def _configure_http_pool(client):
+    session = _client_session(client)
+
+    if session is None:
+        return
+
+    try:
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+    except Exception as exc:
+        print(f"[SHEETS_CLIENT] HTTP-Pool konnte nicht konfiguriert werden: {repr(exc)}")
+
+
+def get_gspread_client(creds_file: str | None = None) -> gspread.Client:
+    """
+    Prozessweiter Client pro Credentials-Datei.
+    """
+    selected_file = _resolve_creds_file(creds_file)
+
+    with _LOCK:
+        client = _CLIENTS.get(selected_file)
+
+        if client is not None:
+            return client
+
+        creds = ServiceAccountCredentials.from_json_keyfile_name(selected_file, SCOPE)
+        client = gspread.authorize(creds)
+        _configure_http_pool(client)
+
+        _CLIENTS[selected_file] = client
+        return client
+
+
+def get_spreadsheet(spreadsheet_id: str, creds_file: str | None = None) -> gspread.Spreadsheet:
+    with _LOCK:
+        spreadsheet = _SPREADSHEETS_BY_ID.get(spreadsheet_id)
+
+        if spreadsheet is not None:
+            return spreadsheet
+
+        spreadsheet = get_gspread_client(creds_file).open_by_key(spreadsheet_id)
+        _SPREADSHEETS_BY_ID[spreadsheet_id] = spreadsheet
+        return spreadsheet
+
+
+def get_spreadsheet_by_title(title: str, creds_file: str | None = None) -> gspread.Spreadsheet:
+    """
+    Öffnet ein Spreadsheet per Titel (Drive-Suche) nur einmal pro Prozess.
+    """
+    with _LOCK:
+        spreadsheet_id = _SPREADSHEET_IDS_BY_TITLE.get(title)
+
+        if spreadsheet_id is not None:
+            return _SPREADSHEETS_BY_ID[spreadsheet_id]
+
+        spreadsheet = get_gspread_client(creds_file).open(title)
+        _SPREADSHEETS_BY_ID.setdefault(spreadsheet.id, spreadsheet)
+        _SPREADSHEET_IDS_BY_TITLE[title] = spreadsheet.id
+        return _SPREADSHEETS_BY_ID[spreadsheet.id]
+
+
+def _load_worksheets(spreadsheet: gspread.Spreadsheet) -> dict[str, dict]:
+    """
+    Ein Metadaten-Fetch für alle Tabs des Spreadsheets.
+    """
+    registry = {"title": {}, "gid": {}}
+
+    for ws in spreadsheet.worksheets():
+        registry["title"][ws.title] = ws
+        registry["gid"][int(ws.id)] = ws
+
+    _WORKSHEETS[spreadsheet.id] = registry
+    return registry
+
+
+def _find_worksheet(registry: dict[str, dict], title: str | None, gid: int | None):
+    if gid is not None:
+        return registry["gid"].get(int(gid))
+
+    return registry["title"].get(title)
+
+
+def get_worksheet(
+    spreadsheet: gspread.Spreadsheet | str,
+    title: str | None = None,
+    *,
+    gid: int | None = None,
+    creds_file: str | None = None,
+) -> gspread.Worksheet:
+    """
+    Löst ein Worksheet nach Titel oder gid auf.
+    Bei einem Miss wird die Tab-Liste einmal neu geladen (z. B. neu angelegtes
+    Tab), danach WorksheetNotFound wie bei spreadsheet.worksheet().
+    """
+    if title is None and gid is None:
+        raise ValueError("title oder gid erforderlich.")
+
+    if isinstance(spreadsheet, str):
+        spreadsheet = get_spreadsheet(spreadsheet, creds_file)
+
+    with _LOCK:
+        registry = _WORKSHEETS.get(spreadsheet.id)
+
+        if registry is not None:
+            ws = _find_worksheet(registry, title, gid)
+            if ws is not None:
+                return ws
+
+        ws = _find_worksheet(_load_worksheets(spreadsheet), title, gid)
+
+    if ws is None:
+        raise WorksheetNotFound(title if gid is None else f"gid={gid}")
+
+    return ws
+
+
+def register_worksheet(ws: gspread.Worksheet):
+    """
+    Nach add_worksheet() aufrufen, damit das neue Tab ohne Fetch auflösbar ist.
+    """
+    spreadsheet_id = getattr(ws, "spreadsheet_id", None) or ws.spreadsheet.id
+
+    with _LOCK:
+        registry = _WORKSHEETS.setdefault(spreadsheet_id, {"title": {}, "gid": {}})
+        registry["title"][ws.title] = ws
+        registry["gid"][int(ws.id)] = ws
+
+
+def forget_worksheets(spreadsheet_id: str | None = None):
+    """
+    Verwirft die Tab-Registry (z. B. nach Umbenennen/Löschen von Tabs).
+    """
+    with _LOCK:
+        if spreadsheet_id is None:
+            _WORKSHEETS.clear()
+        else:
+            _WORKSHEETS.pop(spreadsheet_id, None)
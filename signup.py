@@ -2,18 +2,19 @@ import os
 from typing import Optional
 
 import discord
-import gspread
 from discord import app_commands
 from discord.ext import commands
-from google.oauth2.service_account import Credentials
 
 from sheet_guard import (
     acell_cached,
     col_values_cached,
     get_all_values_cached,
     row_values_cached,
+    scoped_sheet_name,
     sheet_write_call,
+    thaw_snapshot,
 )
+from sheets_client import get_worksheet as get_shared_worksheet
 
 
 GUILD_ID = int(os.getenv("DISCORD_GUILD_ID", "0"))
@@ -29,7 +30,7 @@ ADMIN_ROLE_NAMES = {"Admin", "Orga", "TFL Admin"}
 
 SIGNUP_CACHE_TTL_SECONDS = int(os.getenv("SIGNUP_SHEET_CACHE_TTL_SECONDS", "45"))
 SIGNUP_STATUS_CACHE_TTL_SECONDS = int(os.getenv("SIGNUP_STATUS_CACHE_TTL_SECONDS", "15"))
-SIGNUP_SHEET_CACHE_NAME = "SeasonSignup"
+SIGNUP_SHEET_CACHE_NAME = scoped_sheet_name(SPREADSHEET_ID, "SeasonSignup")
 
 SIGNUP_PERFORMANCE_VERSION = "signup-performance-v1"
 print(f"[SIGNUP] geladen: {SIGNUP_PERFORMANCE_VERSION}")
@@ -50,17 +51,11 @@ def get_worksheet():
     if _WORKSHEET_CACHE is not None:
         return _WORKSHEET_CACHE
 
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    creds = Credentials.from_service_account_file(
-        GOOGLE_CREDENTIALS_FILE,
-        scopes=scopes,
+    _WORKSHEET_CACHE = get_shared_worksheet(
+        SPREADSHEET_ID,
+        gid=WORKSHEET_GID,
+        creds_file=GOOGLE_CREDENTIALS_FILE,
     )
-    client = gspread.authorize(creds)
-    sheet = client.open_by_key(SPREADSHEET_ID)
-    _WORKSHEET_CACHE = sheet.get_worksheet_by_id(WORKSHEET_GID)
     return _WORKSHEET_CACHE
 
 
@@ -184,6 +179,7 @@ def get_row_values(ws, row: int):
         row=row,
         ttl_seconds=SIGNUP_CACHE_TTL_SECONDS,
     )
+    values = thaw_snapshot(values)
 
     while len(values) < 8:
         values.append("")
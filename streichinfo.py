@@ -1,17 +1,12 @@
 import os
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 
+from division_data import get_division_snapshot
 from sheet_guard import get_all_values_cached
+from sheets_client import get_gspread_client, get_spreadsheet_by_title, get_worksheet
 
 CREDS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
 SPREADSHEET_TITLE = os.getenv("SPREADSHEET_TITLE", "Season #4 - Spielbetrieb")
 
-SCOPE = [
-    "https://spreadsheets.google.com/feeds",
-    "https://www.googleapis.com/auth/drive",
-]
-
 GC = None
 WB = None
 SHEETS_ENABLED = True
@@ -23,9 +18,8 @@ STREICHINFO_SHEET_CACHE_TTL_SECONDS = int(os.getenv("STREICHINFO_SHEET_CACHE_TTL
 _WORKSHEET_CACHE = {}
 
 try:
-    CREDS = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, SCOPE)
-    GC = gspread.authorize(CREDS)
-    WB = GC.open(SPREADSHEET_TITLE)
+    GC = get_gspread_client(CREDS_FILE)
+    WB = get_spreadsheet_by_title(SPREADSHEET_TITLE, CREDS_FILE)
 except Exception:
     SHEETS_ENABLED = False
     WB = None
@@ -58,7 +52,7 @@ def _division_worksheet(div_number: str):
     if sheet_name in _WORKSHEET_CACHE:
         return _WORKSHEET_CACHE[sheet_name]
 
-    ws = WB.worksheet(sheet_name)
+    ws = get_worksheet(WB, sheet_name)
     _WORKSHEET_CACHE[sheet_name] = ws
     return ws
 
@@ -97,8 +91,10 @@ def list_streichungen(div_number: str):
 
 
 def list_div_players(div_number: str) -> list[str]:
-    rows = _division_values(div_number)
+    return _div_players_from_rows(_division_values(div_number))
+
 
+def _div_players_from_rows(rows: list[list[str]]) -> list[str]:
     seen = set()
     players = []
 
@@ -155,19 +151,26 @@ def find_player_divisions(name_candidates: list[str]) -> list[str]:
         seen.add(norm)
         clean_candidates.append(norm)
 
-    found = []
+    # Alle Divisionen aus einem gemeinsamen Batch-Read statt sechs Einzel-Reads.
+    try:
+        snapshot = get_division_snapshot()
+    except Exception:
+        return []
 
-    for div_number in ["1", "2", "3", "4", "5", "6"]:
-        try:
-            players = list_div_players(div_number)
-        except Exception:
-            continue
+    players_by_division = snapshot.index("streichinfo_div_players", _div_player_norms_by_division)
+
+    return [
+        div_number
+        for div_number in snapshot.divisions()
+        if any(candidate in players_by_division[div_number] for candidate in clean_candidates)
+    ]
 
-        player_norms = {normalize_name(p) for p in players}
-        if any(candidate in player_norms for candidate in clean_candidates):
-            found.append(div_number)
 
-    return found
+def _div_player_norms_by_division(snapshot) -> dict[str, set[str]]:
+    return {
+        div_number: {normalize_name(p) for p in _div_players_from_rows(snapshot.rows(div_number))}
+        for div_number in snapshot.divisions()
+    }
 
 
 def get_own_division_streich_text(name_candidates: list[str]) -> str:
@@ -16,8 +16,8 @@ from __future__ import annotations
 import os
 from typing import Any
 
-import aiohttp
-
+from api_delta import fetch_remote_hashes, is_push_ok, push_dataset
+from http_client import get_http_session
 from ladder_elo import (
     SCOPE_SEASON_OVERALL,
     SCOPE_SEASON_MODE,
@@ -634,27 +634,16 @@ def build_tfnl_results_payload() -> list[dict[str, Any]]:
     return results
 
 
-async def _post_items(
-    session: aiohttp.ClientSession,
-    url: str,
-    items: list[dict[str, Any]],
-    timeout_seconds: int,
-) -> tuple[int, str]:
-    async with session.post(
-        url,
-        json={"items": items},
-        timeout=timeout_seconds,
-    ) as response:
-        text = await response.text()
-        return response.status, text[:500]
-
-
 async def publish_tfnl_rankings_to_api(
     api_base: str | None = None,
     timeout_seconds: int = 15,
+    remote_hashes: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """
     Veröffentlicht Season-Ranking, Overall-Ranking und TFNL Results an die API.
+
+    Unveränderte Datensätze werden nicht gesendet (Status 304), geänderte als
+    Delta, wenn die API den zuletzt gesendeten Stand hat.
     """
     base = _get_api_base(api_base)
     payloads = build_tfnl_ranking_payloads()
@@ -671,38 +660,51 @@ async def publish_tfnl_rankings_to_api(
         "ok": False,
     }
 
-    async with aiohttp.ClientSession() as session:
-        season_status, season_text = await _post_items(
-            session=session,
-            url=f"{base}/api/update/tfnl-season-ranking",
-            items=payloads["season"],
-            timeout_seconds=timeout_seconds,
-        )
+    session = get_http_session()
 
-        overall_status, overall_text = await _post_items(
-            session=session,
-            url=f"{base}/api/update/tfnl-overall-ranking",
-            items=payloads["overall"],
-            timeout_seconds=timeout_seconds,
-        )
+    if remote_hashes is None:
+        remote_hashes = await fetch_remote_hashes(session, base)
 
-        results_status, results_text = await _post_items(
-            session=session,
-            url=f"{base}/api/update/tfnl-results",
-            items=tfnl_results,
-            timeout_seconds=timeout_seconds,
-        )
+    season_kind, season_status, season_text = await push_dataset(
+        session,
+        base,
+        "tfnl_season_ranking",
+        payloads["season"],
+        remote_hashes,
+        timeout_seconds=timeout_seconds,
+    )
+
+    overall_kind, overall_status, overall_text = await push_dataset(
+        session,
+        base,
+        "tfnl_overall_ranking",
+        payloads["overall"],
+        remote_hashes,
+        timeout_seconds=timeout_seconds,
+    )
+
+    results_kind, results_status, results_text = await push_dataset(
+        session,
+        base,
+        "tfnl_results",
+        tfnl_results,
+        remote_hashes,
+        timeout_seconds=timeout_seconds,
+    )
 
     result["season_status"] = season_status
     result["overall_status"] = overall_status
     result["results_status"] = results_status
+    result["season_push"] = season_kind
+    result["overall_push"] = overall_kind
+    result["results_push"] = results_kind
     result["season_response"] = season_text
     result["overall_response"] = overall_text
     result["results_response"] = results_text
     result["ok"] = (
-        200 <= season_status < 300
-        and 200 <= overall_status < 300
-        and 200 <= results_status < 300
+        is_push_ok(season_status)
+        and is_push_ok(overall_status)
+        and is_push_ok(results_status)
     )
 
     return result